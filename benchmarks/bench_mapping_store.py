@@ -0,0 +1,61 @@
+"""
+매핑 저장소(meta.json / SQLite)의 시작, 한 항목 추가·삭제, 조회 시간을 항목 수에 따라 비교합니다. (user-005)
+
+    python benchmarks/bench_mapping_store.py [항목 수 ...]   (기본 10000 100000 1000000)
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from utils.mapping_store import JsonMappingStore, SqliteMappingStore  # noqa: E402
+
+SINGLE_OPS = 20  # 한 항목 추가·삭제를 반복하는 횟수 (평균을 사용)
+
+
+def info(i):
+    return {"original_path": f"/data/dir{i % 100}/file{i}.txt", "secure_path": f"dir{i % 100}/file{i}.txt",
+            "size": i, "locked_at": 1700000000.0 + i}
+
+
+def measure(store_class, path, count):
+    # 채우기는 배치 한 번 (폴더 잠금과 같은 경로)
+    store = store_class(path)
+    started = time.perf_counter()
+    store.begin_batch()
+    for i in range(count):
+        store.put(f"id{i}", info(i))
+    store.end_batch()
+    fill = time.perf_counter() - started
+    store.close()
+
+    # 프로그램 시작: 저장소를 열고 항목 하나를 찾을 때까지
+    started = time.perf_counter()
+    store = store_class(path)
+    store.find_by_secure_path(f"dir{count // 2 % 100}/file{count // 2}.txt")
+    startup = time.perf_counter() - started
+
+    # 배치 밖에서 파일 하나를 잠그고 해제 (한 항목 추가 후 삭제)
+    started = time.perf_counter()
+    for i in range(SINGLE_OPS):
+        store.put(f"single{i}", info(count + i))
+        store.delete(f"single{i}")
+    single = (time.perf_counter() - started) / SINGLE_OPS
+    store.close()
+    return fill, startup, single
+
+
+def main(counts):
+    print(f"{'entries':>10} {'store':>7} {'batch fill (s)':>15} {'startup (s)':>12} {'put+delete (ms)':>16}")
+    for count in counts:
+        with tempfile.TemporaryDirectory() as directory:
+            for name, store_class, filename in (("json", JsonMappingStore, "meta.json"),
+                                                ("sqlite", SqliteMappingStore, "meta.db")):
+                fill, startup, single = measure(store_class, os.path.join(directory, filename), count)
+                print(f"{count:>10,} {name:>7} {fill:>15.2f} {startup:>12.3f} {single * 1000:>16.2f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10000, 100000, 1000000])
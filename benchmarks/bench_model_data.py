@@ -0,0 +1,99 @@
+"""
+파일 목록 모델의 data() 호출 속도를 행 문자열 캐시 전후로 비교합니다. (user-021)
+
+before: 이전 data()처럼 칸마다 QFileInfo·QDateTime·크기 문자열을 새로 만듦
+after : FileExplorerModel.display_row()로 행마다 한 번 만든 문자열을 재사용
+
+항목이 많은 폴더를 만든 뒤 화면에 보이는 행(40행 × 날짜·종류·크기 열)을
+20행씩 내리며 끝까지 두 번 스크롤할 때의 초당 data() 호출 수를 잽니다.
+(첫 번째 스크롤은 캐시를 채우는 비용, 두 번째는 다시 그릴 때의 비용)
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/bench_model_data.py [항목 수]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from PyQt5.QtCore import Qt, QDateTime, QEventLoop, QTimer  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+from models.file_system_model import FileExplorerModel  # noqa: E402
+
+VISIBLE_ROWS = 40
+SCROLL_STEP = 20
+COLUMNS = (1, 2, 3)
+FOLDERS = 100  # 파일 사이에 섞어 둘 하위 폴더 수 (크기 열은 FolderSizeLoader 경로를 탐)
+
+
+class BaselineModel(FileExplorerModel):
+    """행 문자열 캐시가 들어가기 전의 data()"""
+    def data(self, index, role):
+        if role == Qt.DisplayRole:
+            if index.column() == 1:  # Date Modified
+                return QDateTime.fromSecsSinceEpoch(
+                    self.fileInfo(index).lastModified().toSecsSinceEpoch()
+                ).toString("yyyy-MM-dd hh:mm")
+            elif index.column() == 2:  # Type
+                if self.isDir(index):
+                    return "Folder"
+                return self.fileInfo(index).suffix().upper() + " File"
+            elif index.column() == 3:  # Size
+                if self.isDir(index):
+                    size = self.folder_sizes.request(self.filePath(index))
+                    return "" if size is None else self.format_size(size)
+                return self.format_size(self.size(index))
+        return super(FileExplorerModel, self).data(index, role)
+
+
+def make_folder(root, count):
+    for i in range(FOLDERS):
+        os.mkdir(os.path.join(root, f"folder{i:05d}"))
+    for i in range(count - FOLDERS):
+        with open(os.path.join(root, f"file{i:06d}.{('txt', 'png', 'py')[i % 3]}"), "wb") as f:
+            f.write(b"x" * (i % 4096))
+
+
+def load(model, path):
+    # 목록을 모두 읽을 때까지 이벤트 루프를 돌림
+    loop = QEventLoop()
+    model.directoryLoaded.connect(lambda loaded: loop.quit())
+    QTimer.singleShot(60000, loop.quit)
+    root = model.setRootPath(path)
+    loop.exec_()
+    while model.canFetchMore(root):
+        model.fetchMore(root)
+    return root
+
+
+def scroll(model, root):
+    rows = model.rowCount(root)
+    calls = 0
+    started = time.perf_counter()
+    for top in range(0, max(rows - VISIBLE_ROWS, 0) + 1, SCROLL_STEP):
+        for row in range(top, min(top + VISIBLE_ROWS, rows)):
+            for column in COLUMNS:
+                model.data(model.index(row, column, root), Qt.DisplayRole)
+                calls += 1
+    return calls / (time.perf_counter() - started)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    app = QApplication.instance() or QApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as path:
+        make_folder(path, count)
+        print(f"{'model':>9} {'rows':>7} {'1st scroll (calls/s)':>21} {'2nd scroll (calls/s)':>21}")
+        for name, model_class in (("before", BaselineModel), ("after", FileExplorerModel)):
+            model = model_class()
+            root = load(model, path)
+            first = scroll(model, root)
+            second = scroll(model, root)
+            print(f"{name:>9} {model.rowCount(root):>7,} {first:>21,.0f} {second:>21,.0f}")
+            model.folder_sizes.shutdown()
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+붙여넣기(복사) 속도를 작은 파일이 많은 트리와 큰 파일 트리에서 비교합니다. (user-012)
+
+before: 이전 pasteFiles처럼 shutil.copytree로 파일을 하나씩 copy2
+after : TransferJob (폴더를 먼저 만들고 작은 파일은 스레드 풀, 큰 파일은 전용 작업자)
+        workers=1은 동시 복사 없이 같은 경로를 실행한 결과 (동시 복사의 효과 확인용)
+
+동시 복사는 파일을 열고 닫는 지연이 큰 대상(네트워크 드라이브, USB 등)에서 효과가 있으므로
+측정할 폴더를 지정할 수 있습니다. (CPU가 하나이거나 메모리 위의 폴더에서는 copytree와 비슷하거나 느림)
+
+    python benchmarks/bench_transfer.py [--small 파일 수] [--large 파일 수] [--dir 작업 폴더]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from utils.transfer import TransferJob, build_items, COPY_WORKERS  # noqa: E402
+
+SMALL_FILE_SIZE = 4 * 1024
+LARGE_FILE_SIZE = 64 * 1024 * 1024
+FILES_PER_DIR = 100
+
+
+def make_tree(root, count, size):
+    # FILES_PER_DIR개씩 하위 폴더에 나눠 담은 트리 생성
+    data = os.urandom(size)
+    for i in range(count):
+        directory = os.path.join(root, f"dir{i // FILES_PER_DIR}")
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"file{i}.bin"), "wb") as f:
+            f.write(data)
+
+
+def timed(copy, source, target):
+    os.makedirs(target)
+    started = time.perf_counter()
+    copy(source, target)
+    elapsed = time.perf_counter() - started
+    shutil.rmtree(target)
+    return elapsed
+
+
+def copy_serial(source, target):
+    shutil.copytree(source, os.path.join(target, os.path.basename(source)))
+
+
+def copy_job(workers):
+    def copy(source, target):
+        items, _ = build_items([source], target)
+        job = TransferJob(items, workers=workers)
+        job.run()
+        if job.errors:
+            raise RuntimeError(job.errors)
+    return copy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--small", type=int, default=10000, help="작은 파일 수 (기본 10000)")
+    parser.add_argument("--large", type=int, default=4, help="큰 파일 수 (기본 4)")
+    parser.add_argument("--dir", default=None, help="트리를 만들고 복사할 폴더 (기본: 임시 폴더)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as work:
+        trees = (
+            ("small", args.small, SMALL_FILE_SIZE),
+            ("large", args.large, LARGE_FILE_SIZE),
+        )
+        print(f"{'tree':>6} {'files':>7} {'MB':>7} {'copytree (s)':>13} "
+              f"{'job w=1 (s)':>12} {f'job w={COPY_WORKERS} (s)':>13} {'speedup':>8}")
+        for name, count, size in trees:
+            source = os.path.join(work, name)
+            make_tree(source, count, size)
+            target = os.path.join(work, "target")
+            before = timed(copy_serial, source, target)
+            single = timed(copy_job(1), source, target)
+            after = timed(copy_job(COPY_WORKERS), source, target)
+            print(f"{name:>6} {count:>7,} {count * size / 1024 ** 2:>7.0f} {before:>13.2f} "
+                  f"{single:>12.2f} {after:>13.2f} {before / after:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+잠금 해제 시 파일 ID를 찾는 시간을 매핑 항목 수에 따라 비교합니다. (user-004)
+
+before: 이전 MappingManager.get_file_id처럼 전체 매핑을 돌며 파일 이름을 비교
+after : 보안 폴더 기준 상대 경로 인덱스(find_by_secure_path)로 바로 조회
+
+    python benchmarks/bench_unlock_lookup.py [항목 수 ...]   (기본 1000 10000 100000)
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from utils.mapping_store import JsonMappingStore, SqliteMappingStore  # noqa: E402
+
+LOOKUPS = 1000  # 항목 수마다 잠금 해제하는 파일 수
+
+
+def fill(store, count):
+    store.begin_batch()
+    for i in range(count):
+        store.put(f"id{i}", {"original_path": f"/data/dir{i % 100}/file{i}.txt", "secure_path": f"dir{i % 100}/file{i}.txt"})
+    store.end_batch()
+
+
+def linear_lookup(mapping, filename):
+    # 이전 get_file_id (항목마다 basename 비교)
+    for file_id, info in mapping.items():
+        if os.path.basename(info["original_path"]) == filename:
+            return file_id
+    return None
+
+
+def timed(func, targets):
+    started = time.perf_counter()
+    for target in targets:
+        func(target)
+    return (time.perf_counter() - started) / len(targets) * 1e6  # 조회 한 번당 마이크로초
+
+
+def main(counts):
+    print(f"{'entries':>10} {'before (us)':>12} {'json (us)':>10} {'sqlite (us)':>12}")
+    for count in counts:
+        with tempfile.TemporaryDirectory() as directory:
+            json_store = JsonMappingStore(os.path.join(directory, "meta.json"))
+            sqlite_store = SqliteMappingStore(os.path.join(directory, "meta.db"))
+            fill(json_store, count)
+            fill(sqlite_store, count)
+            # 매핑 전체에 고르게 흩어진 파일을 잠금 해제
+            picks = [i * count // LOOKUPS for i in range(LOOKUPS)]
+            before = timed(lambda i: linear_lookup(json_store.mapping, f"file{i}.txt"), picks)
+            after_json = timed(lambda i: json_store.find_by_secure_path(f"dir{i % 100}/file{i}.txt"), picks)
+            after_sqlite = timed(lambda i: sqlite_store.find_by_secure_path(f"dir{i % 100}/file{i}.txt"), picks)
+            sqlite_store.close()
+        print(f"{count:>10,} {before:>12.1f} {after_json:>10.2f} {after_sqlite:>12.2f}")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [1000, 10000, 100000])
@@ -1,13 +1,135 @@
 from PyQt5.QtWidgets import QFileSystemModel
-from PyQt5.QtCore import Qt, QDateTime, QDir
+from PyQt5.QtCore import Qt, QDir
+from collections import OrderedDict
+from utils.dir_size import FolderSizeLoader
+from utils.dir_watch import DirectoryWatcher
 import os
 
 class FileExplorerModel(QFileSystemModel):
     def __init__(self):
         super().__init__()
-        self.setRootPath("")
+        # 폴더 크기는 화면에 보일 때 백그라운드에서 계산
+        self.folder_sizes = FolderSizeLoader(parent=self)
+        self.folder_sizes.size_ready.connect(self.on_folder_size_ready)
+        # 행마다 표시할 문자열을 한 번만 만들어 두고 다시 그릴 때 재사용
+        # (키: 행의 파일 노드 id, 파일이 바뀌면 모델이 보내는 신호로 해당 행을 버림)
+        self._display_cache = {}
+        self.dataChanged.connect(self.on_rows_changed)
+        self.rowsAboutToBeRemoved.connect(self.on_rows_removed)
+        self.modelReset.connect(self._display_cache.clear)
+        # 드라이브 전체가 아니라 현재 폴더와 최근에 연 폴더만 감시
+        # (QFileSystemModel의 자체 감시는 끄고, 바뀐 폴더만 다시 읽어 달라진 항목만 반영)
+        self.setOption(QFileSystemModel.DontWatchForChanges)
+        self.watcher = DirectoryWatcher(parent=self)
+        self.watcher.changed.connect(self.on_directory_changed)
+        # 미리 읽어 두었지만 아직 열지 않은 폴더 (경로 키 -> 항목 수, 오래전에 미리 읽은 폴더가 앞)
+        self.prefetched = OrderedDict()
+        # 한도 때문에 prefetched에서 뺀 폴더 (열 때는 미리 읽은 폴더처럼 다시 읽어 반영)
+        self.prefetch_evicted = set()
         self.setFilter(QDir.AllEntries | QDir.NoDotAndDotDot)
         self._headers = ["Name", "Date Modified", "Type", "Size"]
+
+    @property
+    def watch_count(self):
+        # 변경을 감시 중인 폴더 수 (진단용)
+        return self.watcher.watch_count
+
+    def setRootPath(self, path):
+        # 다른 폴더로 이동하면 계산 중이던 폴더 크기 요청을 버리고 이동한 폴더를 감시
+        self.folder_sizes.clear()
+        index = super().setRootPath(path)
+        if path and self.rootPath():
+            self.watcher.watch(self.rootPath())
+            # 미리 읽은 목록을 바로 보여 주고, 그 사이 바뀐 내용은 다시 읽어 반영
+            key = os.path.normcase(os.path.normpath(self.rootPath()))
+            if self.prefetched.pop(key, None) is not None or key in self.prefetch_evicted:
+                self.prefetch_evicted.discard(key)
+                self.refresh()
+        return index
+
+    def is_root(self, path):
+        return bool(path) and os.path.normcase(os.path.normpath(path)) == \
+            os.path.normcase(os.path.normpath(self.rootPath()))
+
+    def prefetch(self, path, count):
+        """
+        아직 읽지 않은 폴더의 목록을 백그라운드에서 읽기 시작합니다. (이미 읽은 폴더면 False)
+
+        Args:
+            path (str): 미리 읽을 폴더 경로
+            count (int): 폴더의 항목 수 (미리 읽은 항목 수 한도 계산용)
+        """
+        index = self.index(path)
+        if not index.isValid() or not self.isDir(index) or not self.canFetchMore(index):
+            return False
+        self.fetchMore(index)
+        self.prefetched[os.path.normcase(os.path.normpath(path))] = count
+        return True
+
+    def evict_prefetched(self, limit):
+        """미리 읽은 항목 수가 limit 이하가 되도록 가장 오래전에 미리 읽은 폴더부터 한도 계산에서 뺍니다."""
+        total = sum(self.prefetched.values())
+        while self.prefetched and total > limit:
+            key, count = self.prefetched.popitem(last=False)
+            self.prefetch_evicted.add(key)
+            total -= count
+
+    def refresh(self):
+        """현재 폴더를 다시 읽어 추가·삭제·변경된 항목만 반영합니다."""
+        root = self.rootPath()
+        if not root:
+            return
+        # 루트를 잠시 옮기면 QFileSystemModel이 이전 루트를 '읽지 않음'으로 표시하므로,
+        # 다시 돌아올 때 그 폴더 하나만 새로 읽음 (빈 경로는 드라이브 목록이라 따로 읽지 않음)
+        super().setRootPath("")
+        super().setRootPath(root)
+
+    def on_directory_changed(self, path):
+        root = os.path.normcase(os.path.normpath(self.rootPath()))
+        changed = os.path.normcase(path)
+        if self.is_root(path):
+            self.refresh()
+            return
+        # 현재 폴더 아래의 최근에 연 폴더가 바뀌면 화면에 보이는 상위 폴더의 크기만 다시 계산
+        if changed.startswith(root.rstrip(os.sep) + os.sep):
+            child = os.path.join(self.rootPath(), os.path.relpath(path, self.rootPath()).split(os.sep)[0])
+            self.folder_sizes.forget(child)
+            index = self.index(child, 3)
+            if index.isValid():
+                self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def on_rows_changed(self, top_left, bottom_right, roles=()):
+        # 수정 시간·크기가 바뀐 파일은 QFileSystemModel이 dataChanged를 보내므로 해당 행 캐시를 버림
+        if not top_left.isValid():
+            self._display_cache.clear()
+            return
+        parent = top_left.parent()
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            self._display_cache.pop(self.index(row, 0, parent).internalId(), None)
+
+    def on_rows_removed(self, parent, first, last):
+        # 삭제된 노드의 id는 다른 파일에 다시 쓰일 수 있으므로 미리 버림
+        for row in range(first, last + 1):
+            self._display_cache.pop(self.index(row, 0, parent).internalId(), None)
+
+    def display_row(self, index):
+        """행의 (수정한 날짜, 종류, 파일 크기) 문자열을 반환합니다. 폴더의 크기는 None"""
+        key = index.internalId()
+        row = self._display_cache.get(key)
+        if row is None:
+            info = self.fileInfo(index)  # 모델이 들고 있는 파일 정보 (파일을 다시 읽지 않음)
+            modified = info.lastModified().toString("yyyy-MM-dd hh:mm")
+            if info.isDir():
+                row = (modified, "Folder", None)
+            else:
+                row = (modified, info.suffix().upper() + " File", self.format_size(info.size()))
+            self._display_cache[key] = row
+        return row
+
+    def on_folder_size_ready(self, path, size):
+        index = self.index(path, 3)
+        if index.isValid():
+            self.dataChanged.emit(index, index, [Qt.DisplayRole])
         
     def headerData(self, section, orientation, role):
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
@@ -15,20 +137,16 @@ class FileExplorerModel(QFileSystemModel):
         return super().headerData(section, orientation, role)
         
     def data(self, index, role):
-        if role == Qt.DisplayRole:
+        if role == Qt.DisplayRole and index.column() in (1, 2, 3):
+            modified, kind, size = self.display_row(index)
             if index.column() == 1:  # Date Modified
-                return QDateTime.fromSecsSinceEpoch(
-                    self.fileInfo(index).lastModified().toSecsSinceEpoch()
-                ).toString("yyyy-MM-dd hh:mm")
+                return modified
             elif index.column() == 2:  # Type
-                if self.isDir(index):
-                    return "Folder"
-                return self.fileInfo(index).suffix().upper() + " File"
-            elif index.column() == 3:  # Size
-                if self.isDir(index):
-                    return ""
-                size = self.size(index)
-                return self.format_size(size)
+                return kind
+            elif size is None:  # Size (폴더는 백그라운드에서 계산한 크기)
+                folder_size = self.folder_sizes.request(self.filePath(index))
+                return "" if folder_size is None else self.format_size(folder_size)
+            return size
         return super().data(index, role)
     
     def format_size(self, size):
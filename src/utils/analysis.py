@@ -3,9 +3,9 @@ from PyQt5.QtWidgets import (
     QApplication, QMessageBox, QFileDialog, QPushButton,
     QVBoxLayout, QWidget, QProgressBar, QLabel
 )
-from ctypes import cdll, c_char_p, c_int, create_string_buffer
+from ctypes import c_char_p, c_int, create_string_buffer
+from utils.native.library import load_library
 import sys
-import os
 
 # 파일 분석을 위한 Worker 스레드 정의
 class AnalyzerThread(QThread):
@@ -25,15 +25,15 @@ class AnalyzerThread(QThread):
         except Exception as e:
             self.error.emit(str(e))
 
-# C DLL을 로드하고 파일을 분석하는 함수
+# C DLL을 로드하고 파일을 분석하는 함수 (DLL 핸들과 함수 원형은 공유 레지스트리에 캐시)
 def load_analysis_dll():
-    dll_path = os.path.join(os.getcwd(), "dll", "analysis.dll")
     try:
-        analysis_dll = cdll.LoadLibrary(dll_path)
-        return analysis_dll
+        analysis_dll = load_library("analysis.dll")
     except Exception as e:
         print(f"DLL 로드 실패: {e}")
         return None
+    analysis_dll.bind("analyze_file", c_int, [c_char_p, c_char_p, c_int])
+    return analysis_dll
 
 def analyze_file(filename):
     dll = load_analysis_dll()
@@ -43,10 +43,6 @@ def analyze_file(filename):
     # 결과를 저장할 버퍼 생성
     result_buffer = create_string_buffer(2048)  # 버퍼 크기 증가
 
-    # 파일 분석 함수 호출
-    dll.analyze_file.argtypes = [c_char_p, c_char_p, c_int]
-    dll.analyze_file.restype = c_int
-
     # Python 문자열을 UTF-8로 인코딩하여 전달
     filename_bytes = filename.encode('utf-8') if sys.platform.startswith('win') else filename.encode('utf-8')
 
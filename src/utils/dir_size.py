@@ -0,0 +1,320 @@
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from PyQt5.QtCore import QObject, QCoreApplication, pyqtSignal
+import threading
+import sqlite3
+import json
+import time
+import os
+
+SIZE_WORKERS = min(8, (os.cpu_count() or 1) * 2)  # 폴더를 동시에 읽는 스레드 수
+RECHECK_AGE = 60 * 60  # 수정 시간이 같아도 이 시간(초)이 지나면 다시 계산 (폴더 수정 시간은 파일 내용 변경을 반영하지 않음)
+
+# 잠금 전 용량 확인의 탐색 한도 (넘으면 결과를 확정하지 않고 멈춤)
+LOCK_CHECK_MAX_FILES = 200000
+LOCK_CHECK_TIME_BUDGET = 2.0  # 초
+
+# SizeCheck.reason 값
+REASON_BYTES = "bytes"  # 크기 한도를 넘음
+REASON_FILES = "files"  # 파일 수 한도를 넘음
+REASON_TIME = "time"  # 시간 한도가 지남
+REASON_CANCELLED = "cancelled"  # cancel_event로 취소됨
+
+
+class SizeCheck:
+    # 한도가 있는 크기 계산 결과 (reason이 None이면 전체를 계산한 정확한 값)
+    __slots__ = ("size", "files", "reason")
+
+    def __init__(self, size, files, reason=None):
+        self.size = size  # 지금까지 계산한 크기 (멈췄으면 실제 크기의 하한)
+        self.files = files
+        self.reason = reason
+
+    @property
+    def complete(self):
+        return self.reason is None
+
+    @property
+    def exceeded(self):
+        # 크기 한도를 넘은 것이 확실한지 여부
+        return self.reason == REASON_BYTES
+
+    @property
+    def cancelled(self):
+        return self.reason == REASON_CANCELLED
+
+
+class DirSizeCache:
+    # 폴더별 (수정 시간, 바로 아래 파일 크기 합과 개수, 하위 폴더 이름 목록)을 보관하는 SQLite 캐시
+    # 폴더 수정 시간이 그대로면 다시 읽지 않고 하위 폴더만 확인
+    SCHEMA_VERSION = 2
+
+    def __init__(self, db_file):
+        self.db_file = db_file
+        self.lock = threading.Lock()
+        self.entries = {}  # path_key -> (mtime_ns, own_bytes, own_files, subdirs, checked_at)
+        self._loaded = set()  # 이미 DB에서 읽어 온 최상위 경로
+        self._dirty = {}
+
+        self.conn = sqlite3.connect(db_file, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+            self.conn.execute("DROP TABLE IF EXISTS dir_sizes")  # 이전 형식의 기록은 버리고 다시 계산
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS dir_sizes (
+                path_key TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                own_bytes INTEGER NOT NULL,
+                own_files INTEGER NOT NULL,
+                subdirs TEXT NOT NULL,
+                checked_at REAL NOT NULL
+            )
+        """)
+        self.conn.execute(f"PRAGMA user_version={self.SCHEMA_VERSION}")
+
+    @staticmethod
+    def path_key(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    def load(self, root):
+        # root 아래 폴더 기록을 한 번의 범위 조회로 메모리에 올림
+        key = self.path_key(root)
+        with self.lock:
+            if any(key == loaded or key.startswith(loaded.rstrip(os.sep) + os.sep) for loaded in self._loaded):
+                return
+            rows = self.conn.execute(
+                "SELECT path_key, mtime_ns, own_bytes, own_files, subdirs, checked_at FROM dir_sizes "
+                "WHERE path_key = ? OR (path_key > ? AND path_key < ?)",
+                (key, key.rstrip(os.sep) + os.sep, key.rstrip(os.sep) + chr(ord(os.sep) + 1)),
+            ).fetchall()
+            for path_key, mtime_ns, own_bytes, own_files, subdirs, checked_at in rows:
+                self.entries.setdefault(path_key, (mtime_ns, own_bytes, own_files, json.loads(subdirs), checked_at))
+            self._loaded.add(key)
+
+    def get(self, path, mtime_ns, now):
+        with self.lock:
+            entry = self.entries.get(self.path_key(path))
+        if entry and entry[0] == mtime_ns and now - entry[4] < RECHECK_AGE:
+            return entry[1], entry[2], entry[3]
+        return None
+
+    def put(self, path, mtime_ns, own_bytes, own_files, subdirs, now):
+        key = self.path_key(path)
+        with self.lock:
+            self.entries[key] = self._dirty[key] = (mtime_ns, own_bytes, own_files, subdirs, now)
+
+    def flush(self):
+        # 새로 계산한 기록을 한 번에 저장
+        with self.lock:
+            rows = [(key, mtime_ns, own_bytes, own_files, json.dumps(subdirs), checked_at)
+                    for key, (mtime_ns, own_bytes, own_files, subdirs, checked_at) in self._dirty.items()]
+            self._dirty = {}
+            if rows:
+                self.conn.executemany("INSERT OR REPLACE INTO dir_sizes VALUES (?, ?, ?, ?, ?, ?)", rows)
+
+    def close(self):
+        self.flush()
+        self.conn.close()
+
+
+class DirSizeService:
+    """
+    폴더 크기를 계산하는 서비스입니다.
+    하위 폴더를 여러 스레드에서 os.scandir로 읽고, 폴더 수정 시간이 같으면 캐시된 값을 사용합니다.
+    limit를 넘는 순간 탐색을 멈추므로 용량 확인에 드는 시간이 limit 크기에 비례합니다.
+    """
+    def __init__(self, cache=None, workers=SIZE_WORKERS):
+        self.cache = cache
+        self.workers = workers
+
+    def size(self, path, limit=None, cancel_event=None):
+        """
+        파일 또는 폴더 크기를 반환합니다. (심볼릭 링크는 따라가지 않음)
+
+        Args:
+            path (str): 파일 또는 폴더 경로
+            limit (int, optional): 이 크기를 넘으면 탐색을 멈추고 지금까지의 합계(> limit)를 반환
+            cancel_event (threading.Event, optional): 설정되면 탐색을 멈추고 None 반환
+
+        Raises:
+            ValueError: 경로가 파일도 폴더도 아닌 경우
+        """
+        result = self.check(path, max_bytes=limit, cancel_event=cancel_event)
+        if result.cancelled:
+            return None
+        return result.size
+
+    def exceeds(self, path, limit):
+        # 크기가 limit를 넘는지 확인 (넘는 순간 탐색 중단)
+        return self.size(path, limit) > limit
+
+    def check(self, path, max_bytes=None, max_files=None, time_budget=None, cancel_event=None):
+        """
+        한도를 두고 크기를 계산합니다. 크기나 파일 수가 한도를 넘거나 시간이 다 되면 그 즉시 멈추므로
+        아주 큰 폴더도 한도에 비례하는 시간 안에 결과를 얻습니다.
+
+        Args:
+            path (str): 파일 또는 폴더 경로
+            max_bytes (int, optional): 크기 한도 (넘으면 reason=REASON_BYTES)
+            max_files (int, optional): 파일 수 한도 (넘으면 reason=REASON_FILES)
+            time_budget (float, optional): 시간 한도(초) (지나면 reason=REASON_TIME)
+            cancel_event (threading.Event, optional): 설정되면 탐색을 멈춤 (reason=REASON_CANCELLED)
+
+        Returns:
+            SizeCheck: 계산한 크기와 파일 수, 멈춘 이유
+
+        Raises:
+            ValueError: 경로가 파일도 폴더도 아닌 경우
+        """
+        if os.path.isfile(path):
+            size = os.path.getsize(path)
+            return SizeCheck(size, 1, REASON_BYTES if max_bytes is not None and size > max_bytes else None)
+        if not os.path.isdir(path):
+            raise ValueError(f"Invalid path: {path} is neither a file nor a folder.")
+
+        deadline = time.monotonic() + time_budget if time_budget is not None else None
+        if self.cache:
+            self.cache.load(path)
+        total = files = 0
+        reason = None
+        stop = threading.Event()  # 이미 대기열에 넣은 폴더도 읽지 않도록 작업자에게 알림
+        now = time.time()
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                pending = {executor.submit(self._scan_dir, path, os.stat(path).st_mtime_ns, now, stop)}
+                while pending:
+                    done, pending = wait(pending, timeout=0.05, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        if reason is not None:
+                            break
+                        own_bytes, own_files, subdirs = future.result()
+                        total += own_bytes
+                        files += own_files
+                        if max_bytes is not None and total > max_bytes:
+                            reason = REASON_BYTES
+                        elif max_files is not None and files > max_files:
+                            reason = reason or REASON_FILES
+                        if reason is None:
+                            pending |= {executor.submit(self._scan_dir, subdir, mtime_ns, now, stop)
+                                        for subdir, mtime_ns in subdirs}
+                    if reason is None and deadline is not None and time.monotonic() > deadline and pending:
+                        reason = REASON_TIME
+                    if reason is None and cancel_event is not None and cancel_event.is_set():
+                        reason = REASON_CANCELLED
+                    if reason is not None:
+                        stop.set()
+                        for future in pending:
+                            future.cancel()
+                        break
+        finally:
+            if self.cache:
+                self.cache.flush()
+        return SizeCheck(total, files, reason)
+
+    def _scan_dir(self, path, mtime_ns, now, stop):
+        # 폴더 하나를 읽어 (바로 아래 파일 크기 합, 파일 수, [(하위 폴더, 수정 시간)]) 반환
+        if stop.is_set():
+            return 0, 0, []
+        cached = self.cache.get(path, mtime_ns, now) if self.cache else None
+        if cached:
+            own_bytes, own_files, names = cached
+            subdirs = []
+            for name in names:
+                subdir = os.path.join(path, name)
+                try:
+                    subdirs.append((subdir, os.stat(subdir, follow_symlinks=False).st_mtime_ns))
+                except OSError:
+                    continue
+            return own_bytes, own_files, subdirs
+
+        own_bytes, own_files, subdirs = 0, 0, []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        if entry.is_symlink():
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append((entry.path, st.st_mtime_ns))
+                        else:
+                            own_bytes += st.st_size
+                            own_files += 1
+                    except OSError:
+                        continue
+        except OSError:
+            return 0, 0, []  # 접근할 수 없는 폴더는 0으로 계산
+        if self.cache:
+            self.cache.put(path, mtime_ns, own_bytes, own_files,
+                           [os.path.basename(subdir) for subdir, _ in subdirs], now)
+        return own_bytes, own_files, subdirs
+
+
+_service = None
+_service_lock = threading.Lock()
+
+def get_size_service():
+    # 폴더 크기 캐시는 처음 사용할 때 한 번만 연결
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = DirSizeService(DirSizeCache(os.path.join(os.path.dirname(__file__), "setting", "dir_size.db")))
+        return _service
+
+
+class FolderSizeLoader(QObject):
+    """
+    화면에 보이는 폴더의 크기를 백그라운드에서 하나씩 계산해 알려주는 객체입니다.
+    같은 폴더는 한 번만 계산하고, clear()하면 대기 중인 요청을 버립니다.
+    """
+    size_ready = pyqtSignal(str, object)  # 폴더 경로, 크기(바이트)
+
+    def __init__(self, service=None, parent=None):
+        super().__init__(parent)
+        self.service = service or get_size_service()
+        self.sizes = {}  # 폴더 경로 -> 크기
+        self._requested = set()
+        self._cancel_event = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=1)  # 목록 표시를 방해하지 않도록 한 번에 하나씩
+        # 프로그램 종료 시 대기 중인 계산이 끝날 때까지 종료가 늦어지지 않도록 멈춤
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def request(self, path):
+        # 계산이 끝났으면 크기, 아직이면 None 반환 (계산 요청은 한 번만 보냄)
+        if path in self.sizes:
+            return self.sizes[path]
+        if path not in self._requested:
+            self._requested.add(path)
+            self._executor.submit(self._compute, path, self._cancel_event)
+        return None
+
+    def _compute(self, path, cancel_event):
+        if cancel_event.is_set():
+            return
+        try:
+            size = self.service.size(path, cancel_event=cancel_event)
+        except (OSError, ValueError):
+            return
+        if size is not None and not cancel_event.is_set():
+            self.sizes[path] = size
+            self.size_ready.emit(path, size)
+
+    def forget(self, path):
+        # 내용이 바뀐 폴더의 크기를 버림 (다음 요청 때 다시 계산)
+        self.sizes.pop(path, None)
+        self._requested.discard(path)
+
+    def clear(self):
+        # 다른 폴더로 이동할 때 호출: 대기 중이거나 계산 중인 요청 취소
+        # 폴더 내용이 바뀌었을 수 있으므로 표시했던 크기도 버림 (다시 요청하면 캐시로 빠르게 계산)
+        self._cancel_event.set()
+        self._cancel_event = threading.Event()
+        self.sizes = {}
+        self._requested = set()
+
+    def shutdown(self):
+        # 대기 중인 요청은 버리고 계산 중인 폴더 탐색은 cancel_event로 멈춤
+        self._cancel_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
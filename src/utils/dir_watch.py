@@ -0,0 +1,73 @@
+from collections import OrderedDict
+from PyQt5.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+import os
+
+WATCH_LIMIT = 16  # 동시에 감시하는 폴더 수 (현재 폴더 + 최근에 연 폴더)
+CHANGE_DELAY = 200  # 짧은 시간에 몰린 변경 알림을 한 번으로 모으는 시간(ms)
+
+
+class DirectoryWatcher(QObject):
+    """
+    현재 폴더와 최근에 연 폴더만 감시하는 객체입니다.
+    감시 폴더 수가 limit을 넘으면 가장 오래전에 연 폴더부터 감시를 멈춥니다.
+    """
+    changed = pyqtSignal(str)  # 내용이 바뀐 폴더 경로
+
+    def __init__(self, limit=WATCH_LIMIT, parent=None):
+        super().__init__(parent)
+        self.limit = limit
+        self._paths = OrderedDict()  # 감시 중인 폴더 (오래전에 연 폴더가 앞)
+        self._pending = set()
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.directoryChanged.connect(self._on_changed)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(CHANGE_DELAY)
+        self._timer.timeout.connect(self._flush)
+
+    @property
+    def watch_count(self):
+        # 실제로 감시 중인 폴더 수 (진단용)
+        return len(self._watcher.directories())
+
+    def watched(self):
+        return list(self._paths)
+
+    def watch(self, path):
+        """폴더를 감시 목록의 가장 최근 위치에 넣습니다. 감시를 시작하지 못하면 False"""
+        path = os.path.normpath(path)
+        if path in self._paths:
+            self._paths.move_to_end(path)
+            return True
+        if not self._watcher.addPath(path):
+            return False
+        self._paths[path] = None
+        while len(self._paths) > self.limit:
+            oldest, _ = self._paths.popitem(last=False)
+            self._watcher.removePath(oldest)
+        return True
+
+    def unwatch(self, path):
+        path = os.path.normpath(path)
+        if self._paths.pop(path, None) is None and path not in self._watcher.directories():
+            return
+        self._watcher.removePath(path)
+
+    def clear(self):
+        if self._paths:
+            self._watcher.removePaths(list(self._paths))
+        self._paths.clear()
+        self._pending.clear()
+
+    def _on_changed(self, path):
+        path = os.path.normpath(path)
+        if not os.path.isdir(path):
+            # 삭제되거나 이름이 바뀐 폴더는 QFileSystemWatcher가 감시를 멈추므로 목록에서도 뺌
+            self._paths.pop(path, None)
+        self._pending.add(path)
+        self._timer.start()
+
+    def _flush(self):
+        pending, self._pending = self._pending, set()
+        for path in pending:
+            self.changed.emit(path)
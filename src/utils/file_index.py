@@ -0,0 +1,347 @@
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from utils.search import SearchRecord
+import threading
+import sqlite3
+import fnmatch
+import time
+import re
+import os
+
+INDEX_WORKERS = min(8, (os.cpu_count() or 1) * 2)  # 폴더를 동시에 읽는 스레드 수
+WRITE_BATCH = 5000  # 한 트랜잭션에 기록하는 폴더 수
+SMALL_SCOPE_DIRS = 1000  # 검색 범위의 폴더 수가 이 이하면 이름 색인 대신 폴더 범위부터 검사
+REGEX_PREFIX = "regex:"  # 정규식 검색어 접두사 (Everything과 같은 형식)
+_REGEX_SPECIAL = set(".^$*+?{}[]\\|()")
+
+
+def _scope_range(key):
+    # key 폴더와 그 하위 폴더를 하나의 문자열 범위 조건으로 찾기 위한 경계값
+    prefix = key.rstrip(os.sep) + os.sep
+    return prefix, prefix[:-1] + chr(ord(os.sep) + 1)
+
+
+def _required_literal(pattern):
+    """
+    정규식이 일치하려면 반드시 포함해야 하는 가장 긴 문자열(3자 이상)을 찾습니다. (없으면 None)
+    선택(|)·그룹·문자 집합·이스케이프가 있으면 판단하지 않고 None을 반환합니다.
+    """
+    if any(char in pattern for char in "|([\\"):
+        return None
+    runs, current = [], ""
+    for char in pattern:
+        if char in _REGEX_SPECIAL:
+            if char in "*?{" and current:
+                current = current[:-1]  # 수량자가 붙은 마지막 글자는 없을 수도 있음
+            runs.append(current)
+            current = ""
+        else:
+            current += char
+    runs.append(current)
+    best = max(runs, key=len)
+    return best if len(best) >= 3 else None
+
+
+def _has_case(char):
+    return char.lower() != char.upper()
+
+
+def _longest_run(text, breaks):
+    runs, current = [], ""
+    for char in text:
+        if breaks(char):
+            runs.append(current)
+            current = ""
+        else:
+            current += char
+    runs.append(current)
+    return max(runs, key=len)
+
+
+def _like_term(literal):
+    # LIKE에 쓸 수 있는 literal의 가장 긴 부분
+    # (LIKE는 ASCII만 대소문자를 무시하므로 대소문자가 있는 비ASCII 글자와, 패턴 문자인 %, _를 뺌)
+    return _longest_run(literal, lambda char: char in "%_" or (not char.isascii() and _has_case(char)))
+
+
+def _trigram_filter(literal):
+    """
+    literal을 포함하는 이름 후보를 trigram 색인으로 고르는 조건을 만듭니다. (색인을 쓸 수 없으면 None)
+    LIKE는 ASCII만 대소문자를 무시하고 %, _가 섞이면 색인을 제대로 쓰지 못하므로 그 문자를 뺀 가장 긴 부분만 쓰고,
+    GLOB는 대소문자를 구분하므로 글자마다 [aA] 형태로 바꿔 literal 전체를 검사합니다.
+    """
+    term = _like_term(literal)
+    uncased = _longest_run(literal, lambda char: char in "*?[" or _has_case(char))
+    if len(term) < 3 and len(uncased) < 3:
+        return None
+    pattern = ""
+    for char in literal:
+        if char in "*?[":
+            pattern += f"[{char}]"
+        elif _has_case(char):
+            lower, upper = char.lower(), char.upper()
+            pattern += f"[{lower}{upper}]" if len(lower) == len(upper) == 1 else "?"
+        else:
+            pattern += char
+    if len(term) < 3:
+        return "n.name GLOB ?", [f"*{pattern}*"]
+    return "n.name LIKE ? AND n.name GLOB ?", [f"%{term}%", f"*{pattern}*"]
+
+
+def compile_query(query):
+    """
+    검색어를 (색인 조건에 쓸 문자열, 이름 검사 함수)로 변환합니다.
+    "regex:" 접두사는 정규식, * 또는 ?가 있으면 와일드카드, 그 외에는 부분 문자열 검색입니다. (대소문자 구분 없음)
+    """
+    if query.startswith(REGEX_PREFIX):
+        regex = re.compile(query[len(REGEX_PREFIX):], re.IGNORECASE)
+        return _required_literal(regex.pattern), lambda name: regex.search(name) is not None
+    if "*" in query or "?" in query:
+        regex = re.compile(fnmatch.translate(query), re.IGNORECASE)
+        literal = None if "[" in query else max(re.split(r"[*?]", query), key=len)
+        return (literal if literal and len(literal) >= 3 else None), lambda name: regex.match(name) is not None
+    lowered = query.lower()
+    return query, lambda name: lowered in name.lower()
+
+
+class FileIndex:
+    """
+    파일 이름 색인입니다. (SQLite에 폴더·항목을 저장하고 이름은 FTS5 trigram 색인으로 검색)
+    색인은 여러 스레드의 os.scandir로 만들고, 다시 만들 때는 수정 시간이 바뀐 폴더만 읽습니다.
+    """
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_file, workers=INDEX_WORKERS):
+        self.db_file = db_file
+        self.workers = workers
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_file, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS dirs (
+                id INTEGER PRIMARY KEY,
+                path_key TEXT UNIQUE NOT NULL,
+                path TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS entries (
+                id INTEGER PRIMARY KEY,
+                dir_id INTEGER NOT NULL,
+                name TEXT NOT NULL,
+                size INTEGER,
+                mtime REAL NOT NULL,
+                is_dir INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS entries_dir ON entries(dir_id);
+            CREATE TABLE IF NOT EXISTS roots (
+                path_key TEXT PRIMARY KEY,
+                indexed_at REAL NOT NULL
+            );
+        """)
+        # 이름 부분 문자열 검색용 trigram 색인 (SQLite 3.34 미만이면 이름 전체를 비교)
+        try:
+            self.conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS names USING fts5("
+                "name, content='entries', content_rowid='id', tokenize='trigram')"
+            )
+            self.trigram = True
+        except sqlite3.OperationalError:
+            self.trigram = False
+        self.conn.execute(f"PRAGMA user_version={self.SCHEMA_VERSION}")
+
+    @staticmethod
+    def path_key(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    def indexed_at(self, directory):
+        """directory를 포함하는 색인 최상위 폴더를 마지막으로 갱신한 시각 (색인되지 않았으면 None)"""
+        key = self.path_key(directory)
+        with self.lock:
+            rows = self.conn.execute("SELECT path_key, indexed_at FROM roots").fetchall()
+        times = [indexed_at for root, indexed_at in rows
+                 if key == root or key.startswith(root.rstrip(os.sep) + os.sep)]
+        return max(times) if times else None
+
+    def build(self, root, cancel_event=None):
+        """
+        root 아래 전체를 색인합니다. 이미 색인된 폴더는 수정 시간이 같으면 다시 읽지 않습니다.
+
+        Returns:
+            int: 새로 읽은 폴더 수
+        """
+        root_key = self.path_key(root)
+        low, high = _scope_range(root_key)
+        with self.lock:
+            known = {
+                path_key: (dir_id, mtime_ns)
+                for dir_id, path_key, mtime_ns in self.conn.execute(
+                    "SELECT id, path_key, mtime_ns FROM dirs WHERE path_key = ? OR (path_key > ? AND path_key < ?)",
+                    (root_key, low, high),
+                )
+            }
+
+        seen, changed, written = set(), [], 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            pending = {executor.submit(self._read_dir, root, known)}
+            while pending:
+                if cancel_event is not None and cancel_event.is_set():
+                    for future in pending:
+                        future.cancel()
+                    self._write(changed, known)  # 읽은 폴더까지는 기록 (다음 build에서 이어서 확인)
+                    return written + len(changed)
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    path, mtime_ns, entries, subdirs = future.result()
+                    if mtime_ns is None:
+                        continue
+                    seen.add(self.path_key(path))
+                    if entries is not None:
+                        changed.append((path, mtime_ns, entries))
+                    pending |= {executor.submit(self._read_dir, subdir, known) for subdir in subdirs}
+                if len(changed) >= WRITE_BATCH:
+                    self._write(changed, known)
+                    written += len(changed)
+                    changed = []
+        self._write(changed, known)
+        written += len(changed)
+        # 사라진 폴더 기록 삭제
+        removed = [known[key][0] for key in known if key not in seen]
+        with self.lock:
+            self.conn.execute("BEGIN")
+            for start in range(0, len(removed), 500):
+                chunk = removed[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                self._delete_entries(f"dir_id IN ({marks})", chunk)
+                self.conn.execute(f"DELETE FROM dirs WHERE id IN ({marks})", chunk)
+            self.conn.execute("INSERT OR REPLACE INTO roots VALUES (?, ?)", (root_key, time.time()))
+            self.conn.execute("COMMIT")
+        return written
+
+    def _read_dir(self, path, known):
+        # 폴더 하나를 읽어 (경로, 수정 시간, 항목 목록 또는 None(변경 없음), 하위 폴더 목록) 반환
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return path, None, None, []  # 사라졌거나 접근할 수 없는 폴더
+        record = known.get(self.path_key(path))
+        if record and record[1] == mtime_ns:
+            # 변경 없는 폴더: 저장된 하위 폴더만 이어서 확인
+            with self.lock:
+                names = [name for (name,) in self.conn.execute(
+                    "SELECT name FROM entries WHERE dir_id = ? AND is_dir = 1", (record[0],)
+                )]
+            return path, mtime_ns, None, [os.path.join(path, name) for name in names]
+
+        entries, subdirs = [], []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    entries.append((entry.name, None if is_dir else st.st_size, st.st_mtime, int(is_dir)))
+                    if is_dir:
+                        subdirs.append(entry.path)
+        except OSError:
+            return path, mtime_ns, [], []
+        return path, mtime_ns, entries, subdirs
+
+    def _delete_entries(self, condition, params):
+        if self.trigram:
+            self.conn.execute(
+                f"INSERT INTO names(names, rowid, name) SELECT 'delete', id, name FROM entries WHERE {condition}", params
+            )
+        self.conn.execute(f"DELETE FROM entries WHERE {condition}", params)
+
+    def _write(self, changed, known):
+        # 바뀐 폴더의 항목을 한 트랜잭션으로 교체
+        if not changed:
+            return
+        with self.lock:
+            self.conn.execute("BEGIN")
+            for path, mtime_ns, entries in changed:
+                key = self.path_key(path)
+                record = known.get(key)
+                if record:
+                    dir_id = record[0]
+                    self._delete_entries("dir_id = ?", (dir_id,))
+                    self.conn.execute("UPDATE dirs SET mtime_ns = ? WHERE id = ?", (mtime_ns, dir_id))
+                else:
+                    dir_id = self.conn.execute(
+                        "INSERT INTO dirs (path_key, path, mtime_ns) VALUES (?, ?, ?)", (key, path, mtime_ns)
+                    ).lastrowid
+                known[key] = (dir_id, mtime_ns)
+                first = self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM entries").fetchone()[0] + 1
+                self.conn.executemany(
+                    "INSERT INTO entries (dir_id, name, size, mtime, is_dir) VALUES (?, ?, ?, ?, ?)",
+                    [(dir_id, name, size, mtime, is_dir) for name, size, mtime, is_dir in entries],
+                )
+                if self.trigram and entries:
+                    self.conn.execute(
+                        "INSERT INTO names(rowid, name) SELECT id, name FROM entries WHERE id >= ?", (first,)
+                    )
+            self.conn.execute("COMMIT")
+
+    def search(self, directory, query, limit=None, cancel_event=None):
+        """
+        directory 아래에서 이름이 검색어와 일치하는 항목을 SearchRecord로 하나씩 반환합니다.
+
+        Args:
+            directory (str): 검색할 폴더 (build로 색인된 범위 안)
+            query (str): 부분 문자열, 와일드카드(* ?) 또는 "regex:" 정규식
+            limit (int, optional): 최대 결과 수
+            cancel_event (threading.Event, optional): 설정되면 다음 묶음을 읽기 전에 중단
+        """
+        literal, matches = compile_query(query)
+        key = self.path_key(directory)
+        low, high = _scope_range(key)
+
+        scope = "(d.path_key = ? OR (d.path_key > ? AND d.path_key < ?))"
+        name_filter = _trigram_filter(literal) if literal and self.trigram else None
+        if name_filter:
+            # 검색 범위의 폴더가 적으면 범위에서 시작하는 편이 색인 후보가 많을 때보다 빠름
+            with self.lock:
+                scope_dirs = self.conn.execute(
+                    f"SELECT count(*) FROM dirs d WHERE {scope}", (key, low, high)).fetchone()[0]
+            if scope_dirs <= SMALL_SCOPE_DIRS:
+                name_filter = None
+        if name_filter:
+            # trigram 색인으로 이름 후보를 먼저 좁힌 뒤 폴더 범위와 이름을 정확히 검사
+            sql = ("SELECT d.path, e.name, e.size, e.mtime, e.is_dir FROM names n "
+                   "JOIN entries e ON e.id = n.rowid JOIN dirs d ON d.id = e.dir_id "
+                   f"WHERE {name_filter[0]} AND {scope}")
+            params = name_filter[1] + [key, low, high]
+        else:
+            # 폴더 범위를 먼저 찾고 그 폴더의 항목만 검사
+            sql = ("SELECT d.path, e.name, e.size, e.mtime, e.is_dir FROM dirs d "
+                   f"JOIN entries e ON e.dir_id = d.id WHERE {scope}")
+            params = [key, low, high]
+            term = _like_term(literal) if literal else ""
+            if term:
+                sql += " AND e.name LIKE ?"
+                params.append(f"%{term}%")
+
+        count = 0
+        cursor = self.conn.cursor()
+        with self.lock:
+            cursor.execute(sql, params)
+        try:
+            while cancel_event is None or not cancel_event.is_set():
+                with self.lock:
+                    rows = cursor.fetchmany(5000)
+                if not rows:
+                    return
+                for folder, name, size, mtime, is_dir in rows:
+                    if not matches(name):
+                        continue
+                    yield SearchRecord(os.path.join(folder, name), bool(is_dir), size, mtime)
+                    count += 1
+                    if limit is not None and count >= limit:
+                        return
+        finally:
+            cursor.close()
+
+    def close(self):
+        self.conn.close()
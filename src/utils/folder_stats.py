@@ -0,0 +1,187 @@
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from PyQt5.QtCore import QObject, QCoreApplication, pyqtSignal
+import threading
+import time
+import os
+
+STATS_TIME_BUDGET = 3.0  # 하위 폴더까지 계산하는 최대 시간(초), 넘으면 그때까지의 값을 표시
+STATS_UPDATE_INTERVAL = 0.1  # 계산 중인 값을 화면에 넘겨주는 간격(초)
+STATS_CACHE_LIMIT = 256  # 결과를 보관하는 폴더 수
+STATS_CHECK_EVERY = 256  # 한 폴더 안에서도 이 항목 수마다 시간 한도와 취소 여부를 확인
+
+
+class FolderStats:
+    # 폴더 통계 (complete가 False면 시간 한도나 취소로 멈춘 중간 값)
+    __slots__ = ("files", "folders", "total_files", "total_folders", "total_size",
+                 "extensions", "newest", "oldest", "complete")
+
+    def __init__(self):
+        self.files = 0  # 바로 아래 파일 수
+        self.folders = 0  # 바로 아래 폴더 수
+        self.total_files = 0  # 하위 폴더를 포함한 파일 수
+        self.total_folders = 0
+        self.total_size = 0  # 하위 폴더를 포함한 파일 크기 합 (바이트)
+        self.extensions = {}  # 확장자(대문자) -> 파일 수
+        self.newest = None  # 가장 최근 수정 시간 (초)
+        self.oldest = None
+        self.complete = False
+
+    def copy(self):
+        stats = FolderStats()
+        for name in self.__slots__:
+            setattr(stats, name, getattr(self, name))
+        stats.extensions = dict(self.extensions)
+        return stats
+
+
+def _report(callback, stats, last_update):
+    # STATS_UPDATE_INTERVAL마다 계산 중인 값을 넘겨주고 마지막으로 넘긴 시각을 반환
+    now = time.monotonic()
+    if now - last_update < STATS_UPDATE_INTERVAL:
+        return last_update
+    callback(stats.copy())
+    return now
+
+
+def scan_folder_stats(path, max_depth=None, time_budget=None, cancel_event=None, callback=None):
+    """
+    os.scandir 한 번으로 폴더 항목의 종류·크기·수정 시간을 읽어 통계를 만듭니다.
+    (DirEntry가 이미 알고 있는 종류를 사용하므로 항목마다 따로 isfile/isdir을 호출하지 않음)
+
+    Args:
+        path (str): 폴더 경로
+        max_depth (int, optional): 내려갈 하위 폴더 깊이 (0이면 바로 아래만, None이면 끝까지)
+        time_budget (float, optional): 최대 계산 시간(초)
+        cancel_event (threading.Event, optional): 설정되면 계산 중단
+        callback (callable, optional): 계산 중인 통계(FolderStats 복사본)로 주기적으로 호출
+
+    Returns:
+        tuple[FolderStats, dict]: 통계, 읽은 폴더별 수정 시간(ns) (캐시 확인용)
+    """
+    stats = FolderStats()
+    dir_mtimes = {}
+    start = last_update = time.monotonic()
+    level, depth = [path], 0
+    stopped = False
+
+    def should_stop():
+        return (cancel_event is not None and cancel_event.is_set()) or \
+            (time_budget is not None and time.monotonic() - start > time_budget)
+
+    while level and not stopped:
+        next_level = []
+        for directory in level:
+            if should_stop():
+                stopped = True
+                break
+            try:
+                dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+                with os.scandir(directory) as it:
+                    for count, entry in enumerate(it, 1):
+                        # 항목이 아주 많은 폴더 하나에서 시간 한도를 넘기지 않도록 폴더 안에서도 확인
+                        if count % STATS_CHECK_EVERY == 0 and should_stop():
+                            stopped = True
+                            break
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stats.total_folders += 1
+                                if depth == 0:
+                                    stats.folders += 1
+                                next_level.append(entry.path)
+                                continue
+                            st = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+                        stats.total_files += 1
+                        if depth == 0:
+                            stats.files += 1
+                        stats.total_size += st.st_size
+                        ext = os.path.splitext(entry.name)[1].upper()
+                        if ext:
+                            stats.extensions[ext] = stats.extensions.get(ext, 0) + 1
+                        if stats.newest is None or st.st_mtime > stats.newest:
+                            stats.newest = st.st_mtime
+                        if stats.oldest is None or st.st_mtime < stats.oldest:
+                            stats.oldest = st.st_mtime
+                        if callback and stats.total_files % 1024 == 0:
+                            last_update = _report(callback, stats, last_update)
+            except OSError:
+                continue
+            if stopped:
+                break
+            if callback:
+                last_update = _report(callback, stats, last_update)
+        depth += 1
+        level = next_level if max_depth is None or depth <= max_depth else []
+    stats.complete = not stopped
+    return stats, dir_mtimes
+
+
+class FolderStatsLoader(QObject):
+    """
+    선택한 폴더의 통계를 백그라운드에서 계산해 계산 중인 값부터 차례로 알려주는 객체입니다.
+    새 폴더를 요청하면 이전 계산은 멈추고, 다 계산한 결과는 폴더 수정 시간이 그대로인 동안 재사용합니다.
+    """
+    stats_ready = pyqtSignal(str, object, bool)  # 폴더 경로, FolderStats, 계산이 끝났는지 여부
+
+    def __init__(self, max_depth=None, time_budget=STATS_TIME_BUDGET, parent=None):
+        super().__init__(parent)
+        self.max_depth = max_depth
+        self.time_budget = time_budget
+        self._cache = OrderedDict()  # 폴더 경로 -> (읽은 폴더별 수정 시간, FolderStats)
+        self._lock = threading.Lock()
+        self._cancel_event = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        # 프로그램 종료 시 계산 중인 통계가 종료를 늦추지 않도록 멈춤
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def request(self, path):
+        self.cancel()
+        self._executor.submit(self._compute, path, self._cancel_event)
+
+    def cancel(self):
+        self._cancel_event.set()
+        self._cancel_event = threading.Event()
+
+    def _cached(self, path):
+        # 읽었던 폴더의 수정 시간이 모두 그대로면 저장한 결과 사용
+        with self._lock:
+            cached = self._cache.get(path)
+        if cached is None:
+            return None
+        dir_mtimes, stats = cached
+        try:
+            if all(os.stat(directory).st_mtime_ns == mtime for directory, mtime in dir_mtimes.items()):
+                with self._lock:
+                    self._cache.move_to_end(path)
+                return stats
+        except OSError:
+            pass
+        return None
+
+    def _compute(self, path, cancel_event):
+        if cancel_event.is_set():
+            return
+        stats = self._cached(path)
+        if stats is None:
+            def progress(partial):
+                if not cancel_event.is_set():
+                    self.stats_ready.emit(path, partial, False)
+
+            stats, dir_mtimes = scan_folder_stats(path, self.max_depth, self.time_budget, cancel_event, progress)
+            if cancel_event.is_set():
+                return
+            if stats.complete:
+                with self._lock:
+                    self._cache[path] = (dir_mtimes, stats)
+                    while len(self._cache) > STATS_CACHE_LIMIT:
+                        self._cache.popitem(last=False)
+        self.stats_ready.emit(path, stats, True)
+
+    def shutdown(self):
+        # 대기 중인 요청은 버리고 계산 중인 탐색은 cancel_event로 멈춤
+        self._cancel_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,262 @@
+from contextlib import contextmanager
+import tempfile
+import sqlite3
+import json
+import os
+
+
+def path_key(secure_path):
+    # 보안 폴더 기준 상대 경로를 검색용 키로 정규화
+    return os.path.normcase(os.path.normpath(secure_path))
+
+
+class JsonMappingStore:
+    # 매핑 전체를 meta.json 하나에 저장하는 저장소 (배치 중 변경 내역은 저널에 기록)
+    def __init__(self, mapping_file):
+        self.mapping_file = mapping_file
+        self.journal_file = self.mapping_file + ".journal"  # 배치 진행 중 변경 내역
+        self._batch_depth = 0
+        self._journal = None
+        self.mapping = self.load_mapping()
+
+        # 역방향 검색용 보조 인덱스 (보안 폴더 기준 상대 경로 -> ID, 이전 항목은 파일 이름 -> ID 목록)
+        self._path_index = {}
+        self._name_index = {}
+        for file_id, info in self.mapping.items():
+            self._index(file_id, info)
+
+    def load_mapping(self):
+        # 메타데이터 로드
+        mapping = {}
+        if os.path.exists(self.mapping_file):
+            with open(self.mapping_file, "r") as f:
+                mapping = json.load(f)
+
+        # 배치 도중 프로세스가 종료되었다면 저널을 재적용해 매핑 복구
+        if os.path.exists(self.journal_file):
+            self._replay_journal(mapping)
+            self._write_mapping(mapping)
+            os.remove(self.journal_file)
+        return mapping
+
+    def _replay_journal(self, mapping):
+        # 저널에 기록된 변경 사항을 순서대로 적용 (마지막 줄이 잘렸으면 무시)
+        with open(self.journal_file, "r") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                if entry["op"] == "set":
+                    mapping[entry["id"]] = entry["info"]
+                elif entry["op"] == "delete":
+                    mapping.pop(entry["id"], None)
+
+    def _write_mapping(self, mapping):
+        # 임시 파일에 기록한 뒤 원자적으로 교체
+        fd, tmp_path = tempfile.mkstemp(prefix=".meta", suffix=".tmp", dir=os.path.dirname(self.mapping_file))
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(mapping, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.mapping_file)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _log(self, entry):
+        # 배치 중이면 변경 사항을 저널에 추가하고, 아니면 바로 저장
+        if self._journal is not None:
+            self._journal.write(json.dumps(entry) + "\n")
+            self._journal.flush()
+        else:
+            self.save()
+
+    def _index(self, file_id, info):
+        # 매핑 항목을 보조 인덱스에 추가
+        if info.get("secure_path"):
+            self._path_index[path_key(info["secure_path"])] = file_id
+        else:
+            name = os.path.basename(info["original_path"])
+            self._name_index.setdefault(name, []).append(file_id)
+
+    def _unindex(self, file_id, info):
+        # 매핑 항목을 보조 인덱스에서 제거
+        if info.get("secure_path"):
+            key = path_key(info["secure_path"])
+            if self._path_index.get(key) == file_id:
+                del self._path_index[key]
+        else:
+            name = os.path.basename(info["original_path"])
+            ids = self._name_index.get(name, [])
+            if file_id in ids:
+                ids.remove(file_id)
+            if not ids:
+                self._name_index.pop(name, None)
+
+    def save(self):
+        # 메타데이터 저장 (배치 중에는 커밋 시점까지 미룸)
+        if self._batch_depth == 0:
+            self._write_mapping(self.mapping)
+
+    def begin_batch(self):
+        # 이후 매핑 변경을 저널에 모았다가 end_batch에서 한 번만 저장
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self._journal = open(self.journal_file, "a")
+
+    def end_batch(self):
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self._journal.close()
+            self._journal = None
+            self._write_mapping(self.mapping)
+            os.remove(self.journal_file)
+
+    def get(self, file_id):
+        return self.mapping.get(file_id)
+
+    def put(self, file_id, info):
+        self.mapping[file_id] = info
+        self._index(file_id, info)
+        self._log({"op": "set", "id": file_id, "info": info})
+
+    def delete(self, file_id):
+        if file_id in self.mapping:
+            self._unindex(file_id, self.mapping.pop(file_id))
+            self._log({"op": "delete", "id": file_id})
+
+    def find_by_secure_path(self, secure_path):
+        return self._path_index.get(path_key(secure_path))
+
+    def find_by_name(self, name):
+        # 경로 정보가 없는 이전 항목만 파일 이름으로 검색
+        ids = self._name_index.get(name)
+        return ids[0] if ids else None
+
+    def items(self):
+        return list(self.mapping.items())
+
+    def close(self):
+        pass
+
+
+class SqliteMappingStore:
+    # 매핑을 SQLite(WAL)에 행 단위로 저장하는 저장소
+    # 변경은 행마다 바로 커밋되므로(WAL이라 비용이 작음) 배치 도중 종료되어도 처리된 파일까지는 기록이 남음
+    # (배치를 한 트랜잭션으로 묶으면 종료 시 이미 암호화한 파일의 매핑까지 되돌려져 복원할 수 없게 됨)
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_file, legacy_json=None):
+        self.db_file = db_file
+        self.conn = sqlite3.connect(db_file, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS mapping (
+                file_id TEXT PRIMARY KEY,
+                original_path TEXT NOT NULL,
+                secure_path TEXT,
+                secure_key TEXT,
+                basename TEXT NOT NULL,
+                size INTEGER,
+                locked_at REAL
+            );
+            CREATE INDEX IF NOT EXISTS idx_mapping_original_path ON mapping(original_path);
+            CREATE INDEX IF NOT EXISTS idx_mapping_secure_key ON mapping(secure_key);
+            CREATE INDEX IF NOT EXISTS idx_mapping_basename ON mapping(basename);
+            CREATE INDEX IF NOT EXISTS idx_mapping_size ON mapping(size);
+            CREATE INDEX IF NOT EXISTS idx_mapping_locked_at ON mapping(locked_at);
+        """)
+
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < self.SCHEMA_VERSION:
+            if legacy_json:
+                self.migrate_json(legacy_json)
+            self.conn.execute(f"PRAGMA user_version={self.SCHEMA_VERSION}")
+
+    def migrate_json(self, mapping_file):
+        # 기존 meta.json(및 남은 저널)을 한 번만 가져오고 원본은 .migrated로 보관
+        if not os.path.exists(mapping_file) and not os.path.exists(mapping_file + ".journal"):
+            return
+        legacy = JsonMappingStore(mapping_file)
+        rows = [self._row(file_id, info) for file_id, info in legacy.items()]
+        with self._transaction():
+            self.conn.executemany("INSERT OR REPLACE INTO mapping VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+        if rows:
+            os.replace(mapping_file, mapping_file + ".migrated")
+
+    @staticmethod
+    def _row(file_id, info):
+        secure_path = info.get("secure_path")
+        return (
+            file_id,
+            info["original_path"],
+            secure_path,
+            path_key(secure_path) if secure_path else None,
+            os.path.basename(info["original_path"]),
+            info.get("size"),
+            info.get("locked_at"),
+        )
+
+    @contextmanager
+    def _transaction(self):
+        self.conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
+
+    def begin_batch(self):
+        # 행 단위 커밋을 그대로 사용 (put이 끝나면 이미 디스크에 기록되어 있으므로 이어지는 파일 작업보다 앞섬)
+        pass
+
+    def end_batch(self):
+        pass
+
+    def save(self):
+        pass
+
+    @staticmethod
+    def _info(row):
+        info = {"original_path": row[0]}
+        for key, value in zip(("secure_path", "size", "locked_at"), row[1:]):
+            if value is not None:
+                info[key] = value
+        return info
+
+    def get(self, file_id):
+        row = self.conn.execute(
+            "SELECT original_path, secure_path, size, locked_at FROM mapping WHERE file_id = ?", (file_id,)
+        ).fetchone()
+        return self._info(row) if row else None
+
+    def put(self, file_id, info):
+        self.conn.execute("INSERT OR REPLACE INTO mapping VALUES (?, ?, ?, ?, ?, ?, ?)", self._row(file_id, info))
+
+    def delete(self, file_id):
+        self.conn.execute("DELETE FROM mapping WHERE file_id = ?", (file_id,))
+
+    def find_by_secure_path(self, secure_path):
+        row = self.conn.execute(
+            "SELECT file_id FROM mapping WHERE secure_key = ? LIMIT 1", (path_key(secure_path),)
+        ).fetchone()
+        return row[0] if row else None
+
+    def find_by_name(self, name):
+        # 경로 정보가 없는 이전 항목만 파일 이름으로 검색
+        row = self.conn.execute(
+            "SELECT file_id FROM mapping WHERE basename = ? AND secure_key IS NULL LIMIT 1", (name,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def items(self):
+        rows = self.conn.execute("SELECT file_id, original_path, secure_path, size, locked_at FROM mapping")
+        return [(row[0], self._info(row[1:])) for row in rows]
+
+    def close(self):
+        self.conn.close()
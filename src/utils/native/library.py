@@ -0,0 +1,70 @@
+from ctypes import CDLL
+import threading
+import os
+
+# dll 폴더 (src/dll)
+DLL_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "dll"))
+
+# native: 실제 DLL 사용 / python: DLL 없이 동작하는 순수 Python 대체 구현 (테스트·벤치마크 전용)
+BACKEND = os.environ.get("SAFEFILE_NATIVE_BACKEND", "native")
+
+_libraries = {}
+_lock = threading.Lock()
+
+
+class NativeLibrary:
+    # 로드된 라이브러리 핸들과 설정이 끝난 함수 원형을 함께 보관
+    def __init__(self, name, handle):
+        self.name = name
+        self.handle = handle
+        self._functions = {}
+        self._lock = threading.Lock()
+
+    def bind(self, func_name, restype, argtypes):
+        # argtypes/restype는 처음 한 번만 설정하고 이후에는 같은 함수 객체를 재사용
+        with self._lock:
+            func = self._functions.get(func_name)
+            if func is None:
+                func = getattr(self.handle, func_name)
+                func.argtypes = argtypes
+                func.restype = restype
+                self._functions[func_name] = func
+            return func
+
+    def __getattr__(self, func_name):
+        # bind로 설정한 함수만 속성으로 노출
+        functions = self.__dict__.get("_functions", {})
+        if func_name in functions:
+            return functions[func_name]
+        raise AttributeError(f"{self.name}: 원형이 설정되지 않은 함수입니다: {func_name}")
+
+
+def set_backend(backend):
+    # 라이브러리를 처음 로드하기 전에 백엔드 변경 (이미 로드된 핸들은 초기화)
+    global BACKEND
+    if backend not in ("native", "python"):
+        raise ValueError(f"알 수 없는 네이티브 백엔드: {backend}")
+    with _lock:
+        BACKEND = backend
+        _libraries.clear()
+
+
+def _open(name):
+    if BACKEND == "python":
+        from utils.native import stand_in
+        return stand_in.load(name)
+
+    dll_path = os.path.join(DLL_DIR, name)
+    if not os.path.exists(dll_path):
+        raise FileNotFoundError(f"DLL 파일을 찾을 수 없습니다: {dll_path}")
+    return CDLL(dll_path)
+
+
+def load_library(name):
+    # 라이브러리는 프로세스당 한 번만 로드 (실패한 경우 다음 호출에서 다시 시도)
+    with _lock:
+        library = _libraries.get(name)
+        if library is None:
+            library = NativeLibrary(name, _open(name))
+            _libraries[name] = library
+        return library
@@ -0,0 +1,169 @@
+"""
+DLL 대체 구현 (SAFEFILE_NATIVE_BACKEND=python)
+
+Windows DLL이 없는 환경에서 검사·암호화 경로를 실행하고 측정하기 위한 순수 Python 구현입니다.
+함수 이름과 인자/반환 규약은 각 DLL과 동일하지만 암호 강도는 보장하지 않으므로 실제 데이터에 사용하면 안 됩니다.
+"""
+from ctypes import memmove, string_at
+from types import SimpleNamespace
+import hashlib
+import struct
+import json
+import time
+import os
+
+_SALTHIDE_KEY = b"safefile-stand-in-salthide"
+
+
+def _as_bytes(value, size=None):
+    # bytes / c_char_p / ctypes 배열을 bytes로 변환
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value if size is None else value[:size])
+    if size is None:
+        return value.value
+    return string_at(value, size)
+
+
+def _write(out, data):
+    memmove(out, data, len(data))
+
+
+#################################################aes.dll
+def _round(key, i, half):
+    return int.from_bytes(hashlib.sha256(key + bytes([i]) + half.to_bytes(8, "big")).digest()[:8], "big")
+
+
+def _encrypt_block(key, block):
+    # SHA-256 라운드 함수를 사용하는 4라운드 Feistel (블록 크기 16바이트)
+    left, right = struct.unpack(">QQ", block)
+    for i in range(4):
+        left, right = right, left ^ _round(key, i, right)
+    return struct.pack(">QQ", left, right)
+
+
+def _decrypt_block(key, block):
+    left, right = struct.unpack(">QQ", block)
+    for i in reversed(range(4)):
+        left, right = right ^ _round(key, i, left), left
+    return struct.pack(">QQ", left, right)
+
+
+def _xor(a, b):
+    return (int.from_bytes(a, "big") ^ int.from_bytes(b, "big")).to_bytes(16, "big")
+
+
+def aes_cbc_encrypt(key, data, length, out):
+    # out = IV(16) + 암호문 (패딩은 호출 측에서 처리)
+    if length % 16:
+        return -1
+    key = _as_bytes(key, 32)
+    data = _as_bytes(data, length)
+    prev = os.urandom(16)
+    result = [prev]
+    for i in range(0, length, 16):
+        prev = _encrypt_block(key, _xor(data[i:i + 16], prev))
+        result.append(prev)
+    _write(out, b"".join(result))
+    return 0
+
+
+def aes_cbc_decrypt(key, data, length, out):
+    # data = IV(16) + 암호문, out에는 length - 16 바이트 기록
+    if length <= 16 or length % 16:
+        return -1
+    key = _as_bytes(key, 32)
+    data = _as_bytes(data, length)
+    result = []
+    for i in range(16, length, 16):
+        result.append(_xor(_decrypt_block(key, data[i:i + 16]), data[i - 16:i]))
+    _write(out, b"".join(result))
+    return 0
+
+
+#################################################hashing.dll
+def hash_password(password, salt, out):
+    _write(out, hashlib.sha256(_as_bytes(password) + _as_bytes(salt)).digest())
+
+
+#################################################salthide.dll
+def _keystream(iv, size):
+    blocks = (hashlib.sha256(_SALTHIDE_KEY + iv + i.to_bytes(4, "big")).digest() for i in range((size + 31) // 32))
+    return b"".join(blocks)[:size]
+
+
+def encrypt_message(message, out):
+    # out = IV(16) + 암호문, 평문 길이는 출력 버퍼 크기에서 계산
+    size = len(out) - 16
+    plain = _as_bytes(message, size)
+    iv = os.urandom(16)
+    stream = _keystream(iv, size)
+    _write(out, iv + bytes(a ^ b for a, b in zip(plain, stream)))
+    return 0
+
+
+def decrypt_message(data, out, length):
+    if length < 16:
+        return -1
+    data = _as_bytes(data, length)
+    iv, cipher = data[:16], data[16:]
+    stream = _keystream(iv, len(cipher))
+    _write(out, bytes(a ^ b for a, b in zip(cipher, stream)))
+    return 0
+
+
+#################################################vrsapi1.dll
+def scan_file_virustotal(file_path, result, result_size):
+    # VirusTotal 응답 형식을 흉내낸 결과 반환 (SAFEFILE_STAND_IN_SCAN_DELAY로 응답 지연 지정 가능)
+    path = _as_bytes(file_path).decode("utf-8")
+    sha256 = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                sha256.update(block)
+        digest = sha256.hexdigest()
+    except OSError:
+        message = "파일 해시 계산 실패"
+        ok = False
+    else:
+        delay = float(os.environ.get("SAFEFILE_STAND_IN_SCAN_DELAY", "0"))
+        if delay:
+            time.sleep(delay)
+        message = json.dumps({"data": {"id": digest, "attributes": {"last_analysis_stats": {
+            "malicious": 0, "suspicious": 0, "undetected": 70, "harmless": 0}}}})
+        ok = True
+    encoded = message.encode("utf-8")[:result_size - 1] + b"\0"
+    _write(result, encoded)
+    return ok
+
+
+#################################################analysis.dll
+def analyze_file(filename, result, result_size):
+    path = _as_bytes(filename).decode("utf-8")
+    if not os.path.isfile(path):
+        message, ok = "파일 열기 실패", 0
+    else:
+        message, ok = (
+            f"분석 완료: {path}\n시그니처 검사: 일치\n숨겨진 파일: 0개\n숨겨진 파일 목록: 없음\n이중 확장자: 없음"
+        ), 1
+    encoded = message.encode("utf-8")[:result_size - 1] + b"\0"
+    _write(result, encoded)
+    return ok
+
+
+_LIBRARIES = {
+    "aes.dll": (aes_cbc_encrypt, aes_cbc_decrypt),
+    "hashing.dll": (hash_password,),
+    "salthide.dll": (encrypt_message, decrypt_message),
+    "vrsapi1.dll": (scan_file_virustotal,),
+    "analysis.dll": (analyze_file,),
+}
+
+
+def load(name):
+    # 라이브러리마다 새 함수 객체를 만들어 argtypes/restype 설정이 서로 섞이지 않게 함
+    if name not in _LIBRARIES:
+        raise FileNotFoundError(f"대체 구현이 없는 라이브러리입니다: {name}")
+    functions = {}
+    for func in _LIBRARIES[name]:
+        functions[func.__name__] = lambda *args, _func=func: _func(*args)
+    return SimpleNamespace(**functions)
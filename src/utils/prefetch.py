@@ -0,0 +1,138 @@
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+from PyQt5.QtCore import QObject, QCoreApplication, QTimer, pyqtSignal
+import threading
+import os
+
+PREFETCH_INTERVAL = 250  # 폴더 하나를 미리 읽은 뒤 다음 폴더까지 쉬는 시간(ms), 디스크·네트워크 부담 제한
+PREFETCH_MAX_ENTRIES = 100000  # 미리 읽어 두고 아직 열지 않은 항목 수 한도 (넘으면 가장 오래전에 미리 읽은 폴더부터 뺌)
+PREFETCH_DIR_LIMIT = 20000  # 항목이 이보다 많은 폴더는 미리 읽지 않음
+PREFETCH_QUEUE_LIMIT = 32  # 대기열 길이 (넘으면 우선순위가 낮은 요청부터 버림)
+FOREGROUND_WAIT = 1000  # 폴더를 이동한 뒤 현재 폴더를 다 읽을 때까지 미리 읽기를 멈추는 최대 시간(ms)
+
+
+class DirectoryPrefetcher(QObject):
+    """
+    곧 열 가능성이 높은 폴더(즐겨찾기, 방문 기록의 앞뒤, 마우스를 올린 폴더)의 목록을
+    백그라운드에서 하나씩 미리 읽어 모델에 채워 두는 객체입니다.
+    현재 폴더를 읽는 동안에는 멈추고, 폴더 사이에는 PREFETCH_INTERVAL만큼 쉽니다.
+    """
+    _scanned = pyqtSignal(str, int)  # 폴더 경로, 항목 수 (-1이면 읽지 못함)
+
+    def __init__(self, model, parent=None):
+        super().__init__(parent)
+        self.model = model
+        self._queue = deque()
+        self._running = None  # 지금 읽고 있는 폴더
+        self._paused = False
+        self._cancel_event = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=1)  # 한 번에 한 폴더만
+        self._scanned.connect(self._on_scanned)
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(PREFETCH_INTERVAL)
+        self._timer.timeout.connect(self._start_next)
+        self._resume_timer = QTimer(self)
+        self._resume_timer.setSingleShot(True)
+        self._resume_timer.setInterval(FOREGROUND_WAIT)
+        self._resume_timer.timeout.connect(self._resume)
+
+        model.rootPathChanged.connect(self._on_navigate)
+        model.directoryLoaded.connect(self._on_directory_loaded)
+        # 프로그램 종료 시 대기 중인 미리 읽기가 종료를 늦추지 않도록 멈춤
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def request(self, paths, urgent=False):
+        """
+        폴더들을 미리 읽기 대기열에 넣습니다.
+
+        Args:
+            paths (list[str]): 미리 읽을 폴더 경로
+            urgent (bool): True면 대기열 맨 앞에 넣음 (마우스를 올린 폴더 등)
+        """
+        for path in (reversed(paths) if urgent else paths):
+            if not path:
+                continue
+            path = os.path.normpath(path)
+            if path == self._running:
+                continue
+            if path in self._queue:
+                if not urgent:
+                    continue
+                self._queue.remove(path)
+            if urgent:
+                self._queue.appendleft(path)
+            else:
+                self._queue.append(path)
+        while len(self._queue) > PREFETCH_QUEUE_LIMIT:
+            self._queue.pop()
+        self._schedule()
+
+    def _schedule(self):
+        if not self._paused and self._running is None and self._queue and not self._timer.isActive():
+            self._timer.start()
+
+    def _start_next(self):
+        if self._paused or self._running is not None or self._cancel_event.is_set():  # 종료 후에는 읽지 않음
+            return
+        while self._queue:
+            path = self._queue.popleft()
+            key = os.path.normcase(path)
+            if self.model.is_root(path) or key in self.model.prefetched or key in self.model.prefetch_evicted:
+                continue
+            self._running = path
+            self._executor.submit(self._scan, path, self._cancel_event)
+            return
+
+    def _scan(self, path, cancel_event):
+        # 폴더 목록과 각 항목의 정보를 한 번 읽어 둠 (이어서 모델이 읽을 때 OS 캐시를 사용)
+        count = 0
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if cancel_event.is_set():
+                        break
+                    try:
+                        entry.stat(follow_symlinks=False)
+                    except OSError:
+                        pass
+                    count += 1
+                    if count > PREFETCH_DIR_LIMIT:
+                        break
+        except OSError:
+            count = -1
+        if not cancel_event.is_set():
+            self._scanned.emit(path, count)
+
+    def _on_scanned(self, path, count):
+        self._running = None
+        if 0 <= count <= PREFETCH_DIR_LIMIT:
+            # 한도를 넘으면 멈추지 않고 가장 오래전에 미리 읽은 폴더부터 빼서 자리를 만듦
+            self.model.evict_prefetched(PREFETCH_MAX_ENTRIES - count)
+            self.model.prefetch(path, count)
+        self._schedule()
+
+    def _on_navigate(self, path):
+        # 사용자가 연 폴더를 먼저 읽도록 잠시 멈춤
+        self._paused = True
+        self._resume_timer.start()
+
+    def _on_directory_loaded(self, path):
+        if self._paused and self.model.is_root(path):
+            self._resume()
+
+    def _resume(self):
+        self._resume_timer.stop()
+        self._paused = False
+        self._schedule()
+
+    def shutdown(self):
+        # 대기열과 실행 대기 중인 작업은 버리고 읽는 중인 폴더는 cancel_event로 멈춤
+        self._cancel_event.set()
+        self._queue.clear()
+        self._timer.stop()
+        self._resume_timer.stop()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,169 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import hashlib
+import sqlite3
+import json
+import re
+import time
+import os
+
+DAY = 24 * 60 * 60
+
+# 판정 종류별 캐시 유지 시간 (초)
+VERDICT_TTL = {
+    "clean": 7 * DAY,
+    "suspicious": 1 * DAY,
+    "malicious": 30 * DAY,
+    "unknown": 1 * DAY,
+}
+
+
+def file_sha256(file_path):
+    sha256 = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def analysis_stats(raw_result):
+    # VirusTotal 응답에서 last_analysis_stats 추출 (DLL 버퍼 크기 때문에 JSON이 잘려 있을 수 있어 부분만 파싱)
+    match = re.search(r'"last_analysis_stats"\s*:\s*(\{[^{}]*\})', raw_result)
+    if not match:
+        return None
+    try:
+        return {key: value for key, value in json.loads(match.group(1)).items() if isinstance(value, int)}
+    except ValueError:
+        return None
+
+
+def classify(raw_result):
+    # VirusTotal 응답의 last_analysis_stats로 판정 종류 결정
+    stats = analysis_stats(raw_result)
+    if stats is None:
+        return "unknown"
+    if stats.get("malicious", 0) > 0:
+        return "malicious"
+    if stats.get("suspicious", 0) > 0:
+        return "suspicious"
+    return "clean"
+
+
+class VerdictCache:
+    # 파일 내용(SHA-256)을 키로 검사 결과를 보관하는 SQLite 캐시
+    # 경로별 크기+수정 시간이 그대로면 해시를 다시 계산하지 않음
+    SCHEMA_VERSION = 1
+    BATCH_SIZE = 500  # IN (...) 한 번에 조회할 해시 수
+
+    def __init__(self, db_file, ttl=None, verify_stat=True, hash_workers=4):
+        self.db_file = db_file
+        self.ttl = dict(VERDICT_TTL, **(ttl or {}))
+        self.verify_stat = verify_stat
+        self.hash_workers = hash_workers
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+        self.conn = sqlite3.connect(db_file, isolation_level=None, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS verdicts (
+                sha256 TEXT PRIMARY KEY,
+                verdict TEXT NOT NULL,
+                raw_result TEXT NOT NULL,
+                scanned_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS file_hashes (
+                path_key TEXT PRIMARY KEY,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                sha256 TEXT NOT NULL
+            );
+        """)
+        self.conn.execute(f"PRAGMA user_version={self.SCHEMA_VERSION}")
+
+    @staticmethod
+    def _path_key(file_path):
+        return os.path.normcase(os.path.abspath(file_path))
+
+    def _digest(self, file_path):
+        # 크기와 수정 시간이 기록과 같으면 저장된 해시 사용, 아니면 새로 계산해 기록
+        st = os.stat(file_path)
+        key = self._path_key(file_path)
+        if self.verify_stat:
+            with self.lock:
+                row = self.conn.execute(
+                    "SELECT size, mtime_ns, sha256 FROM file_hashes WHERE path_key = ?", (key,)
+                ).fetchone()
+            if row and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+                return row[2]
+
+        digest = file_sha256(file_path)
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?)", (key, st.st_size, st.st_mtime_ns, digest)
+            )
+        return digest
+
+    def _fresh(self, verdict, scanned_at, now):
+        return now - scanned_at < self.ttl.get(verdict, 0)
+
+    def lookup_many(self, file_paths):
+        # 여러 파일을 한 번에 조회: (경로 -> 원본 결과) 적중 목록, (경로 -> 해시) 목록 반환
+        digests = {}
+        with ThreadPoolExecutor(max_workers=self.hash_workers) as executor:
+            for file_path, digest in zip(file_paths, executor.map(self._safe_digest, file_paths)):
+                if digest:
+                    digests[file_path] = digest
+
+        found = {}
+        unique = list(set(digests.values()))
+        now = time.time()
+        for start in range(0, len(unique), self.BATCH_SIZE):
+            chunk = unique[start:start + self.BATCH_SIZE]
+            with self.lock:
+                rows = self.conn.execute(
+                    f"SELECT sha256, verdict, raw_result, scanned_at FROM verdicts "
+                    f"WHERE sha256 IN ({','.join('?' * len(chunk))})", chunk
+                ).fetchall()
+            for sha256, verdict, raw_result, scanned_at in rows:
+                if self._fresh(verdict, scanned_at, now):
+                    found[sha256] = raw_result
+
+        hits = {path: found[digest] for path, digest in digests.items() if digest in found}
+        with self.lock:
+            self.hits += len(hits)
+            self.misses += len(file_paths) - len(hits)
+        return hits, digests
+
+    def _safe_digest(self, file_path):
+        try:
+            return self._digest(file_path)
+        except OSError:
+            return None
+
+    def lookup(self, file_path):
+        hits, digests = self.lookup_many([file_path])
+        return hits.get(file_path), digests.get(file_path)
+
+    def store(self, digest, raw_result):
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?)",
+                (digest, classify(raw_result), raw_result, time.time()),
+            )
+
+    def hit_ratio(self):
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def purge_expired(self):
+        # 유지 시간이 지난 판정 삭제
+        now = time.time()
+        with self.lock:
+            for verdict, ttl in self.ttl.items():
+                self.conn.execute("DELETE FROM verdicts WHERE verdict = ? AND scanned_at < ?", (verdict, now - ttl))
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,80 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+import threading
+import stat
+import time
+import os
+
+SEARCH_BATCH_SIZE = 500  # 한 번에 넘겨주는 최대 결과 수
+SEARCH_BATCH_INTERVAL = 0.05  # 결과가 적어도 이 간격(초)마다 넘겨줌
+
+
+class SearchRecord:
+    # 검색 결과 한 건 (파일 정보는 검색 스레드에서 한 번의 stat으로 미리 읽어 둠)
+    __slots__ = ("path", "name", "is_dir", "size", "mtime", "exists")
+
+    def __init__(self, path, is_dir=False, size=None, mtime=None, exists=True):
+        self.path = path
+        self.name = os.path.basename(path)
+        self.is_dir = is_dir
+        self.size = size
+        self.mtime = mtime
+        self.exists = exists
+
+    @classmethod
+    def from_path(cls, path):
+        try:
+            st = os.stat(path)
+        except (OSError, ValueError):
+            return cls(path, exists=False)
+        is_dir = stat.S_ISDIR(st.st_mode)
+        return cls(path, is_dir, None if is_dir else st.st_size, st.st_mtime)
+
+
+class SearchThread(QThread):
+    """
+    백그라운드에서 파일을 검색하고 결과를 묶음 단위로 넘겨주는 스레드입니다.
+    새 검색이 시작되면 cancel()로 이전 검색을 중단합니다.
+    """
+    results = pyqtSignal(int, object)  # 검색 번호, SearchRecord 목록
+    finished = pyqtSignal(int, int)  # 검색 번호, 전체 결과 수
+    cancelled = pyqtSignal(int)
+    error = pyqtSignal(int, str)
+
+    def __init__(self, search_id, directory, query, search):
+        super().__init__()
+        self.search_id = search_id  # 이전 검색의 늦게 도착한 결과를 구분하기 위한 번호
+        self.directory = directory
+        self.query = query
+        self.search = search  # (폴더, 검색어, 취소 이벤트) -> 경로 또는 SearchRecord를 하나씩 반환하는 함수
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def run(self):
+        batch, count = [], 0
+        last_emit = time.monotonic()
+        try:
+            # 취소 이벤트를 검색 함수에도 넘겨 색인 작성·결과 읽기 자체를 멈추게 함
+            for path in self.search(self.directory, self.query, self._cancel_event):
+                if self._cancel_event.is_set():
+                    self.cancelled.emit(self.search_id)
+                    return
+                if not path:
+                    continue
+                # 검색 함수가 파일 정보까지 준 경우(SearchRecord)는 다시 stat하지 않음
+                batch.append(path if isinstance(path, SearchRecord) else SearchRecord.from_path(path))
+                count += 1
+                now = time.monotonic()
+                if len(batch) >= SEARCH_BATCH_SIZE or now - last_emit >= SEARCH_BATCH_INTERVAL:
+                    self.results.emit(self.search_id, batch)
+                    batch, last_emit = [], now
+            if self._cancel_event.is_set():
+                # 검색 함수가 취소를 보고 결과 없이 일찍 끝난 경우
+                self.cancelled.emit(self.search_id)
+                return
+            if batch:
+                self.results.emit(self.search_id, batch)
+            self.finished.emit(self.search_id, count)
+        except Exception as e:
+            self.error.emit(self.search_id, str(e))
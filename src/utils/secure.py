@@ -7,27 +7,38 @@ from ctypes import c_char_p, POINTER, c_ubyte, c_int
 from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal
 from email.mime.text import MIMEText
 from PyQt5.QtGui import QFont
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from utils.mapping_store import JsonMappingStore, SqliteMappingStore
+from utils.native.library import load_library
 import subprocess
+import threading
+import tempfile
 import shutil
+import struct
 import ctypes
 import random
 import smtplib
 import uuid
+import time
 import json
 import sys
 import re
 import os
 
 class SecureFolderManager:
-    def __init__(self):
+    def __init__(self, max_workers=None):
         # 보안 폴더 경로 설정
         self.folder_name = "asset"  # 폴더 이름 복원
         self.secure_folder_path = os.path.join(os.path.expanduser("~"), "Documents", self.folder_name)
 
+        # 폴더 잠금/해제 시 동시에 처리할 파일 수 (ctypes 호출은 GIL을 해제하므로 스레드로 충분)
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+
 
         self.authenticated = False  # 인증 여부를 저장하는 변수
         self.pwd_mgr = PasswordManager()  # PasswordManager 인스턴스 생성
-        self.AES_mgr = AESManager()
+        self.AES_mgr = AESManager(pm=self.pwd_mgr)
         self.mapping_mgr = MappingManager()
 
         # 보안 폴더가 없으면 생성
@@ -166,12 +177,15 @@ class SecureFolderManager:
                 # 폴더 자체 이동
                 shutil.move(path, secure_folder)
 
-                # 폴더 및 파일 메타데이터 기록
+                # 폴더 및 파일 메타데이터 기록 (워커 풀에서 병렬 처리)
+                jobs = []
                 for root, _, files in os.walk(secure_folder):
                     for file in files:
                         file_path = os.path.join(root, file)
                         original_path = os.path.join(path, os.path.relpath(file_path, secure_folder))
-                        self._lock_file(file_path, original_path)
+                        jobs.append((file_path, original_path))
+                with self.mapping_mgr.batch():  # 매핑은 배치 종료 시 한 번만 저장
+                    failures = self._run_batch(self._lock_file, jobs)
 
             else:  # 단일 파일 처리
                 # 단일 파일 이동
@@ -182,18 +196,22 @@ class SecureFolderManager:
 
                 # 메타데이터 기록 및 암호화
                 self._lock_file(secure_path, path)
+                failures = []
 
         except Exception as e:
             raise Exception(f"파일 암호화 또는 이동 중 오류 발생: {str(e)}")
 
+        if failures:
+            raise Exception(self._failure_summary("암호화", len(jobs), failures))
+
     def _lock_file(self, file_path, original_path):
         # 단일 파일을 보안 폴더로 이동하고 암호화
-        file_id = self.mapping_mgr.generate_id(original_path)  # 고유 ID 생성
-        self.mapping_mgr.mapping[file_id] = {"original_path": original_path}
-        self.mapping_mgr.save_mapping()
+        secure_path = os.path.relpath(file_path, self.secure_folder_path)
+        size = os.path.getsize(file_path)
+        file_id = self.mapping_mgr.generate_id(original_path, secure_path, size)  # 고유 ID 생성 및 매핑 기록
 
-        # 암호화 수행
-        self.AES_mgr.encrypt(file_path)
+        # 암호화 수행, 파일 ID는 암호문 헤더에 함께 기록 (실패 시 예외를 그대로 올려 배치 요약에 포함)
+        self.AES_mgr.enc_file(file_path, file_id)
 
     def unlock(self, path):
         # 보안 폴더 내의 파일 또는 폴더를 원래 위치로 복원하고 복호화
@@ -202,24 +220,33 @@ class SecureFolderManager:
 
         try:
             if os.path.isdir(path):  # 폴더 처리
+                jobs = []
                 for root, _, files in os.walk(path):
                     for file in files:
-                        file_path = os.path.join(root, file)
-                        self._unlock_file(file_path)
+                        jobs.append((os.path.join(root, file),))
+                with self.mapping_mgr.batch():  # 매핑은 배치 종료 시 한 번만 저장
+                    failures = self._run_batch(self._unlock_file, jobs)
 
-                # 보안 폴더 내 폴더 삭제
-                shutil.rmtree(path)
+                # 보안 폴더 내 폴더 삭제 (복원에 실패한 파일이 남아 있으면 보존)
+                if not failures:
+                    shutil.rmtree(path)
 
             else:  # 단일 파일 처리
                 self._unlock_file(path)
+                failures = []
 
         except Exception as e:
             raise Exception(f"파일 복호화 또는 이동 중 오류 발생: {str(e)}")
 
+        if failures:
+            raise Exception(self._failure_summary("복호화", len(jobs), failures))
+
     def _unlock_file(self, file_path):
         # 단일 파일을 원래 위치로 복원하고 복호화
-        filename = os.path.basename(file_path)
-        file_id = self.mapping_mgr.get_file_id(filename)
+        # 암호문 헤더의 파일 ID를 우선 사용하고, 없으면 보안 폴더 기준 상대 경로로 검색
+        file_id = self.AES_mgr.read_file_id(file_path)
+        if file_id is None or self.mapping_mgr.get_original_path(file_id) is None:
+            file_id = self.mapping_mgr.get_file_id(os.path.relpath(file_path, self.secure_folder_path))
 
         if file_id is None:
             raise Exception("해당 파일의 원래 경로를 찾을 수 없습니다.")
@@ -230,16 +257,36 @@ class SecureFolderManager:
 
         # 폴더 경로가 없으면 재생성
         original_folder = os.path.dirname(original_path)
-        if not os.path.exists(original_folder):
-            os.makedirs(original_folder)
+        os.makedirs(original_folder, exist_ok=True)
 
         # 파일 이동 및 복호화
         shutil.move(file_path, original_path)
-        self.AES_mgr.decrypt(original_path)  # 복호화 수행
+        self.AES_mgr.dec_file(original_path)  # 복호화 수행
 
         # 매핑 정보 삭제
         self.mapping_mgr.delete_mapping(file_id)
-        self.mapping_mgr.save_mapping()
+
+    def _run_batch(self, task, jobs):
+        # 작업을 제한된 워커 풀에서 병렬 실행하고, 실패한 파일은 중단 없이 모아서 반환
+        failures = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(task, *job): job[0] for job in jobs}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    failures.append((futures[future], str(e)))
+        return failures
+
+    @staticmethod
+    def _failure_summary(action, total, failures, limit=10):
+        # 실패 목록을 사용자에게 보여줄 요약 문자열로 변환
+        lines = [f"전체 {total}개 중 {len(failures)}개 파일 {action} 실패"]
+        for file_path, error in failures[:limit]:
+            lines.append(f"- {file_path}: {error}")
+        if len(failures) > limit:
+            lines.append(f"... 외 {len(failures) - limit}개")
+        return "\n".join(lines)
 
 
 class TaskRunner:
@@ -315,22 +362,19 @@ class TaskRunner:
         thread.deleteLater()
 
 class AESManager:
-    def __init__(self):
-        # AES DLL 로드
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        dll_folder = os.path.join(current_dir, "../dll")
-        dll_path = os.path.abspath(os.path.join(dll_folder, "aes.dll"))
-        self.AES = ctypes.CDLL(dll_path)
+    STREAM_MAGIC = b"SFCHUNK2"  # 청크 스트리밍 암호화 파일 식별자 (헤더에 파일 ID 포함)
+    STREAM_MAGIC_V1 = b"SFCHUNK1"  # 파일 ID 없는 이전 청크 형식
+    chunk_size = 4 * 1024 * 1024  # 청크 크기(4MB, 16의 배수)
 
-        self.AES.aes_cbc_encrypt.argtypes = [ctypes.POINTER(ctypes.c_ubyte), ctypes.POINTER(ctypes.c_ubyte), ctypes.c_int, ctypes.POINTER(ctypes.c_ubyte)]
-        self.AES.aes_cbc_encrypt.restype = ctypes.c_int
+    def __init__(self, pm=None):
+        # AES DLL 로드 (핸들과 함수 원형은 공유 레지스트리에서 재사용)
+        self.AES = load_library("aes.dll")
+        cbc_argtypes = [ctypes.POINTER(ctypes.c_ubyte), ctypes.POINTER(ctypes.c_ubyte), ctypes.c_int, ctypes.POINTER(ctypes.c_ubyte)]
+        self.AES.bind("aes_cbc_encrypt", ctypes.c_int, cbc_argtypes)
+        self.AES.bind("aes_cbc_decrypt", ctypes.c_int, cbc_argtypes)
 
-        self.AES.aes_cbc_decrypt.argtypes = [ctypes.POINTER(ctypes.c_ubyte), ctypes.POINTER(ctypes.c_ubyte), ctypes.c_int, ctypes.POINTER(ctypes.c_ubyte)]
-        self.AES.aes_cbc_decrypt.restype = ctypes.c_int
-
-
-        # PasswordManager 객체 생성 및 자동 설정 로드
-        self.pm = PasswordManager()  # 객체 이름을 짧게 변경
+        # PasswordManager 객체 생성 및 자동 설정 로드 (이미 있는 객체를 받으면 그대로 사용)
+        self.pm = pm or PasswordManager()  # 객체 이름을 짧게 변경
 
     def enc_data(self, data):
         # 데이터 암호화
@@ -360,27 +404,137 @@ class AESManager:
             raise RuntimeError("Decryption failed")
         return bytes(decrypted)
 
-    def enc_file(self, path):
-        # 파일 암호화
-        with open(path, 'rb+') as f:
-            data = f.read()
-            pad_len = 16 - (len(data) % 16)  # PKCS7 패딩 추가
-            data += bytes([pad_len] * pad_len)
-            encrypted = self.enc_data(data)
-            f.seek(0)
-            f.truncate()
-            f.write(encrypted)
+    def _key_buffer(self):
+        # ctypes 키 버퍼 생성
+        if self.pm.AESkey is None:
+            raise ValueError("AES 키가 설정되지 않았습니다.")
+        key = self.pm.AESkey
+        return (ctypes.c_ubyte * len(key)).from_buffer_copy(key)
+
+    @staticmethod
+    def _read_full(f, view):
+        # view 크기만큼(또는 EOF까지) 읽고 읽은 바이트 수 반환
+        total = 0
+        while total < len(view):
+            n = f.readinto(view[total:])
+            if not n:
+                break
+            total += n
+        return total
+
+    @staticmethod
+    def _replace_file(path, write_func):
+        # 같은 폴더의 임시 파일에 기록한 뒤 원자적으로 교체
+        fd, tmp_path = tempfile.mkstemp(prefix=".", suffix=".tmp", dir=os.path.dirname(os.path.abspath(path)))
+        try:
+            with os.fdopen(fd, 'wb') as dst:
+                write_func(dst)
+                dst.flush()
+                os.fsync(dst.fileno())
+            shutil.copymode(path, tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def read_header(self, path):
+        # 암호문 헤더 파싱 -> (청크 크기, 데이터 시작 위치, 파일 ID). 청크 형식이 아니면 None
+        with open(path, 'rb') as f:
+            header = f.read(len(self.STREAM_MAGIC) + 6)
+            magic = header[:len(self.STREAM_MAGIC)]
+            if magic == self.STREAM_MAGIC and len(header) == len(self.STREAM_MAGIC) + 6:
+                chunk_size, id_len = struct.unpack("<IH", header[len(self.STREAM_MAGIC):])
+                file_id = f.read(id_len).decode('ascii') or None
+                return chunk_size, len(header) + id_len, file_id
+            if magic == self.STREAM_MAGIC_V1 and len(header) >= len(self.STREAM_MAGIC_V1) + 4:
+                chunk_size = struct.unpack("<I", header[len(self.STREAM_MAGIC_V1):len(self.STREAM_MAGIC_V1) + 4])[0]
+                return chunk_size, len(self.STREAM_MAGIC_V1) + 4, None
+        return None
+
+    def read_file_id(self, path):
+        # 암호문과 함께 저장된 파일 ID 반환 (없으면 None)
+        header = self.read_header(path)
+        return header[2] if header else None
+
+    def enc_file(self, path, file_id=None):
+        # 파일 암호화 (청크 단위 스트리밍, 메모리 사용량 고정)
+        # 형식: 매직(8) + 청크 크기(4) + ID 길이(2) + 파일 ID + [IV(16) + 암호문] * N, 마지막 청크에만 PKCS7 패딩
+        key_c = self._key_buffer()
+        chunk_size = self.chunk_size
+        in_buf = bytearray(chunk_size + 16)
+        out_buf = bytearray(chunk_size + 32)
+        in_c = (ctypes.c_ubyte * len(in_buf)).from_buffer(in_buf)
+        out_c = (ctypes.c_ubyte * len(out_buf)).from_buffer(out_buf)
+        in_view = memoryview(in_buf)
+        out_view = memoryview(out_buf)
+
+        def write_encrypted(dst):
+            id_bytes = file_id.encode('ascii') if file_id else b""
+            dst.write(self.STREAM_MAGIC + struct.pack("<IH", chunk_size, len(id_bytes)) + id_bytes)
+            with open(path, 'rb') as src:
+                while True:
+                    n = self._read_full(src, in_view[:chunk_size])
+                    last = n < chunk_size
+                    if last:  # 마지막 청크: PKCS7 패딩 추가
+                        pad_len = 16 - (n % 16)
+                        in_view[n:n + pad_len] = bytes([pad_len] * pad_len)
+                        n += pad_len
+                    if self.AES.aes_cbc_encrypt(key_c, in_c, n, out_c) != 0:
+                        raise RuntimeError("Encryption failed")
+                    dst.write(out_view[:n + 16])
+                    if last:
+                        break
+
+        self._replace_file(path, write_encrypted)
 
     def dec_file(self, path):
-        # 파일 복호화
-        with open(path, 'rb+') as f:
-            data = f.read()
-            decrypted_padded = self.dec_data(data)
-            pad_len = decrypted_padded[-1]
-            decrypted = decrypted_padded[:-pad_len]  # 패딩 제거
-            f.seek(0)
-            f.truncate()
-            f.write(decrypted)
+        # 파일 복호화 (청크 형식과 기존 단일 CBC 형식 모두 스트리밍 처리)
+        key_c = self._key_buffer()
+        file_size = os.path.getsize(path)
+
+        header = self.read_header(path)
+        if header:
+            chunk_size, data_offset, _ = header
+            chained = False
+        else:
+            # 기존 형식: IV + 파일 전체 암호문. 직전 암호문 블록을 다음 청크의 IV로 이어 붙여 복호화
+            chunk_size = self.chunk_size
+            data_offset = 0
+            chained = True
+
+        in_buf = bytearray(chunk_size + 16)
+        out_buf = bytearray(chunk_size + 16)
+        in_c = (ctypes.c_ubyte * len(in_buf)).from_buffer(in_buf)
+        out_c = (ctypes.c_ubyte * len(out_buf)).from_buffer(out_buf)
+        in_view = memoryview(in_buf)
+        out_view = memoryview(out_buf)
+
+        def write_decrypted(dst):
+            with open(path, 'rb') as src:
+                src.seek(data_offset)
+                if chained and self._read_full(src, in_view[:16]) != 16:
+                    raise RuntimeError("Decryption failed")
+                while src.tell() < file_size:
+                    if chained:  # in_buf[:16]에는 직전 암호문 블록(IV)이 들어 있음
+                        n = 16 + self._read_full(src, in_view[16:])
+                    else:
+                        n = self._read_full(src, in_view)
+                    if n <= 16 or n % 16:
+                        raise RuntimeError("Decryption failed")
+                    if self.AES.aes_cbc_decrypt(key_c, in_c, n, out_c) != 0:
+                        raise RuntimeError("Decryption failed")
+                    plain_len = n - 16
+                    if src.tell() >= file_size:  # 마지막 청크: 패딩 제거
+                        pad_len = out_buf[plain_len - 1]
+                        if not 1 <= pad_len <= 16:
+                            raise RuntimeError("Decryption failed")
+                        plain_len -= pad_len
+                    dst.write(out_view[:plain_len])
+                    if chained:
+                        in_view[:16] = in_view[n - 16:n]
+
+        self._replace_file(path, write_decrypted)
 
     def enc_folder(self, path):
         # 폴더 내 모든 파일 암호화
@@ -464,22 +618,13 @@ class PasswordManager:
 
         #################################################DLL설정↓↓↓↓
         # DLL 로드 및 해시 함수 정의 (세 개의 인자 받도록 수정)
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        dll_folder = os.path.join(current_dir, "../dll")
-        dll_path = os.path.abspath(os.path.join(dll_folder, "hashing.dll"))
-        self.hasher = ctypes.CDLL(dll_path)
-        
-        dll_path1 = os.path.abspath(os.path.join(dll_folder, "salthide.dll"))
-        self.salthide = ctypes.CDLL(dll_path1)
+        self.hasher = load_library("hashing.dll")
+        self.salthide = load_library("salthide.dll")
 
-        self.hasher.hash_password.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_ubyte)]
-        self.hasher.hash_password.restype = None
-
-        self.salthide.encrypt_message.argtypes = [c_char_p, POINTER(c_ubyte)]
-        self.salthide.encrypt_message.restype = c_int
-
-        self.salthide.decrypt_message.argtypes = [POINTER(c_ubyte), POINTER(c_ubyte), c_int]
-        self.salthide.decrypt_message.restype = c_int
+        self.hasher.bind("hash_password", None, [ctypes.c_char_p, ctypes.c_char_p, ctypes.POINTER(ctypes.c_ubyte)])
+        self.salthide.bind("encrypt_message", c_int, [c_char_p, POINTER(c_ubyte)])
+        self.salthide.bind("decrypt_message", c_int, [POINTER(c_ubyte), POINTER(c_ubyte), c_int])
+        self._aes_manager = None  # encrypt/decrypt에서 재사용할 AESManager
 
         self.load_config()
         self.load_key()
@@ -884,6 +1029,12 @@ class PasswordManager:
             QMessageBox.critical(None, "Error", f"AES 키 생성에 실패했습니다: {e}")
 
     
+    def aes_manager(self):
+        # AESManager는 한 번만 생성 (PasswordManager 자신을 전달해 설정을 다시 읽지 않음)
+        if self._aes_manager is None:
+            self._aes_manager = AESManager(pm=self)
+        return self._aes_manager
+
     def encrypt(self, path):
         
         #AESManager의 fast_encrypt_folder 메서드를 호출하여 폴더를 암호화합니다.
@@ -891,62 +1042,75 @@ class PasswordManager:
         if self.AESkey is None:
             raise ValueError("AES 키가 설정되지 않았습니다. 초기화를 먼저 수행하세요.")
 
-        # AESManager를 동적으로 임포트하고 생성
-        
-        aes_manager = AESManager()
-        aes_manager.pm = self  # AESManager에 PasswordManager 자신을 전달
-        aes_manager.encrypt(path)
+        self.aes_manager().encrypt(path)
 
     def decrypt(self, path):
         #AESManager의 fast_decrypt_folder 메서드를 호출하여 폴더를 복호화합니다.
         if self.AESkey is None:
             raise ValueError("AES 키가 설정되지 않았습니다. 초기화를 먼저 수행하세요.")
 
-        # AESManager를 동적으로 임포트하고 생성
-        
-        aes_manager = AESManager()
-        aes_manager.pm = self  # AESManager에 PasswordManager 자신을 전달
-        aes_manager.decrypt(path)
+        self.aes_manager().decrypt(path)
 
 
 class MappingManager:
-    def __init__(self):
+    def __init__(self, backend="sqlite"):
         # 매핑 데이터를 저장할 파일 설정
-        self.mapping_file = os.path.join(os.path.dirname(__file__), "setting/meta.json")
-        self.mapping = self.load_mapping()
-
-    def load_mapping(self):
-        # 메타데이터 로드
-        if os.path.exists(self.mapping_file):
-            with open(self.mapping_file, "r") as f:
-                return json.load(f)
-        return {}
+        setting_dir = os.path.join(os.path.dirname(__file__), "setting")
+        self.mapping_file = os.path.join(setting_dir, "meta.json")
+        self.db_file = os.path.join(setting_dir, "meta.db")
+        self.lock = threading.RLock()  # 병렬 잠금/해제 시 매핑 보호
+
+        # 저장소 선택: sqlite(기본, 최초 실행 시 meta.json 자동 이전) 또는 json
+        if backend == "sqlite":
+            self.store = SqliteMappingStore(self.db_file, legacy_json=self.mapping_file)
+        elif backend == "json":
+            self.store = JsonMappingStore(self.mapping_file)
+        else:
+            raise ValueError(f"지원하지 않는 매핑 저장소입니다: {backend}")
 
     def save_mapping(self):
-        # 메타데이터 저장
-        with open(self.mapping_file, "w") as f:
-            json.dump(self.mapping, f, indent=4)
+        # 메타데이터 저장 (배치 중에는 커밋 시점까지 미룸)
+        with self.lock:
+            self.store.save()
+
+    @contextmanager
+    def batch(self):
+        # 블록 안의 매핑 변경을 모아서 한 번에 반영 (워커 스레드가 쓸 수 있도록 잠금은 짧게만 잡음)
+        with self.lock:
+            self.store.begin_batch()
+        try:
+            yield self
+        finally:
+            with self.lock:
+                self.store.end_batch()
 
-    def generate_id(self, path):
+    def generate_id(self, path, secure_path=None, size=None):
         # 고유 ID 생성 및 매핑 저장
         file_id = str(uuid.uuid4())
-        self.mapping[file_id] = {"original_path": path}
-        self.save_mapping()
+        info = {"original_path": path, "locked_at": time.time()}
+        if secure_path:
+            info["secure_path"] = secure_path
+        if size is not None:
+            info["size"] = size
+        with self.lock:
+            self.store.put(file_id, info)
         return file_id
 
     def get_original_path(self, file_id):
         # ID를 통해 원래 경로 검색
-        return self.mapping.get(file_id, {}).get("original_path")
-
-    def get_file_id(self, filename):
-        # 파일 이름을 통해 ID 검색
-        for file_id, info in self.mapping.items():
-            if os.path.basename(info["original_path"]) == filename:
-                return file_id
-        return None
+        with self.lock:
+            info = self.store.get(file_id)
+        return info.get("original_path") if info else None
+
+    def get_file_id(self, secure_path):
+        # 보안 폴더 기준 상대 경로로 ID 검색 (경로 정보가 없는 이전 항목은 파일 이름으로 검색)
+        with self.lock:
+            file_id = self.store.find_by_secure_path(secure_path)
+            if file_id is None:
+                file_id = self.store.find_by_name(os.path.basename(secure_path))
+        return file_id
 
     def delete_mapping(self, file_id):
         # ID 매핑 삭제
-        if file_id in self.mapping:
-            del self.mapping[file_id]
-            self.save_mapping()
+        with self.lock:
+            self.store.delete(file_id)
@@ -0,0 +1,524 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PyQt5.QtCore import QThread, pyqtSignal
+import threading
+import shutil
+import errno
+import uuid
+import time
+import os
+
+CHUNK_SIZE = 8 * 1024 * 1024  # 한 번에 복사하는 크기 (진행률 보고와 취소 확인 단위)
+LARGE_FILE_SIZE = CHUNK_SIZE  # 한 청크보다 큰 파일은 전용 작업자 하나가 순서대로 복사
+COPY_WORKERS = min(16, (os.cpu_count() or 1) * 2)  # 작은 파일 복사 스레드 수
+PART_SUFFIX = ".part"  # 복사 중인 파일 이름 뒤에 붙는 확장자 (완료 후 원래 이름으로 교체)
+
+# 대상 경로에 같은 이름이 이미 있을 때 처리 방식
+CONFLICT_OVERWRITE = "overwrite"
+CONFLICT_SKIP = "skip"
+CONFLICT_RENAME = "rename"  # 둘 다 유지 (새 항목 이름 뒤에 번호 추가)
+
+
+class TransferCancelled(Exception):
+    pass
+
+
+class TransferProgress:
+    # 진행 상황 스냅샷 (speed: 바이트/초, eta: 남은 시간(초) 또는 None)
+    __slots__ = ("bytes_done", "bytes_total", "files_done", "files_total", "current", "speed", "eta")
+
+    def __init__(self, bytes_done, bytes_total, files_done, files_total, current, speed, eta):
+        self.bytes_done = bytes_done
+        self.bytes_total = bytes_total
+        self.files_done = files_done
+        self.files_total = files_total
+        self.current = current
+        self.speed = speed
+        self.eta = eta
+
+
+class TransferItem:
+    # 붙여넣기 항목 하나 (최상위 파일 또는 폴더)
+    def __init__(self, source, destination, conflict=None):
+        self.source = source
+        self.destination = destination
+        self.conflict = conflict  # 대상이 이미 있을 때의 처리 방식 (없으면 None)
+        self.files = []  # (원본 파일, 대상 파일, 크기)
+        self.dirs = []  # (원본 폴더, 대상 폴더)
+        self.rename = False  # 같은 드라이브 안의 이동 (하위 항목을 탐색하지 않고 이름만 변경)
+        self.aside = None  # 덮어쓰기 전에 옆으로 옮겨 둔 기존 항목 경로 (완료 후 삭제, 실패 시 복원)
+        self.prepared = False  # 덮어쓰기 준비 등 사전 작업 완료 여부
+        self.done = False
+
+
+def unique_destination(path):
+    # "이름 (2).확장자" 형식으로 비어 있는 경로 찾기
+    base, ext = os.path.splitext(path)
+    if os.path.isdir(path):
+        base, ext = path, ""
+    index = 2
+    while True:
+        candidate = f"{base} ({index}){ext}"
+        if not os.path.exists(candidate):
+            return candidate
+        index += 1
+
+
+def find_conflicts(sources, target_dir):
+    # 대상 폴더에 같은 이름이 이미 있는 원본 목록 (원본과 대상이 같은 경우는 제외)
+    conflicts = []
+    for source in sources:
+        destination = os.path.join(target_dir, os.path.basename(source))
+        if os.path.exists(destination) and os.path.abspath(source) != os.path.abspath(destination):
+            conflicts.append(source)
+    return conflicts
+
+
+def build_items(sources, target_dir, resolutions=None):
+    """
+    붙여넣을 원본 목록으로 TransferItem 목록을 만듭니다.
+
+    Args:
+        sources (list[str]): 원본 경로 목록
+        target_dir (str): 대상 폴더
+        resolutions (dict, optional): 충돌한 원본 경로 -> 처리 방식 (CONFLICT_*)
+
+    Returns:
+        tuple: (TransferItem 목록, 건너뛴 항목에 대한 경고 메시지 목록)
+    """
+    resolutions = resolutions or {}
+    items, warnings = [], []
+    for source in sources:
+        destination = os.path.join(target_dir, os.path.basename(source))
+        if os.path.abspath(source) == os.path.abspath(destination):
+            warnings.append(f"Source and destination are the same: {source}")
+            continue
+        if os.path.isdir(source) and os.path.abspath(destination).startswith(os.path.abspath(source) + os.sep):
+            warnings.append(f"Cannot paste a folder into itself: {source}")
+            continue
+
+        conflict = resolutions.get(source) if os.path.exists(destination) else None
+        if conflict == CONFLICT_SKIP:
+            continue
+        if conflict == CONFLICT_RENAME:
+            destination, conflict = unique_destination(destination), None
+        items.append(TransferItem(source, destination, conflict))
+    return items, warnings
+
+
+def _same_device(source, destination):
+    try:
+        return os.lstat(source).st_dev == os.stat(os.path.dirname(destination)).st_dev
+    except OSError:
+        return False
+
+
+def _aside_path(path):
+    # 같은 폴더 안의 임시 이름 (같은 드라이브라 이름 변경이 원자적)
+    parent, name = os.path.split(path)
+    return os.path.join(parent, f".{name}.{uuid.uuid4().hex[:8]}.old")
+
+
+def _remove(path):
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    elif os.path.lexists(path):
+        os.remove(path)
+
+
+class _Meter:
+    # 진행량 누적 및 속도/남은 시간 계산 (보고는 interval 간격으로 제한)
+    def __init__(self, bytes_total, files_total, bytes_done, files_done, callback, interval=0.2):
+        self.bytes_total = bytes_total
+        self.files_total = files_total
+        self.bytes_done = bytes_done
+        self.files_done = files_done
+        self.callback = callback
+        self.interval = interval
+        self.current = ""
+        self.speed = 0.0
+        self.lock = threading.Lock()
+        self._last_time = time.monotonic()
+        self._last_bytes = bytes_done
+
+    def add_totals(self, size, files):
+        with self.lock:
+            self.bytes_total += size
+            self.files_total += files
+
+    def add_bytes(self, count):
+        with self.lock:
+            self.bytes_done += count
+        self.report()
+
+    def file_done(self, count=1, size=0):
+        with self.lock:
+            self.files_done += count
+            self.bytes_done += size
+        self.report()
+
+    def report(self, force=False):
+        if not self.callback:
+            return
+        with self.lock:
+            now = time.monotonic()
+            elapsed = now - self._last_time
+            if not force and elapsed < self.interval:
+                return
+            if elapsed > 0:
+                sample = (self.bytes_done - self._last_bytes) / elapsed
+                self.speed = sample if self.speed == 0 else 0.7 * self.speed + 0.3 * sample  # 지수 이동 평균
+            self._last_time, self._last_bytes = now, self.bytes_done
+            remaining = max(self.bytes_total - self.bytes_done, 0)
+            eta = remaining / self.speed if self.speed > 0 else None
+            progress = TransferProgress(self.bytes_done, self.bytes_total, self.files_done, self.files_total,
+                                        self.current, self.speed, eta)
+        self.callback(progress)
+
+
+def _copy_range(src_fd, dst_fd, offset, count):
+    # 커널 복사(copy_file_range → sendfile)를 우선 사용하고, 지원하지 않으면 큰 버퍼로 읽고 씀
+    if hasattr(os, "copy_file_range"):
+        try:
+            return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+        except OSError:
+            pass
+    if hasattr(os, "sendfile"):
+        try:
+            os.lseek(dst_fd, offset, os.SEEK_SET)
+            return os.sendfile(dst_fd, src_fd, offset, count)
+        except OSError:
+            pass
+    os.lseek(src_fd, offset, os.SEEK_SET)
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    data = os.read(src_fd, count)
+    view = memoryview(data)
+    written = 0
+    while written < len(data):
+        written += os.write(dst_fd, view[written:])
+    return len(data)
+
+
+class TransferJob:
+    """
+    파일/폴더 복사·이동 작업입니다. (여러 스레드에서 진행하므로 완료/중단 기록은 파일 단위)
+    취소된 작업을 다시 run하면 완료된 파일은 건너뛰고 복사 중이던 파일은 이어서 복사합니다.
+    """
+    def __init__(self, items, operation="copy", chunk_size=CHUNK_SIZE, workers=None, large_file_size=LARGE_FILE_SIZE):
+        if operation not in ("copy", "move"):
+            raise ValueError(f"알 수 없는 작업: {operation}")
+        self.items = items
+        self.operation = operation
+        self.chunk_size = chunk_size
+        self.workers = workers or COPY_WORKERS  # 작은 파일을 동시에 복사할 스레드 수
+        self.large_file_size = large_file_size  # 이 크기 이상은 전용 작업자가 복사
+        self.errors = []
+        self.completed = set()  # 복사를 마친 대상 파일 경로
+        self.partial = {}  # 복사 중 취소된 대상 파일 경로 -> 복사한 바이트 수
+        self.planned = False
+        self.bytes_total = 0
+        self.files_total = 0
+
+    def plan(self):
+        # 원본을 한 번 탐색해 전체 크기와 파일 목록 계산 (같은 드라이브 안의 이동은 탐색하지 않음)
+        for item in self.items:
+            item.rename = self.operation == "move" and _same_device(item.source, item.destination)
+            if not item.rename:
+                self._plan_item(item)
+        self.bytes_total = sum(size for item in self.items for _, _, size in item.files)
+        self.files_total = sum(1 if item.rename else len(item.files) for item in self.items)
+        self.planned = True
+
+    def _plan_item(self, item):
+        item.files, item.dirs = [], []
+        try:
+            if os.path.isdir(item.source) and not os.path.islink(item.source):
+                self._plan_tree(item, item.source, item.destination)
+            else:
+                item.files.append((item.source, item.destination, os.lstat(item.source).st_size))
+        except OSError as e:
+            item.files, item.dirs = [], []
+            self._fail(item, e)
+
+    def _plan_tree(self, item, source, destination):
+        item.dirs.append((source, destination))
+        with os.scandir(source) as it:
+            entries = list(it)
+        for entry in entries:
+            target = os.path.join(destination, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                self._plan_tree(item, entry.path, target)
+            else:
+                item.files.append((entry.path, target, entry.stat(follow_symlinks=False).st_size))
+
+    def run(self, cancel_event=None, callback=None):
+        """
+        작업을 실행합니다. 항목별 오류는 errors에 모으고 나머지 항목은 계속 처리합니다.
+        폴더는 먼저 한 번에 만들고, 작은 파일은 스레드 풀에서 동시에, 큰 파일은 전용 작업자 하나가 순서대로 복사합니다.
+
+        Raises:
+            TransferCancelled: cancel_event가 설정되어 중단된 경우
+        """
+        cancel_event = cancel_event or threading.Event()
+        if not self.planned:
+            self.plan()
+
+        done_bytes = sum(size for item in self.items for src, dst, size in item.files
+                         if item.done or dst in self.completed)
+        done_files = sum(1 for item in self.items for src, dst, size in item.files
+                         if item.done or dst in self.completed)
+        done_files += sum(1 for item in self.items if item.done and item.rename)
+        meter = _Meter(self.bytes_total, self.files_total, done_bytes + sum(self.partial.values()), done_files, callback)
+
+        # 덮어쓰기 준비 및 같은 드라이브 이동(이름 변경)
+        copy_items = []
+        for item in self.items:
+            if item.done:
+                continue
+            if cancel_event.is_set():
+                raise TransferCancelled()
+            meter.current = item.source
+            try:
+                if self._prepare_item(item, meter):
+                    item.done = True
+                else:
+                    copy_items.append(item)
+            except Exception as e:
+                self._fail(item, e)
+
+        # 대상 폴더 구조를 먼저 한 번에 생성
+        for item in list(copy_items):
+            try:
+                for _, destination in item.dirs:
+                    os.makedirs(destination, exist_ok=True)
+            except Exception as e:
+                self._fail(item, e)
+                copy_items.remove(item)
+
+        failed = self._copy_files(copy_items, meter, cancel_event)
+
+        # 폴더 속성은 내용 복사 후 적용 (하위 폴더부터), 이동이면 원본 폴더 제거
+        for item in copy_items:
+            if item in failed:
+                self._fail(item, failed[item])
+                continue
+            try:
+                for source, destination in reversed(item.dirs):
+                    shutil.copystat(source, destination)
+                if self.operation == "move" and item.dirs:
+                    shutil.rmtree(item.source)
+                item.done = True
+                self._discard_aside(item)
+            except Exception as e:
+                self._fail(item, e)
+        meter.report(force=True)
+
+    def _fail(self, item, error):
+        item.done = True
+        message = f"Error {self.operation}ing {item.source} to {item.destination}: {error}"
+        try:
+            kept = self._restore(item)
+        except OSError as e:
+            kept, message = item.aside, f"{message} (기존 항목 복원 실패: {e})"
+        if kept and kept != item.destination:
+            message += f" (기존 항목 보관 위치: {kept})"
+        self.errors.append(message)
+
+    def _restore(self, item):
+        """
+        끝내지 못한 항목의 덮어쓰기를 되돌리고 기존 항목이 남아 있는 경로를 반환합니다.
+        이미 일부 파일을 옮긴 이동 작업은 대상 폴더를 지우면 안 되므로 기존 항목을 보이는 이름으로 남깁니다.
+        """
+        if not item.aside:
+            return None
+        aside, item.aside = item.aside, None
+        moved = self.operation == "move" and any(dst in self.completed for _, dst, _ in item.files)
+        if moved and os.path.lexists(item.destination):
+            kept = unique_destination(item.destination)
+            os.rename(aside, kept)
+            return kept
+        for _, destination, _ in item.files:
+            part_path = destination + PART_SUFFIX
+            if os.path.exists(part_path):
+                os.remove(part_path)
+        if os.path.lexists(item.destination):
+            _remove(item.destination)
+        os.rename(aside, item.destination)
+        return item.destination
+
+    def abandon(self):
+        # 취소한 작업을 이어서 하지 않을 때 호출: 덮어쓰던 항목은 원래대로, 복사 중이던 임시 파일은 삭제
+        for item in self.items:
+            if not item.done:
+                self._restore(item)
+        for destination in list(self.partial):
+            part_path = destination + PART_SUFFIX
+            if os.path.exists(part_path):
+                os.remove(part_path)
+        self.partial.clear()
+
+    def _prepare_item(self, item, meter):
+        # 항목 사전 작업, 이름 변경만으로 끝났으면 True 반환
+        if item.conflict == CONFLICT_OVERWRITE and not item.prepared and os.path.lexists(item.destination):
+            # 파일을 같은 드라이브의 파일 위로 옮길 때는 os.replace가 원자적으로 교체하므로 그대로 진행
+            file_over_file = item.rename and not os.path.isdir(item.source) and not os.path.isdir(item.destination)
+            if not file_over_file:
+                # 기존 항목은 지우지 않고 옆으로 옮겨 두었다가 완료 후 삭제 (실패하면 복원)
+                item.aside = _aside_path(item.destination)
+                os.rename(item.destination, item.aside)
+        item.prepared = True
+
+        if item.rename:
+            try:
+                os.replace(item.source, item.destination)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # 같은 장치로 보였지만 이름 변경이 불가능한 경우(마운트 경계 등) 복사 후 삭제로 전환
+                item.rename = False
+                self._plan_item(item)
+                size = sum(size for _, _, size in item.files)
+                self.bytes_total += size
+                self.files_total += len(item.files) - 1
+                meter.add_totals(size, len(item.files) - 1)
+                return False
+            meter.file_done()
+            self._discard_aside(item)
+            return True
+        return False
+
+    def _discard_aside(self, item):
+        if item.aside:
+            _remove(item.aside)
+            item.aside = None
+
+    def _copy_files(self, items, meter, cancel_event):
+        """
+        남은 파일을 복사하고 실패한 항목 목록(항목 -> 첫 오류)을 반환합니다.
+        작은 파일은 열기/메타데이터 지연이 대부분이라 여러 스레드로 나누고,
+        큰 파일은 디스크를 번갈아 읽지 않도록 전용 작업자 하나가 순서대로 스트리밍합니다.
+        """
+        small, large = [], []
+        for item in items:
+            for source, destination, size in item.files:
+                if destination not in self.completed:
+                    (large if size >= self.large_file_size else small).append((item, source, destination, size))
+
+        failed = {}
+
+        def copy_one(entry):
+            item, source, destination, size = entry
+            if cancel_event.is_set():
+                raise TransferCancelled()
+            if item in failed:  # 이미 실패한 항목의 나머지 파일은 건너뜀
+                return
+            try:
+                meter.current = source
+                if os.path.islink(source):
+                    os.symlink(os.readlink(source), destination)
+                    meter.file_done()
+                elif size < self.large_file_size:
+                    # 작은 파일은 한 번에 복사 (임시 파일/이어받기 처리 비용이 복사 시간보다 큼)
+                    shutil.copy2(source, destination)
+                    meter.file_done(size=size)
+                else:
+                    self._copy_file(source, destination, meter, cancel_event)
+                    meter.file_done()
+                self.completed.add(destination)
+                if self.operation == "move":
+                    os.remove(source)
+            except TransferCancelled:
+                raise
+            except Exception as e:
+                failed.setdefault(item, e)
+
+        def copy_large():
+            for entry in large:
+                copy_one(entry)
+
+        # 파일마다 작업을 제출하지 않고 작업자들이 공유 목록에서 다음 파일을 가져감
+        # (파일 수만큼 Future를 만들고 기다리는 비용이 작은 파일의 복사 시간보다 큼)
+        pending = iter(small)
+        pending_lock = threading.Lock()
+
+        def copy_small():
+            while True:
+                with pending_lock:
+                    entry = next(pending, None)
+                if entry is None:
+                    return
+                copy_one(entry)
+
+        cancelled = False
+        with ThreadPoolExecutor(max_workers=1) as large_pool, \
+                ThreadPoolExecutor(max_workers=self.workers) as small_pool:
+            futures = [large_pool.submit(copy_large)] if large else []
+            futures += [small_pool.submit(copy_small) for _ in range(min(self.workers, len(small)))]
+            for future in as_completed(futures):
+                error = future.exception()
+                if isinstance(error, TransferCancelled):
+                    cancelled = True
+                elif error is not None:
+                    raise error
+        if cancelled:
+            raise TransferCancelled()
+        return failed
+
+    def _copy_file(self, source, destination, meter, cancel_event):
+        part_path = destination + PART_SUFFIX
+        offset = self.partial.get(destination, 0) if os.path.exists(part_path) else 0
+
+        src_fd = os.open(source, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            dst_fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0))
+            try:
+                os.ftruncate(dst_fd, offset)
+                while True:
+                    if cancel_event.is_set():
+                        self.partial[destination] = offset
+                        raise TransferCancelled()
+                    copied = _copy_range(src_fd, dst_fd, offset, self.chunk_size)
+                    if copied == 0:
+                        break
+                    offset += copied
+                    meter.add_bytes(copied)
+            finally:
+                os.close(dst_fd)
+        except TransferCancelled:
+            raise
+        except BaseException:
+            # 취소가 아닌 오류면 복사 중이던 파일 제거
+            self.partial.pop(destination, None)
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+        finally:
+            os.close(src_fd)
+
+        shutil.copystat(source, part_path)
+        os.replace(part_path, destination)
+        self.partial.pop(destination, None)
+
+
+class TransferThread(QThread):
+    progress = pyqtSignal(object)  # TransferProgress
+    finished = pyqtSignal(object)  # TransferJob (errors에 항목별 오류)
+    cancelled = pyqtSignal()
+    error = pyqtSignal(str)
+
+    def __init__(self, job):
+        super().__init__()
+        self.job = job
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        # 현재 청크까지만 복사하고 중단 (같은 작업으로 새 스레드를 만들면 이어서 진행)
+        self._cancel_event.set()
+
+    def run(self):
+        try:
+            self.job.run(self._cancel_event, self.progress.emit)
+            self.finished.emit(self.job)
+        except TransferCancelled:
+            self.cancelled.emit()
+        except Exception as e:
+            self.error.emit(str(e))
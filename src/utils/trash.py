@@ -0,0 +1,278 @@
+from concurrent.futures import ThreadPoolExecutor
+from PyQt5.QtCore import QThread, pyqtSignal
+import threading
+import errno
+import stat
+import time
+import uuid
+import os
+
+STAGING_NAME = ".safefile-trash"  # 드라이브마다 만드는 삭제 대기 폴더 이름
+PURGE_WORKERS = min(8, (os.cpu_count() or 1) * 2)  # 실제 삭제를 나눠 처리할 스레드 수
+UNDO_WINDOW = 5  # 삭제 후 되돌릴 수 있는 시간(초), 이후 실제 삭제 시작
+ORPHAN_AGE = UNDO_WINDOW + 120  # 다른 세션의 대기 폴더가 이 시간(초) 동안 바뀌지 않으면 남은 항목으로 보고 삭제
+HEARTBEAT_INTERVAL = 10  # 삭제 중 자기 세션 폴더의 수정 시간을 갱신하는 간격(초)
+
+# 실행 중인 프로그램마다 대기 폴더 안에 따로 쓰는 하위 폴더
+# (다른 실행의 되돌리기 대기 중인 항목을 지우지 않도록 자기 세션 폴더만 정리)
+SESSION_NAME = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+_staging_dirs = {}  # 장치 번호 -> 이 세션의 삭제 대기 폴더
+_lock = threading.Lock()
+
+
+def _hide(path):
+    # Windows에서는 점(.)으로 시작해도 숨김이 아니므로 숨김 속성 지정
+    if os.name == "nt":
+        import ctypes
+        ctypes.windll.kernel32.SetFileAttributesW(path, 0x2)  # FILE_ATTRIBUTE_HIDDEN
+
+
+def _staging_candidates(path):
+    # (같은 드라이브라면) 홈 폴더 → 원래 폴더 순으로 시도, 드라이브 최상위에는 만들지 않음
+    parent = os.path.dirname(path)
+    candidates = []
+    home = os.path.expanduser("~")
+    try:
+        if os.stat(home).st_dev == os.stat(parent).st_dev:
+            candidates.append(home)
+    except OSError:
+        pass
+    candidates.append(parent)
+    return [os.path.join(directory, STAGING_NAME) for directory in candidates]
+
+
+def staging_dir(path):
+    """
+    경로와 같은 드라이브에 있는 이 세션의 삭제 대기 폴더를 반환합니다. (없으면 생성)
+    같은 드라이브 안이라 대기 폴더로 옮기는 작업은 이름 변경만으로 끝납니다.
+    """
+    device = os.lstat(path).st_dev
+    with _lock:
+        if device in _staging_dirs:
+            return _staging_dirs[device]
+        for candidate in _staging_candidates(path):
+            session_dir = os.path.join(candidate, SESSION_NAME)
+            try:
+                os.makedirs(session_dir, exist_ok=True)
+                if os.stat(session_dir).st_dev != device or not os.access(session_dir, os.W_OK):
+                    continue
+            except OSError:
+                continue
+            _hide(candidate)
+            _staging_dirs[device] = session_dir
+            return session_dir
+    raise Exception(f"삭제 대기 폴더를 만들 수 없습니다: {path}")
+
+
+def _release_staging(session_dirs):
+    # 비운 세션 폴더와 (남은 세션이 없으면) 대기 폴더를 지워 사용자 폴더에 빈 폴더를 남기지 않음
+    with _lock:
+        for device, directory in list(_staging_dirs.items()):
+            if directory not in session_dirs:
+                continue
+            try:
+                os.rmdir(directory)
+            except OSError:
+                continue  # 다른 삭제 작업의 항목이 아직 남아 있음
+            del _staging_dirs[device]
+            try:
+                os.rmdir(os.path.dirname(directory))
+            except OSError:
+                pass  # 다른 실행의 세션 폴더가 남아 있음
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except PermissionError:
+        # 읽기 전용 파일은 쓰기 권한을 준 뒤 다시 삭제
+        os.chmod(path, stat.S_IWRITE)
+        os.remove(path)
+
+
+def _purge_tree(path, counter):
+    # os.scandir로 내려가며 파일을 지우고 하위 폴더부터 제거, 지운 항목 수를 counter로 보고
+    if os.path.islink(path) or not os.path.isdir(path):
+        _remove_file(path)
+        counter(1)
+        return
+    stack, dirs = [path], []
+    while stack:
+        current = stack.pop()
+        dirs.append(current)
+        removed = 0
+        with os.scandir(current) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    _remove_file(entry.path)
+                    removed += 1
+        counter(removed)
+    for directory in reversed(dirs):
+        os.rmdir(directory)
+        counter(1)
+
+
+class DeleteJob:
+    """
+    선택 항목을 먼저 같은 드라이브의 삭제 대기 폴더로 이름만 바꿔 옮기고(stage),
+    되돌리기(restore)가 없으면 백그라운드에서 실제로 삭제(purge)하는 작업입니다.
+    """
+    def __init__(self, paths):
+        self.paths = paths
+        self.staged = []  # (원래 경로, 대기 폴더 안 경로)
+        self.errors = []
+        self.removed = 0  # 실제로 삭제한 파일/폴더 수
+        self.purging = False
+
+    def stage(self):
+        # 이름 변경만 하므로 항목 크기와 관계없이 바로 끝남, 옮기지 못한 항목은 errors에 기록
+        for path in self.paths:
+            try:
+                self.staged.append((path, self._stage_one(path)))
+            except Exception as e:
+                self.errors.append(f"Error deleting {path}: {e}")
+        return self.staged
+
+    def _stage_one(self, path):
+        for attempt in range(2):
+            target = os.path.join(staging_dir(path), uuid.uuid4().hex)
+            try:
+                os.rename(path, target)
+                return target
+            except FileNotFoundError:
+                # 다른 삭제 작업이 빈 세션 폴더를 막 지운 경우 다시 만들어 한 번 더 시도
+                if attempt or not os.path.lexists(path):
+                    raise
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                # 대기 폴더와 다른 장치(폴더 안의 마운트 등)면 이름 변경 불가, 원래 자리에서 삭제
+                return path
+
+    def restore(self):
+        """
+        실제 삭제를 시작하기 전이면 모든 항목을 원래 경로로 되돌립니다.
+
+        Returns:
+            list[str]: 되돌리지 못한 항목에 대한 오류 메시지 목록
+        """
+        if self.purging:
+            raise Exception("이미 삭제를 시작해 되돌릴 수 없습니다.")
+        errors = []
+        for original, staged in self.staged:
+            if staged == original:
+                continue
+            try:
+                if os.path.lexists(original):
+                    raise FileExistsError(f"같은 이름의 항목이 이미 있습니다: {original}")
+                os.rename(staged, original)
+            except Exception as e:
+                errors.append(f"Error restoring {original}: {e}")
+        _release_staging({os.path.dirname(staged) for original, staged in self.staged if staged != original})
+        self.staged = []
+        return errors
+
+    def purge(self, callback=None, workers=PURGE_WORKERS):
+        """
+        대기 폴더로 옮긴 항목을 실제로 삭제합니다.
+        큰 폴더도 빨리 지워지도록 각 항목의 최상위 하위 항목을 스레드 풀에 나눠 맡기고,
+        비정상 종료 등으로 다른 세션 폴더에 남은 항목도 ORPHAN_AGE가 지났으면 함께 정리하고,
+        끝나면 비어 있는 세션 폴더와 대기 폴더를 지웁니다.
+
+        Args:
+            callback (callable, optional): 지금까지 삭제한 항목 수로 호출
+        """
+        self.purging = True
+        lock = threading.Lock()
+        originals = {staged: original for original, staged in self.staged}
+        session_dirs = {os.path.dirname(staged) for staged, original in originals.items() if staged != original}
+        last_touch = [time.monotonic()]
+
+        def counter(count):
+            with lock:
+                self.removed += count
+                removed = self.removed
+                # 오래 걸리는 삭제 중에도 다른 실행이 이 세션 폴더를 남은 항목으로 보지 않도록 수정 시간 갱신
+                touch = time.monotonic() - last_touch[0] >= HEARTBEAT_INTERVAL
+                if touch:
+                    last_touch[0] = time.monotonic()
+            if touch:
+                for directory in session_dirs:
+                    try:
+                        os.utime(directory)
+                    except OSError:
+                        pass
+            if callback and count:
+                callback(removed)
+
+        targets = list(originals) + self._orphans(session_dirs)
+
+        # 폴더 항목은 최상위 하위 항목 단위로 나눠 동시에 삭제한 뒤 빈 폴더 제거
+        units = {}  # 대상 -> 하위 항목 목록 (파일이면 자기 자신)
+        for target in targets:
+            try:
+                if os.path.isdir(target) and not os.path.islink(target):
+                    with os.scandir(target) as it:
+                        units[target] = [entry.path for entry in it]
+                else:
+                    units[target] = [target]
+            except OSError as e:
+                units[target] = e
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                target: [executor.submit(_purge_tree, path, counter) for path in paths]
+                for target, paths in units.items() if not isinstance(paths, Exception)
+            }
+            for target, paths in units.items():
+                error = paths if isinstance(paths, Exception) else None
+                for future in futures.get(target, []):
+                    error = error or future.exception()
+                if error is None and os.path.isdir(target) and not os.path.islink(target):
+                    try:
+                        os.rmdir(target)
+                        counter(1)
+                    except OSError as e:
+                        error = e
+                if error is not None and target in originals:
+                    self.errors.append(f"Error deleting {originals[target]}: {error}")
+        _release_staging(session_dirs)
+
+    def _orphans(self, session_dirs):
+        # 다른 세션 폴더 중 ORPHAN_AGE 동안 바뀌지 않은 것 (비정상 종료 등으로 남은 것)
+        # 아직 실행 중인 다른 세션은 되돌리기 대기·삭제 중에 폴더가 바뀌므로 건드리지 않음
+        orphans = []
+        now = time.time()
+        for staging_root in {os.path.dirname(directory) for directory in session_dirs}:
+            if os.path.basename(staging_root) != STAGING_NAME:
+                continue
+            try:
+                with os.scandir(staging_root) as it:
+                    for entry in it:
+                        if entry.name == SESSION_NAME or not entry.is_dir(follow_symlinks=False):
+                            continue
+                        if now - entry.stat(follow_symlinks=False).st_mtime > ORPHAN_AGE:
+                            orphans.append(entry.path)
+            except OSError:
+                continue
+        return orphans
+
+
+class DeleteThread(QThread):
+    progress = pyqtSignal(int)  # 지금까지 삭제한 항목 수
+    finished = pyqtSignal(object)  # DeleteJob (errors에 항목별 오류)
+    error = pyqtSignal(str)
+
+    def __init__(self, job):
+        super().__init__()
+        self.job = job
+
+    def run(self):
+        try:
+            self.job.purge(self.progress.emit)
+            self.finished.emit(self.job)
+        except Exception as e:
+            self.error.emit(str(e))
@@ -1,92 +1,324 @@
-from ctypes import cdll, c_char_p, c_bool, c_size_t, create_string_buffer
+from ctypes import c_char_p, c_bool, c_size_t, create_string_buffer
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
 from PyQt5.QtCore import QThread, pyqtSignal
+from utils.native.library import load_library
+from utils.scan_cache import VerdictCache, analysis_stats, classify
+from utils.walker import walk_files, FileEnumerator
+import threading
+import time
 import os
 
+# VirusTotal API 등급별 기본 분당 요청 수와 동시 요청 수 (0이면 제한 없음)
+# public: 공개 API 한도(분당 4회), premium: 계약마다 한도가 달라 분당 제한 없이 동시 요청 수로만 조절
+API_TIER_RATES = {"public": 4, "premium": 0}
+API_TIER_WORKERS = {"public": 4, "premium": 16}
+
+
+def scan_settings():
+    """
+    .env에서 읽은 검사 설정을 반환합니다. (ToolBar가 load_dotenv를 호출한 뒤에 읽도록 처음 검사할 때 확인)
+    VIRUSTOTAL_API_TIER(public / premium)로 기본값을 정하고,
+    VIRUSTOTAL_RATE_LIMIT(분당 요청 수)나 VIRUSTOTAL_SCAN_WORKERS(동시 요청 수)가 있으면 그 값을 사용합니다.
+
+    Returns:
+        tuple[float, int]: 분당 요청 수, 동시 요청 수
+    """
+    tier = os.environ.get("VIRUSTOTAL_API_TIER", "public").strip().lower()
+    if tier not in API_TIER_RATES:
+        raise ValueError(f"알 수 없는 VirusTotal API 등급입니다: {tier} (public 또는 premium)")
+    rate = float(os.environ.get("VIRUSTOTAL_RATE_LIMIT", API_TIER_RATES[tier]))
+    workers = int(os.environ.get("VIRUSTOTAL_SCAN_WORKERS", API_TIER_WORKERS[tier]))
+    return rate, max(1, workers)
+
 class VirusScanThread(QThread):
     finished = pyqtSignal(str)
     error = pyqtSignal(str)
-    progress = pyqtSignal(int, int)  # current, total
+    progress = pyqtSignal(int, int)  # current, total (폴더 탐색이 끝나기 전에는 지금까지 찾은 파일 수)
+    enumerated = pyqtSignal(int)  # 폴더 탐색 완료 시 전체 파일 수
+    file_scanned = pyqtSignal(object)  # ScanResult (파일마다 전달)
+    cancelled = pyqtSignal()
 
-    def __init__(self, path):
+    def __init__(self, path, max_workers=None, **walk_options):
+        # walk_options: include / exclude / max_size / symlinks (utils.walker.walk_files 참고)
         super().__init__()
         self.path = path
         self.is_folder = os.path.isdir(path)
+        self.max_workers = max_workers
+        self.walk_options = walk_options
+        self._cancel_event = threading.Event()
+        self._files = None
+
+    def cancel(self):
+        # 새 요청 제출과 폴더 탐색을 멈추고 진행 중인 요청이 끝나면 종료 (terminate 대신 사용)
+        self._cancel_event.set()
+        if self._files:
+            self._files.stop()
 
     def run(self):
         try:
             if self.is_folder:
-                result = scan_folder(self.path, self.progress)
+                # 탐색과 검사를 동시에 진행하며 레코드를 하나씩 전달, 완료 시에는 요약만 전달
+                files = self._files = FileEnumerator(self.path, on_finished=self.enumerated.emit, **self.walk_options).start()
+                counts = {}
+                try:
+                    records = iter_scan_files(files, self._cancel_event, self.max_workers)
+                    for current, record in enumerate(records, 1):
+                        counts[record.verdict] = counts.get(record.verdict, 0) + 1
+                        self.file_scanned.emit(record)
+                        self.progress.emit(current, max(files.discovered, current))
+                finally:
+                    files.stop()
+                result = summarize_counts(counts)
             else:
-                result = scan_file(self.path)
-            self.finished.emit(result)
+                record = scan_file_result(self.path)
+                self.file_scanned.emit(record)
+                result = record.summary()
+            if self._cancel_event.is_set():
+                self.cancelled.emit()
+            else:
+                self.finished.emit(result)
         except Exception as e:
             self.error.emit(str(e))
 
+class ScanResult:
+    # 파일 하나의 검사 결과 (verdict: clean / suspicious / malicious / unknown / error)
+    __slots__ = ("path", "verdict", "detected", "total", "elapsed", "cached", "message")
+
+    def __init__(self, path, verdict, detected=None, total=None, elapsed=0.0, cached=False, message=""):
+        self.path = path
+        self.verdict = verdict
+        self.detected = detected  # 악성으로 탐지한 엔진 수
+        self.total = total  # 결과를 낸 엔진 수
+        self.elapsed = elapsed  # 검사 소요 시간(초)
+        self.cached = cached
+        self.message = message
+
+    @classmethod
+    def from_raw(cls, path, raw_result, elapsed=0.0, cached=False):
+        stats = analysis_stats(raw_result)
+        if stats is None:
+            return cls(path, "unknown", elapsed=elapsed, cached=cached)
+        return cls(path, classify(raw_result), stats.get("malicious", 0), sum(stats.values()), elapsed, cached)
+
+    @classmethod
+    def failed(cls, path, message, elapsed=0.0):
+        return cls(path, "error", elapsed=elapsed, message=message)
+
+    @property
+    def is_threat(self):
+        return self.verdict in ("malicious", "suspicious")
+
+    def summary(self):
+        if self.verdict == "error":
+            return self.message
+        detected_engines = f"{self.detected}/{self.total}" if self.total is not None else "알 수 없음"
+        is_safe = "위험 있음" if self.is_threat else "위험 없음"
+        return (
+            f"파일 이름: {os.path.basename(self.path)}\n"
+            f"탐지된 엔진: {detected_engines}\n"
+            f"검사 상태: {is_safe}"
+        )
+
+def summarize_counts(counts):
+    # 폴더 검사 결과 요약 문자열
+    total = sum(counts.values())
+    threats = counts.get("malicious", 0) + counts.get("suspicious", 0)
+    return (
+        f"검사한 파일: {total}개\n"
+        f"위험 발견: {threats}개\n"
+        f"검사 실패: {counts.get('error', 0)}개"
+    )
+
+class RateLimiter:
+    # 토큰 버킷 방식의 요청 빈도 제한 (여러 검사 스레드가 같은 할당량을 공유)
+    def __init__(self, rate_per_minute, burst=None):
+        self.rate_per_minute = rate_per_minute
+        self.rate = rate_per_minute / 60.0
+        self.capacity = burst or max(1, int(rate_per_minute))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self, cancel_event=None):
+        # 요청 한 번을 허용받을 때까지 대기, 취소되면 False 반환
+        while not (cancel_event and cancel_event.is_set()):
+            if self.rate <= 0:
+                return True
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return True
+                delay = (1 - self.tokens) / self.rate
+            if cancel_event:
+                cancel_event.wait(delay)
+            else:
+                time.sleep(delay)
+        return False
+
+    def estimate(self, count):
+        # 요청 count번을 모두 허용받기까지 걸리는 최소 시간(초), 제한이 없으면 None
+        if self.rate <= 0:
+            return None
+        with self.lock:
+            tokens = min(self.capacity, self.tokens + (time.monotonic() - self.updated) * self.rate)
+        return max(0.0, (count - tokens) / self.rate)
+
+_rate_limiter = None
+_limiter_lock = threading.Lock()
+
+def get_rate_limiter():
+    # 모든 검사가 같은 할당량을 쓰도록 하나만 만들고, .env를 읽은 뒤인 처음 사용할 때 설정을 확인
+    global _rate_limiter
+    with _limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter(scan_settings()[0])
+        return _rate_limiter
+
+_verdict_cache = None
+_cache_lock = threading.Lock()
+
+def get_verdict_cache():
+    # 검사 결과 캐시는 처음 사용할 때 한 번만 연결 (hit_ratio()로 적중률 확인)
+    global _verdict_cache
+    with _cache_lock:
+        if _verdict_cache is None:
+            _verdict_cache = VerdictCache(os.path.join(os.path.dirname(__file__), "setting", "scan_cache.db"))
+        return _verdict_cache
+
 def load_virus_scan_dll():
-    # 절대 경로 설정
-    dll_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'dll', 'vrsapi1.dll')
-    
+    # 공유 레지스트리에서 DLL을 한 번만 로드하고 함수 원형도 한 번만 설정
     try:
-        print(f"DLL 로드 시도: {dll_path}")
-        if os.path.exists(dll_path):
-            print(f"파일 존재 확인됨: {dll_path}")
-            dll = cdll.LoadLibrary(dll_path)
-            print(f"DLL 로드 성공: {dll_path}")
-            return dll
-        else:
-            print(f"파일이 존재하지 않음: {dll_path}")
-            raise FileNotFoundError(f"DLL 파일을 찾을 수 없습니다: {dll_path}")
+        dll = load_library("vrsapi1.dll")
     except Exception as e:
         print(f"DLL 로드 실패: {str(e)}")
         return None
+    dll.bind("scan_file_virustotal", c_bool, [c_char_p, c_char_p, c_size_t])
+    return dll
+
+def scan_file(file_path, use_cache=True):
+    return scan_file_result(file_path, use_cache).summary()
 
-def scan_file(file_path):
+def scan_file_result(file_path, use_cache=True):
+    # 같은 내용의 파일을 검사한 기록이 유효하면 엔진에 다시 요청하지 않음
+    cache = get_verdict_cache() if use_cache else None
+    digest = None
+    if cache:
+        started = time.perf_counter()
+        raw_result, digest = cache.lookup(file_path)
+        if raw_result is not None:
+            return ScanResult.from_raw(file_path, raw_result, time.perf_counter() - started, cached=True)
+    return _scan_with_engine(file_path, cache, digest)
+
+def _scan_with_engine(file_path, cache=None, digest=None):
+    started = time.perf_counter()
     dll = load_virus_scan_dll()
     if not dll:
-        return "DLL 로드 실패"
+        return ScanResult.failed(file_path, "DLL 로드 실패")
 
     result_buffer = create_string_buffer(4096)
     file_path_bytes = file_path.encode('utf-8')
 
-    scan_file_func = dll.scan_file_virustotal
-    scan_file_func.argtypes = [c_char_p, c_char_p, c_size_t]
-    scan_file_func.restype = c_bool
-
-    success = scan_file_func(file_path_bytes, result_buffer, 4096)
+    success = dll.scan_file_virustotal(file_path_bytes, result_buffer, 4096)
+    elapsed = time.perf_counter() - started
 
     if success:
         result = result_buffer.value.decode('utf-8')
-        return simplify_result(file_path, result)
+        if cache and digest:
+            cache.store(digest, result)
+        return ScanResult.from_raw(file_path, result, elapsed)
     else:
         error_msg = result_buffer.value.decode('utf-8', errors='replace')
-        return f"검사 실패: {error_msg}"
-
-def scan_folder(folder_path, progress_callback=None):
-    all_files = [
-        os.path.join(root, file)
-        for root, _, files in os.walk(folder_path) for file in files
-    ]
-    
-    results = []
-    total_files = len(all_files)
+        return ScanResult.failed(file_path, f"검사 실패: {error_msg}", elapsed)
+
+def _batches(files, size):
+    # 탐색 중인 FileEnumerator는 준비된 만큼씩, 일반 반복자는 size개씩 나눔
+    if hasattr(files, "batches"):
+        yield from files.batches(size)
+        return
+    file_iter = iter(files)
+    while True:
+        batch = list(islice(file_iter, size))
+        if not batch:
+            return
+        yield batch
+
+def iter_scan_files(files, cancel_event=None, max_workers=None, limiter=None, use_cache=True):
+    # 검사가 끝나는 순서대로 ScanResult를 하나씩 생성 (files는 리스트뿐 아니라 탐색 중인 반복자도 가능, 취소되면 남은 파일은 건너뜀)
+    max_workers = max_workers or scan_settings()[1]
+    limiter = limiter or get_rate_limiter()
+    cancel_event = cancel_event or threading.Event()
+    cache = get_verdict_cache() if use_cache else None
 
-    for i, file_path in enumerate(all_files, 1):
+    def scan(file_path, digest):
+        if not limiter.acquire(cancel_event):
+            return None
+        try:
+            return _scan_with_engine(file_path, cache, digest)
+        except Exception as e:
+            return ScanResult.failed(file_path, f"파일 이름: {os.path.basename(file_path)}\n검사 실패: {e}")
+
+    def lookup_files():
+        # 캐시 조회는 묶어서 처리하고, 묶음마다 적중한 파일은 ScanResult로, 나머지는 (경로, 해시)로 바로 넘김
+        # (적중 결과를 따로 모아 두지 않으므로 캐시에 있는 파일이 이어져도 메모리가 늘지 않음)
+        for batch in _batches(files, VerdictCache.BATCH_SIZE):
+            if cancel_event.is_set():
+                return
+            started = time.perf_counter()
+            hits, digests = cache.lookup_many(batch) if cache else ({}, {})
+            elapsed = (time.perf_counter() - started) / len(batch)
+            for file_path in batch:
+                if file_path in hits:
+                    yield ScanResult.from_raw(file_path, hits[file_path], elapsed, cached=True)
+                else:
+                    yield file_path, digests.get(file_path)
+
+    # 동시에 진행 중인 요청을 max_workers개로 제한하면서 끝나는 순서대로 결과 전달
+    pending = {}
+    queue = lookup_files()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        try:
+            while True:
+                while not cancel_event.is_set() and len(pending) < max_workers:
+                    item = next(queue, None)
+                    if item is None:
+                        break
+                    if isinstance(item, ScanResult):  # 캐시 적중
+                        yield item
+                        continue
+                    pending[executor.submit(scan, *item)] = item[0]
+                if not pending:
+                    break
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del pending[future]
+                    record = future.result()
+                    if record is not None:  # None: 취소되어 검사하지 않은 파일
+                        yield record
+        except GeneratorExit:
+            # 소비자가 중간에 멈추면 대기 중인 요청이 바로 끝나도록 취소
+            cancel_event.set()
+            raise
+
+def scan_folder(folder_path, progress_callback=None, result_callback=None, cancel_event=None, max_workers=None, limiter=None, use_cache=True):
+    # 이전 방식 호환용: 전체 결과를 폴더 순서대로 이어붙인 문자열 반환
+    all_files = [file_path for file_path, _ in walk_files(folder_path)]
+    total_files = len(all_files)
+    summaries = {}
+    records = iter_scan_files(all_files, cancel_event, max_workers, limiter, use_cache)
+    for current, record in enumerate(records, 1):
+        summaries[record.path] = record.summary()
+        if result_callback:
+            result_callback.emit(record)
         if progress_callback:
-            progress_callback.emit(i, total_files)
-        
-        result = scan_file(file_path)
-        results.append(result)
+            progress_callback.emit(current, total_files)
 
-    return "\n\n".join(results)
+    return "\n\n".join(summaries[file_path] for file_path in all_files if file_path in summaries)
 
 def simplify_result(file_path, raw_result):
     """검사 결과를 간소화"""
-    # raw_result 파싱 로직 구현 필요
-    detected_engines = "0/70"  # 실제 결과에서 파싱 필요
-    is_safe = "위험 없음" if "0/70" in detected_engines else "위험 있음"
-    
-    return (
-        f"파일 이름: {os.path.basename(file_path)}\n"
-        f"탐지된 엔진: {detected_engines}\n"
-        f"검사 상태: {is_safe}"
-    ) 
\ No newline at end of file
+    return ScanResult.from_raw(file_path, raw_result).summary()
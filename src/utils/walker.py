@@ -0,0 +1,149 @@
+from fnmatch import fnmatch
+import threading
+import queue
+import os
+
+# 심볼릭 링크 처리 방식
+# skip: 링크는 모두 건너뜀 / files: 파일 링크만 따라감 / follow: 폴더 링크도 따라감(순환 방지)
+SYMLINK_POLICIES = ("skip", "files", "follow")
+
+
+def _matches(name, patterns):
+    return any(fnmatch(name, pattern) for pattern in patterns)
+
+
+def walk_files(root, include=None, exclude=None, max_size=None, symlinks="skip"):
+    """
+    os.scandir로 폴더를 탐색하며 조건에 맞는 파일을 (경로, 크기)로 하나씩 반환합니다.
+    DirEntry에 들어 있는 stat 정보를 그대로 사용하고, 제외 패턴에 맞는 폴더는 내려가지 않습니다.
+
+    Args:
+        root (str): 탐색할 폴더 경로
+        include (list[str], optional): 포함할 파일 이름 패턴 (없으면 모두 포함)
+        exclude (list[str], optional): 제외할 파일/폴더 이름 패턴
+        max_size (int, optional): 이 크기(바이트)보다 큰 파일은 건너뜀
+        symlinks (str): 심볼릭 링크 처리 방식 (SYMLINK_POLICIES)
+    """
+    if symlinks not in SYMLINK_POLICIES:
+        raise ValueError(f"알 수 없는 심볼릭 링크 처리 방식: {symlinks}")
+    include = include or []
+    exclude = exclude or []
+    visited = set()  # follow 모드에서 이미 방문한 폴더 (장치, inode)
+    stack = [root]
+
+    while stack:
+        current = stack.pop()
+        try:
+            if symlinks == "follow":
+                st = os.stat(current)
+                key = (st.st_dev, st.st_ino)
+                if key in visited:
+                    continue
+                visited.add(key)
+            with os.scandir(current) as it:
+                entries = list(it)
+        except OSError:
+            continue  # 접근할 수 없는 폴더는 건너뜀
+
+        subdirs = []
+        for entry in entries:
+            if exclude and _matches(entry.name, exclude):
+                continue
+            try:
+                is_link = entry.is_symlink()
+                if is_link and symlinks == "skip":
+                    continue
+                if entry.is_dir(follow_symlinks=symlinks == "follow"):
+                    subdirs.append(entry.path)
+                    continue
+                if not entry.is_file(follow_symlinks=True):
+                    continue
+                if include and not _matches(entry.name, include):
+                    continue
+                size = entry.stat(follow_symlinks=True).st_size
+            except OSError:
+                continue
+            if max_size is not None and size > max_size:
+                continue
+            yield entry.path, size
+
+        # 이름 순서대로 내려가도록 역순으로 쌓음
+        stack.extend(reversed(subdirs))
+
+
+def has_files(root, **options):
+    # 조건에 맞는 파일이 하나라도 있으면 바로 True (전체 탐색 없음)
+    return next(walk_files(root, **options), None) is not None
+
+
+class FileEnumerator:
+    """
+    별도 스레드에서 walk_files를 실행하며 찾은 파일 경로를 순서대로 넘겨주는 반복자입니다.
+    탐색과 처리를 동시에 진행하고, 지금까지 찾은 파일 수(discovered)를 예상 전체 개수로 제공합니다.
+    """
+    _DONE = object()
+
+    def __init__(self, root, max_pending=10000, on_finished=None, **options):
+        self.root = root
+        self.options = options
+        self.on_finished = on_finished  # 탐색이 끝나면 전체 파일 수로 호출
+        self.discovered = 0
+        self.finished = False  # 탐색 완료 여부 (True면 discovered가 최종 개수)
+        self._queue = queue.Queue(maxsize=max_pending)  # 처리 대기 중인 경로 수 제한
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self):
+        try:
+            for path, _ in walk_files(self.root, **self.options):
+                self.discovered += 1
+                if not self._put(path):
+                    return
+            self.finished = True
+            if self.on_finished:
+                self.on_finished(self.discovered)
+        finally:
+            self._put(self._DONE)
+
+    def batches(self, size):
+        # 첫 경로가 나올 때까지만 기다리고, 이미 찾아 둔 경로는 최대 size개까지 한꺼번에 반환
+        batch = []
+        for path in self:
+            batch.append(path)
+            while len(batch) < size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is self._DONE:
+                    yield batch
+                    return
+                batch.append(item)
+            yield batch
+            batch = []
+
+    def __iter__(self):
+        while not self._stop.is_set():
+            try:
+                item = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is self._DONE:
+                return
+            yield item
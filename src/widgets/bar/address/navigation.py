@@ -7,6 +7,18 @@ import os
 from utils.secure import SecureFolderManager
 from typing import List, Optional
 
+HISTORY_LIMIT = 100  # 보관하는 방문 기록 수
+VIEW_STATE_LIMIT = 20  # 화면 상태(정렬·스크롤·선택)를 보관하는 기록 수 (현재 위치에서 가까운 기록 우선)
+
+
+class HistoryEntry:
+    """방문 기록 한 건과 그 폴더를 떠날 때의 화면 상태"""
+    __slots__ = ("path", "view_state")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.view_state: Optional[dict] = None
+
 
 class NavigationWidget(QWidget):
     """
@@ -37,7 +49,7 @@ class NavigationWidget(QWidget):
         self.layout.setSpacing(5)
 
         # 히스토리 관리 변수 초기화
-        self.history: List[str] = []
+        self.history: List[HistoryEntry] = []
         self.current_index: int = -1
 
         # 내비게이션 버튼 생성
@@ -125,14 +137,26 @@ class NavigationWidget(QWidget):
         """
         self.back_button.setEnabled(self.current_index > 0)
         self.forward_button.setEnabled(self.current_index < len(self.history) - 1)
+        self.prefetch_neighbours()
+
+    def prefetch_neighbours(self) -> None:
+        """
+        뒤로 가기·앞으로 가기로 열 기록의 폴더를 미리 읽어 둡니다.
+        """
+        file_list = self.get_file_list()
+        if file_list:
+            neighbours = [self.history[i].path for i in (self.current_index - 1, self.current_index + 1)
+                          if 0 <= i < len(self.history)]
+            file_list.prefetch(neighbours)
 
     def go_back(self) -> None:
         """
         히스토리에서 이전 경로로 이동합니다.
         """
         if self.current_index > 0:
+            self.save_view_state()
             self.current_index -= 1
-            path = self.history[self.current_index]
+            path = self.history[self.current_index].path
             secure_folder_path = (
                 os.path.normpath(self.secure_manager.secure_folder_path)
                 if self.secure_manager else None
@@ -153,9 +177,7 @@ class NavigationWidget(QWidget):
                 )
 
             # 경로 이동 처리
-            file_list = self.get_file_list()
-            if file_list:
-                file_list.set_current_path(path)
+            self.open_entry(self.history[self.current_index])
             self.update_button_states()
 
     def go_forward(self) -> None:
@@ -163,8 +185,9 @@ class NavigationWidget(QWidget):
         히스토리에서 다음 경로로 이동합니다.
         """
         if self.current_index < len(self.history) - 1:
+            self.save_view_state()
             self.current_index += 1
-            path = self.history[self.current_index]
+            path = self.history[self.current_index].path
             secure_folder_path = (
                 os.path.normpath(self.secure_manager.secure_folder_path)
                 if self.secure_manager else None
@@ -182,9 +205,7 @@ class NavigationWidget(QWidget):
                     return  # 이동 중단
 
             # 경로 이동 처리
-            file_list = self.get_file_list()
-            if file_list:
-                file_list.set_current_path(path)
+            self.open_entry(self.history[self.current_index])
             self.update_button_states()
 
     def go_up(self) -> None:
@@ -236,15 +257,57 @@ class NavigationWidget(QWidget):
                 current_path = file_list.get_current_path()
                 file_list.set_current_path(current_path)
 
+    def save_view_state(self) -> None:
+        """
+        현재 기록에 지금 화면의 정렬·스크롤·선택 상태를 저장합니다.
+        상태를 가진 기록이 VIEW_STATE_LIMIT개를 넘으면 현재 위치에서 먼 기록의 상태부터 버립니다.
+        """
+        file_list = self.get_file_list()
+        if not file_list or not 0 <= self.current_index < len(self.history):
+            return
+        entry = self.history[self.current_index]
+        if os.path.normcase(os.path.normpath(file_list.get_current_path())) != os.path.normcase(entry.path):
+            return
+        entry.view_state = file_list.save_view_state()
+
+        saved = [i for i, item in enumerate(self.history) if item.view_state is not None]
+        saved.sort(key=lambda i: abs(i - self.current_index))
+        for i in saved[VIEW_STATE_LIMIT:]:
+            self.history[i].view_state = None
+
+    def open_entry(self, entry: HistoryEntry) -> None:
+        """
+        기록의 폴더로 이동합니다.
+        폴더 목록은 모델에 남아 있는 내용으로 바로 표시되고 디스크와의 차이는 백그라운드에서 반영되며,
+        저장해 둔 화면 상태가 있으면 함께 복원합니다.
+
+        Args:
+            entry (HistoryEntry): 이동할 기록입니다.
+        """
+        file_list = self.get_file_list()
+        if not file_list:
+            return
+        file_list.set_current_path(entry.path)
+        if entry.view_state and os.path.normcase(os.path.normpath(file_list.get_current_path())) == os.path.normcase(entry.path):
+            file_list.restore_view_state(entry.view_state)
+
     def add_to_history(self, path: str) -> None:
         """
         주어진 경로를 히스토리에 추가합니다.
+        현재 기록과 같은 경로면 추가하지 않고, HISTORY_LIMIT개를 넘으면 가장 오래된 기록부터 버립니다.
 
         Args:
             path (str): 추가할 경로입니다.
         """
+        path = os.path.normpath(path)
+        if 0 <= self.current_index < len(self.history):
+            if os.path.normcase(self.history[self.current_index].path) == os.path.normcase(path):
+                return
+            self.save_view_state()
         # 현재 위치 이후의 기록 삭제
         self.history = self.history[:self.current_index + 1]
-        self.history.append(path)
-        self.current_index += 1
-        self.update_button_states()
\ No newline at end of file
+        self.history.append(HistoryEntry(path))
+        if len(self.history) > HISTORY_LIMIT:
+            del self.history[:len(self.history) - HISTORY_LIMIT]
+        self.current_index = len(self.history) - 1
+        self.update_button_states()
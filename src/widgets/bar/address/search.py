@@ -1,18 +1,23 @@
-from PyQt5.QtWidgets import QWidget, QLineEdit, QHBoxLayout, QPushButton, QSizePolicy
+from PyQt5.QtWidgets import QWidget, QLineEdit, QHBoxLayout, QPushButton, QSizePolicy, QMessageBox
 from PyQt5.QtGui import QPixmap, QIcon
-from PyQt5.QtCore import QSize
+from PyQt5.QtCore import QSize, QTimer
 from utils.load import load_stylesheet, image_base_path
-from ...file.file_search import file_search
+from utils.search import SearchThread
+from ...file.search_backend import get_search_backend
 from ... import global_variable
 from os.path import join  # 이 임포트는 사용되지 않습니다. 필요 시 제거를 고려해주세요.
+import logging
 import os
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 
 class SearchBar(QWidget):
     """
     파일 검색 기능을 제공하는 검색 바 위젯입니다.
     """
+    DEBOUNCE_INTERVAL = 300  # 입력이 멈춘 뒤 검색을 시작하기까지의 시간(ms)
 
     def __init__(self, parent: QWidget = None) -> None:
         """
@@ -33,8 +38,19 @@ class SearchBar(QWidget):
         self.search_input.setPlaceholderText("검색")
         self.search_input.setStyleSheet("border: none;")
         self.search_input.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
+        self.search_input.textChanged.connect(self.on_text_changed)
+        self.search_input.returnPressed.connect(self.on_search)
         self.layout.addWidget(self.search_input)
 
+        # 입력 중에는 검색하지 않고, 입력이 멈추면 검색 (이전 검색은 취소)
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(self.DEBOUNCE_INTERVAL)
+        self.debounce_timer.timeout.connect(lambda: self.start_search(explicit=False))
+        self.search_thread = None
+        self.search_threads = set()  # 취소했지만 아직 끝나지 않은 스레드도 끝날 때까지 참조 유지
+        self.search_id = 0
+
         self.search_button = QPushButton(self)
         self.search_button.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Preferred)
         self.search_button.clicked.connect(self.on_search)
@@ -56,18 +72,88 @@ class SearchBar(QWidget):
 
     def on_search(self) -> None:
         """
-        검색 버튼 클릭 시 호출되어 파일 검색을 수행합니다.
+        검색 버튼 클릭 또는 Enter 입력 시 호출되어 바로 파일 검색을 시작합니다.
+        """
+        self.debounce_timer.stop()
+        self.start_search(explicit=True)
+
+    def on_text_changed(self, text: str) -> None:
+        """
+        검색어가 바뀔 때마다 호출되어 입력이 멈춘 뒤 검색하도록 예약합니다.
+        """
+        if text:
+            self.debounce_timer.start()
+        else:
+            self.debounce_timer.stop()
+            self.cancel_search()
+
+    def start_search(self, explicit: bool = False) -> None:
+        """
+        진행 중인 검색을 취소하고 백그라운드에서 새 검색을 시작합니다.
+        결과는 묶음 단위로 검색 결과 목록에 추가됩니다.
+
+        Args:
+            explicit (bool): 사용자가 직접 검색을 요청했는지 여부 (오류를 메시지 창으로 표시)
         """
         filename = self.search_input.text()
         if not filename: ###수정
             return
         directory = global_variable.GLOBAL_CURRENT_PATH
 
-        for path in file_search(directory, filename):
-            self.parent.search_result_addItem(path)
-
+        self.cancel_search()
+        self.search_id += 1
+        self.explicit_search = explicit
+        self.parent.clear_search_result()
         self.parent.show_search_results()
 
+        self.search_thread = SearchThread(self.search_id, directory, filename, get_search_backend().search)
+        thread = self.search_thread
+        thread.results.connect(self.on_search_results)
+        thread.error.connect(self.on_search_error)
+        thread.finished.connect(lambda *_: self.on_thread_done(thread))
+        thread.cancelled.connect(lambda *_: self.on_thread_done(thread))
+        thread.error.connect(lambda *_: self.on_thread_done(thread))
+        self.search_threads.add(thread)
+        thread.start()
+
+    def on_thread_done(self, thread: SearchThread) -> None:
+        """
+        검색 스레드가 끝났을 때 정리합니다.
+        """
+        thread.wait()
+        self.search_threads.discard(thread)
+        thread.deleteLater()
+        if thread is self.search_thread:
+            self.search_thread = None
+
+    def cancel_search(self) -> None:
+        """
+        진행 중인 검색을 취소합니다. (늦게 도착한 결과는 검색 번호로 걸러냄)
+        """
+        if self.search_thread is not None:
+            self.search_thread.cancel()
+            self.search_thread = None
+        self.search_id += 1
+
+    def on_search_results(self, search_id: int, records: list) -> None:
+        """
+        검색 스레드가 넘겨준 결과 묶음을 검색 결과 목록에 추가합니다.
+        """
+        if search_id == self.search_id:
+            self.parent.search_result_addRecords(records)
+
+    def on_search_error(self, search_id: int, error_message: str) -> None:
+        """
+        검색 중 오류가 발생했을 때 호출됩니다.
+        """
+        if search_id != self.search_id:
+            return
+        if self.explicit_search:
+            QMessageBox.warning(self, "검색 오류", f"검색 중 오류가 발생했습니다:\n{error_message}")
+        else:
+            # 입력 중 자동 검색의 오류는 창을 띄우지 않고 로그로만 남김
+            logger.warning("검색 중 오류가 발생했습니다: %s", error_message)
+
     def show_file_info(self, file_path: str) -> None:
         """
         파일 정보를 부모 위젯에 표시합니다.
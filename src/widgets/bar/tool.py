@@ -8,6 +8,11 @@ from PyQt5.QtCore import QSize
 from utils.load import load_stylesheet, image_base_path
 from utils.analysis import analyze_file
 from utils.virus_scan import VirusScanThread
+from utils.walker import has_files
+from widgets.file.scan_result_table import ScanResultDialog
+from utils.trash import DeleteJob
+from widgets.file.delete_dialog import DeleteDialog
+from widgets.file.lock_check import confirm_lock_space
 from dotenv import load_dotenv
 import os
 from utils.secure import TaskRunner
@@ -174,15 +179,13 @@ class ToolBar(QWidget):
 
         file_path = file_list.model.filePath(current_index)
         
-        size_in_bytes = self.get_size(file_path)
         if self.secure_manager.pwd_mgr.AESkey is None:  # None으로 체크
             QMessageBox.warning(self, "Error", "AES 키가 설정되지 않았습니다.")
             return  # 키가 없으면 더 이상 실행하지 않음
-        
-        size_limit = 5 * 1024**3  # 5GB
-        if size_in_bytes > size_limit:
-            QMessageBox.warning(self, "Error", "파일 또는 폴더 크기가 5GB를 초과하여 작업을 수행할 수 없습니다.")
-            return  # 크기 초과 시 실행 중단
+
+        # 보안 폴더 드라이브의 여유 공간 확인 (부족하거나 확인하지 못해 사용자가 취소하면 중단)
+        if not confirm_lock_space(self, self.secure_manager, file_path):
+            return
 
         # 인증 여부 확인
         if not self.secure_manager.authenticated:
@@ -292,8 +295,7 @@ class ToolBar(QWidget):
             old_path = model.filePath(index)
             new_path = os.path.join(os.path.dirname(old_path), new_name)
             try:
-                os.rename(old_path, new_path)
-                model.setRootPath(model.rootPath())
+                os.rename(old_path, new_path)  # 뷰는 폴더 감시로 갱신됨
             except OSError as e:
                 self.show_error_message("오류", f"이름 변경 중 오류가 발생했습니다: {str(e)}")
         self.remove_inline_widget()
@@ -333,18 +335,9 @@ class ToolBar(QWidget):
 
         message_box.exec_()
         if message_box.clickedButton() == yes_button:
-            try:
-                if is_dir:
-                    import shutil
-                    shutil.rmtree(file_path)
-                else:
-                    os.remove(file_path)
-                
-                file_list.model.setRootPath(file_list.model.rootPath())
-
-                self.show_message_with_icon("삭제 완료", f"선택한 {'폴더' if is_dir else '파일'}이 성공적으로 삭제되었습니다.", "delete.png")
-            except OSError as e:
-                self.show_error_message("오류", f"삭제 중 오류가 발생했습니다: {str(e)}")
+            # 삭제 대기 폴더로 바로 옮기고(실행 취소 가능) 실제 삭제는 백그라운드에서 진행
+            delete_dialog = DeleteDialog(DeleteJob([file_path]), self)
+            delete_dialog.start()
         else:
             self.show_message_with_icon("취소", "삭제 작업이 취소되었습니다.", "delete.png")
 
@@ -385,11 +378,8 @@ class ToolBar(QWidget):
         path = file_list.model.filePath(current_index)
 
         if file_list.model.isDir(current_index):
-            
-            folder_content = os.listdir(path)
-            files_only = [f for f in folder_content if os.path.isfile(os.path.join(path, f))]
-
-            if not files_only:
+            # 하위 폴더까지 검사하므로 파일을 하나 찾는 즉시 확인 종료
+            if not has_files(path):
                 self.show_info_message("정보", "선택한 폴더에 파일이 없습니다.")
                 return
 
@@ -403,6 +393,11 @@ class ToolBar(QWidget):
         Args:
             path (str): 검사할 파일 또는 폴더의 경로입니다.
         """
+        # 폴더는 결과를 표로 실시간 표시
+        if os.path.isdir(path):
+            ScanResultDialog(path, self).start()
+            return
+
         self.progress_dialog = QProgressDialog("검사 중...", "취소", 0, 100, self)
         self.progress_dialog.setWindowTitle("바이러스 검사")
         self.progress_dialog.setWindowModality(True)
@@ -412,7 +407,7 @@ class ToolBar(QWidget):
         self.scan_thread.error.connect(self.on_scan_error)
         self.scan_thread.progress.connect(self.update_progress)
 
-        self.progress_dialog.canceled.connect(self.scan_thread.terminate)
+        self.progress_dialog.canceled.connect(self.scan_thread.cancel)
         self.scan_thread.start()
         self.progress_dialog.show()
 
@@ -506,21 +501,3 @@ class ToolBar(QWidget):
 
         message_box.exec_()
         return message_box.clickedButton() == yes_button
-
-
-
-
-    def get_size(self,path):
-        """파일 또는 폴더 크기를 계산"""
-        if os.path.isfile(path):
-            return os.path.getsize(path)  
-        elif os.path.isdir(path):
-            total_size = 0
-            for dirpath, dirnames, filenames in os.walk(path):
-                for filename in filenames:
-                    file_path = os.path.join(dirpath, filename)
-                    if not os.path.islink(file_path):
-                        total_size += os.path.getsize(file_path)
-            return total_size  
-        else:
-            raise ValueError(f"Invalid path: {path} is neither a file nor a folder.")
@@ -0,0 +1,120 @@
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, QPushButton, QMessageBox
+from PyQt5.QtCore import Qt, QTimer
+from utils.trash import DeleteThread, UNDO_WINDOW
+
+class DeleteDialog(QDialog):
+    """삭제한 항목을 잠시 되돌릴 수 있게 하고, 이후 백그라운드 삭제 진행 상황을 표시하는 창"""
+    def __init__(self, job, parent=None) -> None:
+        super().__init__(parent)
+        self.job = job
+        self.thread = None
+        self.remaining = UNDO_WINDOW
+        self.setWindowTitle("삭제")
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.resize(420, 120)
+
+        self.status_label = QLabel("")
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.hide()
+
+        self.undo_button = QPushButton("실행 취소")
+        self.undo_button.clicked.connect(self.undo)
+        self.close_button = QPushButton("닫기")
+        self.close_button.clicked.connect(self.close)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        button_layout.addWidget(self.undo_button)
+        button_layout.addWidget(self.close_button)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.status_label)
+        layout.addWidget(self.progress_bar)
+        layout.addLayout(button_layout)
+
+        # 되돌리기 대기 시간이 지나면 실제 삭제 시작
+        self.countdown = QTimer(self)
+        self.countdown.setInterval(1000)
+        self.countdown.timeout.connect(self.tick)
+
+    def start(self) -> None:
+        """항목을 삭제 대기 폴더로 옮기고 되돌리기 대기 시간을 시작합니다."""
+        staged = self.job.stage()
+        if self.job.errors:
+            QMessageBox.critical(self.parentWidget(), "Delete Error", "\n".join(self.job.errors))
+            self.job.errors = []
+        if not staged:
+            self.close()
+            return
+        self.staged_count = len(staged)
+        self.update_countdown()
+        self.countdown.start()
+        self.show()
+
+    def update_countdown(self) -> None:
+        self.status_label.setText(
+            f"{self.staged_count}개 항목을 삭제했습니다. {self.remaining}초 안에 실행 취소할 수 있습니다."
+        )
+
+    def tick(self) -> None:
+        """1초마다 호출되어 남은 시간을 줄이고, 0이 되면 실제 삭제를 시작합니다."""
+        self.remaining -= 1
+        if self.remaining > 0:
+            self.update_countdown()
+        else:
+            self.purge()
+
+    def undo(self) -> None:
+        """삭제한 항목을 원래 위치로 되돌립니다."""
+        self.countdown.stop()
+        errors = self.job.restore()
+        if errors:
+            QMessageBox.critical(self, "Undo Error", "\n".join(errors))
+        self.close()
+
+    def purge(self) -> None:
+        """백그라운드에서 실제 삭제를 시작합니다."""
+        if self.thread:
+            return
+        self.countdown.stop()
+        self.undo_button.setEnabled(False)
+        self.status_label.setText("삭제하는 중...")
+        self.progress_bar.show()
+        self.thread = DeleteThread(self.job)
+        self.thread.progress.connect(self.update_progress)
+        self.thread.finished.connect(self.on_finished)
+        self.thread.error.connect(self.on_error)
+        self.thread.start()
+
+    def update_progress(self, removed: int) -> None:
+        """삭제 진행 상황을 업데이트합니다."""
+        self.status_label.setText(f"삭제하는 중... ({removed}개 항목)")
+
+    def _thread_done(self) -> None:
+        self.thread.wait()
+        self.thread.deleteLater()
+        self.thread = None
+
+    def on_finished(self, job) -> None:
+        """삭제가 끝났을 때 호출됩니다."""
+        self._thread_done()
+        if job.errors:
+            QMessageBox.critical(self, "Delete Error", "\n".join(job.errors))
+        self.close()
+
+    def on_error(self, error_message: str) -> None:
+        """삭제 중 오류가 발생했을 때 호출됩니다."""
+        self._thread_done()
+        QMessageBox.critical(self, "Delete Error", error_message)
+        self.close()
+
+    def closeEvent(self, event) -> None:
+        """창을 닫으면 남은 대기 시간 없이 바로 삭제하고, 삭제가 끝날 때까지 창만 숨깁니다."""
+        if self.job.staged and not self.job.purging:
+            self.purge()
+        if self.thread:
+            self.hide()
+            event.ignore()
+            return
+        super().closeEvent(event)
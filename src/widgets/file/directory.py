@@ -1,6 +1,6 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPushButton, QFrame, QMessageBox, QMenu, QInputDialog, QLineEdit  # QLineEdit 추가
 from PyQt5.QtGui import QIcon
-from PyQt5.QtCore import QSize, Qt
+from PyQt5.QtCore import QSize, Qt, QEvent, QTimer
 from utils.load import load_stylesheet, image_base_path
 import os
 import pickle
@@ -61,6 +61,9 @@ class FileDirectory(QWidget):
         self.empty_space.setStyleSheet("background: transparent;")
         self.empty_space.setMinimumHeight(50)  # 적절한 높이 설정
 
+        # 창이 만들어진 뒤 즐겨찾기 폴더를 백그라운드에서 미리 읽어 둠
+        QTimer.singleShot(0, self.prefetch_bookmarks)
+
     def create_button(self, icon_name: str, tooltip: str) -> QPushButton:
         """
         Creates a styled button for the sidebar.
@@ -221,12 +224,27 @@ class FileDirectory(QWidget):
         button = self.create_button(icon_name, tooltip)
         button.clicked.connect(lambda: self.navigate_to(path))
         button.setProperty("path", path)
+        button.installEventFilter(self)  # 마우스를 올리면 먼저 미리 읽기
         button.setContextMenuPolicy(Qt.CustomContextMenu)
         button.customContextMenuRequested.connect(
             lambda pos, b=button: self.show_bookmark_context_menu(pos, b)
         )
         return button
 
+    def prefetch_bookmarks(self) -> None:
+        """즐겨찾기 폴더 목록을 백그라운드에서 미리 읽어 둡니다."""
+        file_list = self.get_file_list()
+        if file_list:
+            file_list.prefetch([button.property("path") for button in self.bookmark_buttons])
+
+    def eventFilter(self, obj, event) -> bool:
+        """마우스를 올린 즐겨찾기 폴더를 가장 먼저 미리 읽습니다."""
+        if event.type() == QEvent.Enter and obj in self.bookmark_buttons:
+            file_list = self.get_file_list()
+            if file_list:
+                file_list.prefetch([obj.property("path")], urgent=True)
+        return super().eventFilter(obj, event)
+
     def start_inline_edit(self, button):
         """버튼의 인라인 편집을 시작합니다."""
         if button not in self.bookmark_buttons:  # 기본 즐겨찾기는 편집 불가
@@ -320,6 +338,7 @@ class FileDirectory(QWidget):
         
         self.bookmark_buttons.append(button)
         self.save_bookmarks()  # 즐겨찾기 추가 후 저장
+        self.prefetch_bookmarks()
 
     def remove_bookmark(self, button):
         """즐겨찾기를 제거합니다."""
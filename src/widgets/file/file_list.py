@@ -1,12 +1,22 @@
 from PyQt5.QtWidgets import QTreeView, QAbstractItemView, QWidget, QVBoxLayout, QHeaderView, QSizePolicy, QApplication, QMessageBox, QMenu, QAction, QProgressDialog, QLineEdit
-from PyQt5.QtCore import Qt, pyqtSignal, QMimeData, QUrl, QProcess
+from PyQt5.QtCore import Qt, pyqtSignal, QMimeData, QUrl, QProcess, QTimer, QItemSelection, QItemSelectionModel
 from models.file_system_model import FileExplorerModel
 from widgets.file.information import FileInformation
 from PyQt5.QtGui import QCursor, QDesktopServices, QPixmap, QIcon
-import shutil, subprocess
+import subprocess
 import os
 from utils.secure import TaskRunner
 from utils.load import image_base_path
+from utils.walker import has_files
+from utils.transfer import TransferJob, find_conflicts, build_items
+from widgets.file.transfer_dialog import ConflictDialog, TransferDialog
+from utils.trash import DeleteJob
+from widgets.file.delete_dialog import DeleteDialog
+from widgets.file.lock_check import confirm_lock_space
+from utils.prefetch import DirectoryPrefetcher
+
+VIEW_STATE_MAX_SELECTED = 1000  # Selected item names kept per saved view state
+HOVER_PREFETCH_DELAY = 300  # ms the cursor must rest on a folder before it is prefetched
 
 def set_clipboard_files(file_paths: list[str], move: bool = False) -> None:
     """
@@ -104,6 +114,16 @@ class FileList(QWidget):
         self.model = FileExplorerModel()
         self.tree_view.setModel(self.model)
 
+        # Warm listings of folders the user is likely to open next
+        self.prefetcher = DirectoryPrefetcher(self.model, parent=self)
+        self.hovered_path = None
+        self.hover_timer = QTimer(self)
+        self.hover_timer.setSingleShot(True)
+        self.hover_timer.setInterval(HOVER_PREFETCH_DELAY)
+        self.hover_timer.timeout.connect(lambda: self.prefetch([self.hovered_path], urgent=True))
+        self.tree_view.setMouseTracking(True)
+        self.tree_view.entered.connect(self.on_item_hovered)
+
         self.tree_view.header().setSectionResizeMode(0, QHeaderView.Stretch)  # Name column
         self.tree_view.header().setStretchLastSection(False)
         self.tree_view.header().setSectionResizeMode(1, QHeaderView.Fixed)    # Modified date
@@ -187,8 +207,8 @@ class FileList(QWidget):
                 QMessageBox.information(self, "De-authenticated", "You have exited the secure folder. Authentication has been cleared.")
                 path = os.path.expanduser("~")  # Default to home directory
 
-            # Update the file explorer view
-            index = self.model.index(path)
+            # Update the file explorer view (the model only reads and watches the current folder)
+            index = self.model.setRootPath(path)
             self.tree_view.setRootIndex(index)
             self.path_changed.emit(path)
 
@@ -206,6 +226,78 @@ class FileList(QWidget):
         """
         return self.model.filePath(self.tree_view.rootIndex())
 
+    def prefetch(self, paths: list[str], urgent: bool = False) -> None:
+        """
+        Queues folders to be read in the background so opening them shows their contents immediately.
+        Folders inside the secure folder are skipped unless it is unlocked.
+
+        Args:
+            paths (list[str]): Folder paths to prefetch.
+            urgent (bool): Prefetch before already queued folders (e.g. the hovered folder).
+        """
+        if self.secure_manager and not self.secure_manager.authenticated:
+            # Compare whole path components so "Secure2" or a folder merely named like it is not excluded
+            secure_key = os.path.normcase(os.path.abspath(self.secure_manager.secure_folder_path))
+            secure_prefix = secure_key.rstrip(os.sep) + os.sep
+            keys = {path: os.path.normcase(os.path.abspath(path)) for path in paths if path}
+            paths = [path for path, key in keys.items() if key != secure_key and not key.startswith(secure_prefix)]
+        self.prefetcher.request(paths, urgent)
+
+    def on_item_hovered(self, index) -> None:
+        """Prefetches a folder once the cursor rests on it."""
+        if self.model.isDir(index):
+            self.hovered_path = self.model.filePath(index)
+            self.hover_timer.start()
+        else:
+            self.hover_timer.stop()
+
+    def save_view_state(self) -> dict:
+        """
+        Captures the sort order, scroll position and selection of the current folder.
+
+        Returns:
+            dict: View state that can be passed to restore_view_state.
+        """
+        header = self.tree_view.header()
+        root = self.tree_view.rootIndex()
+        selected = [self.model.fileName(index) for index in self.tree_view.selectionModel().selectedRows()
+                    if index.parent() == root]
+        current = self.tree_view.currentIndex()
+        return {
+            "sort": (header.sortIndicatorSection(), header.sortIndicatorOrder()),
+            "scroll": self.tree_view.verticalScrollBar().value(),
+            "selected": selected[:VIEW_STATE_MAX_SELECTED],
+            "current": self.model.fileName(current) if current.isValid() else None,
+        }
+
+    def restore_view_state(self, state: dict) -> None:
+        """
+        Restores a view state saved by save_view_state for the current folder.
+        Items that no longer exist are skipped.
+
+        Args:
+            state (dict): View state returned by save_view_state.
+        """
+        if self.tree_view.isSortingEnabled():
+            self.tree_view.sortByColumn(*state["sort"])
+
+        root = self.get_current_path()
+        selection = QItemSelection()
+        for name in state["selected"]:
+            index = self.model.index(os.path.join(root, name))
+            if index.isValid():
+                selection.select(index, index)
+        selection_model = self.tree_view.selectionModel()
+        selection_model.select(selection, QItemSelectionModel.ClearAndSelect | QItemSelectionModel.Rows)
+        if state["current"]:
+            current = self.model.index(os.path.join(root, state["current"]))
+            if current.isValid():
+                selection_model.setCurrentIndex(current, QItemSelectionModel.NoUpdate)
+
+        # The scroll range is only known after the view lays out the restored rows
+        scroll = state["scroll"]
+        QTimer.singleShot(0, lambda: self.tree_view.verticalScrollBar().setValue(scroll))
+
     def on_double_click(self, index) -> None:
         """
         Handles double-click events to navigate into directories or open files.
@@ -280,25 +372,9 @@ class FileList(QWidget):
         if reply == QMessageBox.No:
             return  # Abort if the user chooses "No"
 
-        # Perform deletion
-        errors = []
-        for file_path in file_paths:
-            try:
-                if os.path.isdir(file_path):
-                    shutil.rmtree(file_path)  # Delete directory
-                else:
-                    os.remove(file_path)  # Delete file
-            except Exception as e:
-                errors.append(f"Error deleting {file_path}: {e}")
-
-        # Display errors or success message
-        if errors:
-            QMessageBox.critical(self, "Delete Error", "\n".join(errors))
-        else:
-            QMessageBox.information(self, "Delete Success", "Selected files or directories deleted successfully.")
-
-        # Refresh the UI if needed
-        self.tree_view.model().layoutChanged.emit()
+        # Move the selection into the trash staging area at once and delete it in the background
+        delete_dialog = DeleteDialog(DeleteJob(file_paths), self)
+        delete_dialog.start()
 
     def copySelectedFiles(self, cut: bool = False) -> None:
         """
@@ -370,60 +446,41 @@ class FileList(QWidget):
             else:
                 target_dir = os.path.expanduser("~")  # Default to home directory
 
-        errors = []
-        files_processed = 0  # Count of successfully processed files
+        # Resolve name conflicts up front in a single dialog
+        resolutions = {}
+        conflicts = find_conflicts(file_paths, target_dir)
+        if conflicts:
+            dialog = ConflictDialog(conflicts, target_dir, self)
+            if dialog.exec_() != ConflictDialog.Accepted:
+                return
+            resolutions = dialog.resolutions()
 
-        for source in file_paths:
-            try:
-                destination = os.path.join(target_dir, os.path.basename(source))
-
-                # Check if source and destination are the same
-                if os.path.abspath(source) == os.path.abspath(destination):
-                    QMessageBox.warning(self, "Paste Warning", f"Source and destination are the same: {source}")
-                    continue
-
-                if os.path.exists(destination):
-                    # Ask for overwrite confirmation
-                    reply = QMessageBox.question(
-                        self,
-                        'Overwrite Confirmation',
-                        f"'{os.path.basename(destination)}' already exists.\nDo you want to overwrite it?",
-                        QMessageBox.Yes | QMessageBox.No,
-                        QMessageBox.No
-                    )
-                    if reply == QMessageBox.No:
-                        continue
-
-                    # Delete the existing file/folder before overwriting
-                    if os.path.isdir(destination):
-                        shutil.rmtree(destination)
-                    else:
-                        os.remove(destination)
-
-                # Perform the copy or move operation
-                if operation == 'copy':
-                    if os.path.isdir(source):
-                        shutil.copytree(source, destination)
-                    else:
-                        shutil.copy2(source, destination)
-                elif operation == 'move':
-                    shutil.move(source, destination)
-
-                files_processed += 1
+        items, warnings = build_items(file_paths, target_dir, resolutions)
+        for warning in warnings:
+            QMessageBox.warning(self, "Paste Warning", warning)
+        if not items:
+            return
 
-            except Exception as e:
-                errors.append(f"Error {operation}ing {source} to {destination}: {e}")
+        # Copy/move on a background thread with progress, cancel and resume
+        transfer_dialog = TransferDialog(TransferJob(items, operation), self)
+        transfer_dialog.completed.connect(self.on_paste_finished)
+        transfer_dialog.start()
 
-        # Display errors or success message
-        if errors:
-            QMessageBox.critical(self, "Paste Error", "\n".join(errors))
+    def on_paste_finished(self, job) -> None:
+        """
+        Called when a background paste operation has finished.
+        Shows errors or a success message.
+        """
+        if job.errors:
+            QMessageBox.critical(self, "Paste Error", "\n".join(job.errors))
 
+        files_processed = sum(1 for item in job.items if item.done) - len(job.errors)
         if files_processed > 0:
-            action_str = "moved" if operation == "move" else "copied"
+            action_str = "moved" if job.operation == "move" else "copied"
             QMessageBox.information(self, "Paste Success", f"{files_processed} files successfully {action_str}.")
 
         # Clear the cut files set after move
-        if operation == 'move':
+        if job.operation == 'move':
             self.cut_files.clear()
 
     def show_context_menu(self, position) -> None:
@@ -563,10 +620,8 @@ class FileList(QWidget):
     def virus_scan(self, path: str) -> None:
         """선택된 파일 또는 폴더에 대해 바이러스 검사를 실행합니다."""
         if os.path.isdir(path):
-            folder_content = os.listdir(path)
-            files_only = [f for f in folder_content if os.path.isfile(os.path.join(path, f))]
-
-            if not files_only:
+            # 하위 폴더까지 검사하므로 파일을 하나 찾는 즉시 확인 종료
+            if not has_files(path):
                 QMessageBox.information(self, "정보", "선택한 폴더에 파일이 없습니다.")
                 return
 
@@ -590,7 +645,13 @@ class FileList(QWidget):
     def start_virus_scan(self, path: str) -> None:
         """바이러스 검사를 시작합니다."""
         from utils.virus_scan import VirusScanThread
-        
+        from widgets.file.scan_result_table import ScanResultDialog
+
+        # 폴더는 결과를 표로 실시간 표시
+        if os.path.isdir(path):
+            ScanResultDialog(path, self).start()
+            return
+
         self.progress_dialog = QProgressDialog("검사 중...", "취소", 0, 100, self)
         self.progress_dialog.setWindowTitle("바이러스 검사")
         self.progress_dialog.setWindowModality(True)
@@ -599,8 +660,9 @@ class FileList(QWidget):
         self.scan_thread.finished.connect(self.on_scan_finished)
         self.scan_thread.error.connect(self.on_scan_error)
         self.scan_thread.progress.connect(self.update_progress)
+        self.scan_thread.cancelled.connect(self.on_scan_cancelled)
 
-        self.progress_dialog.canceled.connect(self.scan_thread.terminate)
+        self.progress_dialog.canceled.connect(self.scan_thread.cancel)
         self.scan_thread.start()
         self.progress_dialog.show()
 
@@ -634,6 +696,14 @@ class FileList(QWidget):
             delattr(self, 'scan_thread')
             delattr(self, 'progress_dialog')
 
+    def on_scan_cancelled(self) -> None:
+        """바이러스 검사가 취소되어 스레드가 종료되었을 때 호출됩니다."""
+        thread = self.sender()
+        thread.deleteLater()
+        if getattr(self, 'scan_thread', None) is thread:
+            delattr(self, 'scan_thread')
+            delattr(self, 'progress_dialog')
+
     def on_scan_error(self, error_message: str) -> None:
         """바이러스 검사 중 오류가 발생했을 때 호출됩니다."""
         if hasattr(self, 'progress_dialog'):
@@ -647,15 +717,13 @@ class FileList(QWidget):
 
     def lock_item(self, path: str) -> None:
         """항목을 잠급니다."""
-        size_in_bytes = self.get_size(path)
         if self.secure_manager.pwd_mgr.AESkey is None:  # None으로 체크
             QMessageBox.warning(self, "Error", "AES 키가 설정되지 않았습니다.")
             return  # 키가 없으면 더 이상 실행하지 않음
-        
-        size_limit = 5 * 1024**3  # 5GB
-        if size_in_bytes > size_limit:
-            QMessageBox.warning(self, "Error", "파일 또는 폴더 크기가 5GB를 초과하여 작업을 수행할 수 없습니다.")
-            return  # 크기 초과 시 실행 중단
+
+        # 보안 폴더 드라이브의 여유 공간 확인 (부족하거나 확인하지 못해 사용자가 취소하면 중단)
+        if not confirm_lock_space(self, self.secure_manager, path):
+            return
 
         # 인증 여부 확인
         if not self.secure_manager.authenticated:
@@ -715,8 +783,7 @@ class FileList(QWidget):
             new_path = os.path.join(os.path.dirname(old_path), new_name)
             
             try:
-                os.rename(old_path, new_path)
-                self.model.setRootPath(self.model.rootPath())  # 뷰 갱신
+                os.rename(old_path, new_path)  # 뷰는 폴더 감시로 갱신됨
             except OSError as e:
                 QMessageBox.warning(self, "오류", f"이름 변경 중 오류가 발생했습니다: {str(e)}")
 
@@ -732,17 +799,3 @@ class FileList(QWidget):
         """항목의 속성을 표시합니다."""
         # TODO: 속성 창 표시 기능 구현
         pass
-    def get_size(self,path):
-        """파일 또는 폴더 크기를 계산"""
-        if os.path.isfile(path):
-            return os.path.getsize(path)  # 파일 크기 반환
-        elif os.path.isdir(path):
-            total_size = 0
-            for dirpath, dirnames, filenames in os.walk(path):
-                for filename in filenames:
-                    file_path = os.path.join(dirpath, filename)
-                    if not os.path.islink(file_path):
-                        total_size += os.path.getsize(file_path)
-            return total_size  # 폴더 크기 반환
-        else:
-            raise ValueError(f"Invalid path: {path} is neither a file nor a folder.")
@@ -1,13 +1,19 @@
 import os
 import ctypes
+import threading
 import datetime as dt
+from array import array
 from typing import Final, Generator, Optional
 from enum import Enum, IntEnum
 from ctypes.wintypes import *
 from struct import calcsize, unpack
+from utils.search import SearchRecord
+from utils.native.library import DLL_DIR
 
 # Constants
 MAX_PATH: Final = 32767
+BATCH_SIZE: Final = 4096  # Results fetched per bulk call
+WINDOWS_TICKS_TO_UNIX: Final = 116444736000000000  # FILETIME of 1970-01-01 (100 ns ticks)
 
 
 class Request(IntEnum):
@@ -51,7 +57,7 @@ class ItemIterator:
 
     def __next__(self):
         self.index += 1
-        if self.index < len(self.everything):
+        if self.index < len(self.everything):  # Cached count, no DLL call
             return self
         raise StopIteration
 
@@ -65,10 +71,7 @@ class ItemIterator:
         Returns:
             str: Full path and file name if successful, None otherwise.
         """
-        filename = ctypes.create_unicode_buffer(MAX_PATH)
-        if self.everything.GetResultFullPathNameW(self.index, filename, MAX_PATH):
-            return filename.value
-        return None
+        return self.everything.get_result_path(self.index)
 
     def get_size(self) -> Optional[int]:
         """
@@ -77,7 +80,7 @@ class ItemIterator:
         Returns:
             int: Size in bytes if successful, None otherwise.
         """
-        file_size = ULARGE_INTEGER()
+        file_size = self.everything.value_buffer
         if self.everything.GetResultSize(self.index, file_size):
             return file_size.value
         return None
@@ -119,6 +122,20 @@ class ItemIterator:
         return bool(self.everything.IsFolderResult(self.index))
 
 
+class ResultBatch:
+    """Results of one bulk fetch stored column-wise (size -1 for folders/unknown, mtime in Unix seconds)."""
+    __slots__ = ("paths", "sizes", "mtimes", "folders")
+
+    def __init__(self) -> None:
+        self.paths: list[str] = []
+        self.sizes = array("q")
+        self.mtimes = array("d")
+        self.folders = array("B")
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+
 class Everything:
     """Wrapper for the Everything SDK."""
     def __init__(self, dll: Optional[str] = None) -> None:
@@ -128,7 +145,7 @@ class Everything:
         Args:
             dll (str, optional): Path to the Everything DLL. Defaults to auto-detect.
         """
-        dll = dll or rf'..\src\dll\FileSearchx{8 * calcsize("P")}.dll'
+        dll = dll or os.path.join(DLL_DIR, f'FileSearchx{8 * calcsize("P")}.dll')
         self.dll = ctypes.WinDLL(dll)
 
         # Define functions
@@ -140,13 +157,23 @@ class Everything:
         self.func(DWORD, 'GetResultFullPathNameW', DWORD, LPWSTR, DWORD)
         self.func(DWORD, 'GetNumResults')
         self.func(BOOL, 'GetResultSize', DWORD, PULARGE_INTEGER)
+        self.func(BOOL, 'GetResultDateModified', DWORD, PULARGE_INTEGER)
         self.func(BOOL, 'IsFileResult', DWORD)
         self.func(BOOL, 'IsFolderResult', DWORD)
         self.func(DWORD, 'GetLastError')
+        self.func(DWORD, 'GetMajorVersion')
+        self.func(BOOL, 'IsDBLoaded')
+
+        # Buffers reused for every result instead of allocating one per call
+        self.path_buffer = ctypes.create_unicode_buffer(MAX_PATH)
+        self.value_buffer = ULARGE_INTEGER()
+        self._count: Optional[int] = None
 
     def __len__(self) -> int:
-        """Get the number of visible file and folder results."""
-        return self.GetNumResults()
+        """Get the number of visible file and folder results (cached after each query)."""
+        if self._count is None:
+            self._count = self.GetNumResults()
+        return self._count
 
     def __getitem__(self, item: int) -> ItemIterator:
         """Get a specific result by index."""
@@ -169,10 +196,62 @@ class Everything:
         func.restype = restype
         func.argtypes = tuple(argtypes)
 
+    def is_ready(self) -> bool:
+        """Check that the Everything service is running and its database is loaded, without running a query."""
+        return self.GetMajorVersion() != 0 and bool(self.IsDBLoaded())
+
     def query(self, wait: bool = True) -> bool:
         """Execute an Everything IPC query."""
+        self._count = None
         return bool(self.QueryW(wait))
 
+    def get_result_path(self, index: int) -> Optional[str]:
+        """
+        Get the full path of a result using the shared path buffer.
+
+        Args:
+            index (int): Result index.
+
+        Returns:
+            str: Full path and file name if successful, None otherwise.
+        """
+        length = self.GetResultFullPathNameW(index, self.path_buffer, MAX_PATH)
+        return self.path_buffer[:length] if length else None
+
+    def fetch(self, start: int, count: int) -> "ResultBatch":
+        """
+        Read path, size, modified date and folder flag of a range of results in one pass.
+
+        Args:
+            start (int): First result index.
+            count (int): Maximum number of results to read.
+
+        Returns:
+            ResultBatch: Results stored in compact arrays.
+        """
+        end = min(start + count, len(self))
+        batch = ResultBatch()
+        value = self.value_buffer
+        get_path, get_size, get_date = self.get_result_path, self.GetResultSize, self.GetResultDateModified
+        is_folder = self.IsFolderResult
+        for index in range(start, end):
+            path = get_path(index)
+            if path is None:
+                continue
+            folder = bool(is_folder(index))
+            batch.paths.append(path)
+            batch.folders.append(folder)
+            batch.sizes.append(value.value if not folder and get_size(index, value) else -1)
+            batch.mtimes.append(
+                (value.value - WINDOWS_TICKS_TO_UNIX) / 10000000 if get_date(index, value) else 0.0
+            )
+        return batch
+
+    def iter_batches(self, batch_size: int = BATCH_SIZE) -> Generator["ResultBatch", None, None]:
+        """Iterate over all results of the last query in bulk batches."""
+        for start in range(0, len(self), batch_size):
+            yield self.fetch(start, batch_size)
+
     def set_search(self, string: str) -> None:
         """Set the search string for the query."""
         self.SetSearchW(string)
@@ -210,3 +289,31 @@ def file_search(directory: str, filename: str) -> Generator[str, None, None]:
 
     for item in everything:
         yield item.get_filename()
+
+
+def search_records(directory: str, filename: str,
+                   cancel_event: Optional[threading.Event] = None) -> Generator[SearchRecord, None, None]:
+    """
+    Search like file_search, but read size and dates from the Everything index in bulk
+    instead of touching the file system for every result.
+
+    Args:
+        directory (str): Directory path to search in.
+        filename (str): Filename to search for.
+        cancel_event (threading.Event, optional): Stops reading results once it is set.
+
+    Yields:
+        SearchRecord: Matching files and folders with their details.
+    """
+    everything = Everything()
+    everything.set_search(fr"path:{directory}\ {filename}")
+    everything.set_request_flags(Request.FullPathAndFileName | Request.DateModified | Request.Size)
+
+    if not everything.query():
+        raise Exception(everything.get_last_error())
+
+    for batch in everything.iter_batches():
+        if cancel_event is not None and cancel_event.is_set():
+            return
+        for path, size, mtime, folder in zip(batch.paths, batch.sizes, batch.mtimes, batch.folders):
+            yield SearchRecord(path, bool(folder), None if folder or size < 0 else size, mtime)
@@ -1,9 +1,11 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame, QHBoxLayout
 from PyQt5.QtGui import QPixmap
 from PyQt5.QtCore import Qt
-from collections import defaultdict
+from datetime import datetime
 from utils.load import image_base_path, load_stylesheet
-import os
+from utils.folder_stats import FolderStatsLoader, scan_folder_stats
+
+TOP_EXTENSIONS = 5  # Number of most common file types shown for a folder
 
 
 class FileInformation(QWidget):
@@ -45,6 +47,12 @@ class FileInformation(QWidget):
         self.setStyleSheet(load_stylesheet("file_information.css"))
         self.setObjectName("file_information")
 
+        # Folder statistics are computed in the background and streamed into stats_labels
+        self.stats_path = None
+        self.stats_labels = []
+        self.folder_stats = FolderStatsLoader(parent=self)
+        self.folder_stats.stats_ready.connect(self.on_folder_stats)
+
         # Set default height and hide widget
         self.setFixedHeight(180)
         self.hide()
@@ -66,13 +74,8 @@ class FileInformation(QWidget):
         Returns:
             tuple[int, int]: Number of files and folders.
         """
-        try:
-            items = os.listdir(folder_path)
-            file_count = len([item for item in items if os.path.isfile(os.path.join(folder_path, item))])
-            folder_count = len([item for item in items if os.path.isdir(os.path.join(folder_path, item))])
-            return file_count, folder_count
-        except Exception:
-            return 0, 0
+        stats, _ = scan_folder_stats(folder_path, max_depth=0)
+        return stats.files, stats.folders
 
     def get_file_types(self, folder_path: str) -> dict[str, int]:
         """
@@ -84,19 +87,8 @@ class FileInformation(QWidget):
         Returns:
             dict[str, int]: Dictionary of file extensions and their counts.
         """
-        try:
-            items = os.listdir(folder_path)
-            file_types = defaultdict(int)
-
-            for item in items:
-                item_path = os.path.join(folder_path, item)
-                if os.path.isfile(item_path):
-                    _, ext = os.path.splitext(item)
-                    if ext:
-                        file_types[ext.upper()] += 1
-            return dict(file_types)
-        except Exception:
-            return {}
+        stats, _ = scan_folder_stats(folder_path, max_depth=0)
+        return stats.extensions
 
     def show_file_info(self, file_info: dict[str, str]) -> None:
         """
@@ -108,24 +100,64 @@ class FileInformation(QWidget):
         # Clear existing information
         for i in reversed(range(self.info_layout.count())):
             self.info_layout.itemAt(i).widget().deleteLater()
+        self.folder_stats.cancel()
+        self.stats_path = None
+        self.stats_labels = []
 
         # Add new information
         for key, value in file_info.items():
-            if key == "유형" and value == "폴더":
-                # Folder-specific information
-                info_label = QLabel(f"{key}: {value}")
-                self.info_layout.addWidget(info_label)
-
-                file_count, folder_count = self.get_folder_contents_count(file_info["경로"])
-                contents_label = QLabel(f"포함된 항목: 파일 {file_count}개, 폴더 {folder_count}개")
-                self.info_layout.addWidget(contents_label)
-            else:
-                # Generic information
-                info_label = QLabel(f"{key}: {value}")
-                self.info_layout.addWidget(info_label)
-
+            info_label = QLabel(f"{key}: {value}")
+            self.info_layout.addWidget(info_label)
+            if (key, value) in (("유형", "폴더"), ("Type", "Folder")):
+                # Folder-specific information, filled in by the background statistics worker
+                self.stats_path = file_info.get("경로", file_info.get("Path"))
+                self.stats_labels = [QLabel("") for _ in range(2)]
+                self.stats_labels[0].setText("포함된 항목: 계산 중...")
+                for label in self.stats_labels:
+                    self.info_layout.addWidget(label)
+
+        if self.stats_path:
+            self.folder_stats.request(self.stats_path)
         self.show()
 
+    def on_folder_stats(self, path: str, stats, done: bool) -> None:
+        """
+        Update the folder statistics labels with a partial or final result.
+
+        Args:
+            path (str): Folder the statistics belong to.
+            stats (FolderStats): Statistics computed so far.
+            done (bool): Whether the computation has finished.
+        """
+        if path != self.stats_path or not self.stats_labels:
+            return
+        suffix = "" if done else " (계산 중...)"
+        if done and not stats.complete:
+            suffix = " 이상 (시간 초과로 일부만 계산)"
+        contents_label, types_label = self.stats_labels
+        contents_label.setText(
+            f"포함된 항목: 파일 {stats.files}개, 폴더 {stats.folders}개 | "
+            f"전체 크기: {self.format_size(stats.total_size)} (파일 {stats.total_files}개){suffix}"
+        )
+        types = sorted(stats.extensions.items(), key=lambda item: item[1], reverse=True)[:TOP_EXTENSIONS]
+        text = ", ".join(f"{ext} {count}" for ext, count in types)
+        if stats.newest is not None:
+            oldest = datetime.fromtimestamp(stats.oldest).strftime("%Y-%m-%d")
+            newest = datetime.fromtimestamp(stats.newest).strftime("%Y-%m-%d")
+            text = f"{text} | 수정: {oldest} ~ {newest}" if text else f"수정: {oldest} ~ {newest}"
+        types_label.setText(f"파일 유형: {text}" if types else text)
+
+    @staticmethod
+    def format_size(size: float) -> str:
+        """Format a byte count for display."""
+        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+            if size < 1024:
+                return f"{size:.1f} {unit}"
+            size /= 1024
+        return f"{size:.1f} PB"
+
     def clear_info(self) -> None:
         """Clear displayed information and hide the widget."""
+        self.folder_stats.cancel()
+        self.stats_path = None
         self.hide()
\ No newline at end of file
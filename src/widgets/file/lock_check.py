@@ -0,0 +1,39 @@
+from PyQt5.QtWidgets import QMessageBox
+from utils.dir_size import get_size_service, LOCK_CHECK_MAX_FILES, LOCK_CHECK_TIME_BUDGET
+import shutil
+
+
+def confirm_lock_space(parent, secure_manager, path):
+    """
+    잠금 전에 보안 폴더 드라이브의 여유 공간을 확인하고, 필요하면 경고·확인 창을 띄웁니다.
+    (암호화는 청크 단위로 임시 파일에 기록되므로 보안 폴더 드라이브에 여유 공간이 있어야 함)
+
+    Args:
+        parent (QWidget): 메시지 창의 부모 위젯
+        secure_manager (SecureManager): 보안 폴더 관리자
+        path (str): 잠글 파일 또는 폴더 경로
+
+    Returns:
+        bool: 잠금을 계속해도 되면 True
+    """
+    if secure_manager.authenticated:
+        return True
+    size_limit = shutil.disk_usage(secure_manager.secure_folder_path).free
+    # 크기·파일 수·시간 한도 중 하나라도 넘으면 바로 멈춤 (큰 폴더 전체를 탐색하지 않음)
+    result = get_size_service().check(
+        path, max_bytes=size_limit, max_files=LOCK_CHECK_MAX_FILES, time_budget=LOCK_CHECK_TIME_BUDGET
+    )
+    if result.exceeded:
+        QMessageBox.warning(parent, "Error", "보안 폴더 드라이브의 여유 공간이 부족하여 작업을 수행할 수 없습니다.")
+        return False  # 공간 부족 시 실행 중단
+    if result.cancelled:
+        return False  # 확인하지 못한 채로 잠그지 않음
+    if not result.complete:
+        reply = QMessageBox.question(
+            parent, "잠금",
+            f"항목이 많아 크기를 모두 확인하지 못했습니다. (파일 {result.files:,}개, {result.size / 1024**3:.1f} GB 이상)\n"
+            "보안 폴더 드라이브의 여유 공간이 부족하면 잠금이 실패할 수 있습니다. 계속하시겠습니까?",
+            QMessageBox.No | QMessageBox.Yes, QMessageBox.No
+        )
+        return reply == QMessageBox.Yes
+    return True
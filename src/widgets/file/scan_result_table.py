@@ -0,0 +1,255 @@
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QTableView, QHeaderView, QAbstractItemView,
+    QLabel, QProgressBar, QPushButton, QMessageBox
+)
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
+from PyQt5.QtGui import QColor
+from utils.virus_scan import VirusScanThread, get_rate_limiter
+from widgets.file.transfer_dialog import format_eta
+import time
+import os
+
+VERDICT_LABELS = {
+    "clean": "위험 없음",
+    "suspicious": "의심",
+    "malicious": "위험 있음",
+    "unknown": "확인 불가",
+    "error": "검사 실패",
+}
+
+class ScanResultModel(QAbstractTableModel):
+    """검사 결과(ScanResult)를 표 형태로 제공하는 모델"""
+    HEADERS = ["이름", "검사 상태", "탐지된 엔진", "소요 시간", "경로"]
+    FLUSH_INTERVAL = 100  # 결과를 모아서 반영하는 간격(ms)
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.records = []
+        self._pending = []
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+
+        # 결과가 들어올 때마다 행을 추가하지 않고 일정 간격으로 한꺼번에 추가
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def add_result(self, record) -> None:
+        """검사 결과를 추가 대기열에 넣습니다."""
+        self._pending.append(record)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """대기 중인 결과를 표에 반영합니다."""
+        if not self._pending:
+            return
+        first = len(self.records)
+        self.beginInsertRows(QModelIndex(), first, first + len(self._pending) - 1)
+        self.records.extend(self._pending)
+        self._pending = []
+        self.endInsertRows()
+        if self._sort_column >= 0:
+            self.sort(self._sort_column, self._sort_order)
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.records)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        record = self.records[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return os.path.basename(record.path)
+            if column == 1:
+                return VERDICT_LABELS.get(record.verdict, record.verdict)
+            if column == 2:
+                return f"{record.detected}/{record.total}" if record.total is not None else "-"
+            if column == 3:
+                return "캐시" if record.cached else f"{record.elapsed:.2f}초"
+            if column == 4:
+                return record.path
+        elif role == Qt.ForegroundRole and column == 1:
+            if record.is_threat:
+                return QColor("#d32f2f")
+            if record.verdict == "error":
+                return QColor("#9e9e9e")
+        elif role == Qt.ToolTipRole:
+            return record.message or record.path
+        elif role == Qt.TextAlignmentRole and column in (2, 3):
+            return Qt.AlignRight | Qt.AlignVCenter
+        return None
+
+    def _sort_key(self, column):
+        if column == 0:
+            return lambda record: os.path.basename(record.path).lower()
+        if column == 1:
+            order = list(VERDICT_LABELS)
+            return lambda record: order.index(record.verdict) if record.verdict in order else len(order)
+        if column == 2:
+            return lambda record: (record.detected if record.detected is not None else -1, record.total or 0)
+        if column == 3:
+            return lambda record: record.elapsed
+        return lambda record: record.path.lower()
+
+    def sort(self, column, order=Qt.AscendingOrder) -> None:
+        """열 기준으로 정렬합니다. (선택 상태는 유지)"""
+        self._sort_column = column
+        self._sort_order = order
+        if column < 0:
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        old_indexes = self.persistentIndexList()
+        old_records = [self.records[index.row()] for index in old_indexes]
+        self.records.sort(key=self._sort_key(column), reverse=order == Qt.DescendingOrder)
+        rows = {id(record): row for row, record in enumerate(self.records)}
+        self.changePersistentIndexList(
+            old_indexes,
+            [self.index(rows[id(record)], index.column()) for record, index in zip(old_records, old_indexes)]
+        )
+        self.layoutChanged.emit()
+
+class ScanResultDialog(QDialog):
+    """폴더 바이러스 검사 결과를 검사 진행에 따라 채워 보여주는 창"""
+    def __init__(self, path: str, parent=None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("바이러스 검사")
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.resize(760, 480)
+        self._close_when_done = False
+        self._total_known = False  # 폴더 탐색이 끝나 전체 파일 수가 확정되었는지 여부
+        self._started = None  # 검사 시작 시각 (제한이 없을 때 남은 시간 계산용)
+
+        self.status_label = QLabel("검사 중...")
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+
+        self.model = ScanResultModel(self)
+        self.table_view = QTableView(self)
+        self.table_view.setModel(self.model)
+        self.table_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table_view.setAlternatingRowColors(True)
+        self.table_view.setWordWrap(False)
+        self.table_view.verticalHeader().hide()
+        # 행 높이를 고정해 보이는 행만 그리도록 유지
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_view.verticalHeader().setDefaultSectionSize(24)
+        header = self.table_view.horizontalHeader()
+        header.setSortIndicator(-1, Qt.AscendingOrder)
+        header.setSectionResizeMode(0, QHeaderView.Interactive)
+        header.setStretchLastSection(True)
+        self.table_view.setColumnWidth(0, 220)
+        self.table_view.setSortingEnabled(True)
+
+        self.button = QPushButton("취소")
+        self.button.clicked.connect(self.on_button_clicked)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        button_layout.addWidget(self.button)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.status_label)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.table_view)
+        layout.addLayout(button_layout)
+
+        self.scan_thread = VirusScanThread(path)
+        self.scan_thread.file_scanned.connect(self.model.add_result)
+        self.scan_thread.progress.connect(self.update_progress)
+        self.scan_thread.enumerated.connect(self.on_enumerated)
+        self.scan_thread.finished.connect(self.on_scan_finished)
+        self.scan_thread.cancelled.connect(self.on_scan_cancelled)
+        self.scan_thread.error.connect(self.on_scan_error)
+
+    def start(self) -> None:
+        """검사를 시작하고 창을 표시합니다."""
+        self._started = time.monotonic()
+        self.scan_thread.start()
+        self.show()
+
+    def update_progress(self, current: int, total: int) -> None:
+        """검사 진행 상황을 업데이트합니다."""
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(current)
+        suffix = "" if self._total_known else "+"
+        remaining = total - current
+        self.status_label.setText(
+            f"검사 중... ({current}/{total}{suffix}) · 남은 파일 {remaining:,}개{'' if self._total_known else ' 이상'}"
+            f" · {self.remaining_time(current, remaining)}"
+        )
+
+    def remaining_time(self, current: int, remaining: int) -> str:
+        """남은 파일 수로 예상 남은 시간을 계산한 문구를 반환합니다."""
+        limiter = get_rate_limiter()
+        estimate = limiter.estimate(remaining)
+        if estimate is not None:
+            # 분당 요청 수 제한이 있으면 남은 파일이 모두 검사 요청이라고 보고 계산 (캐시에 있는 파일은 더 빨리 끝남)
+            return f"예상 남은 시간 최대 {format_eta(estimate)} (분당 {limiter.rate_per_minute:g}회 제한)"
+        if current == 0 or self._started is None:
+            return f"예상 남은 시간 {format_eta(None)}"
+        return f"예상 남은 시간 {format_eta((time.monotonic() - self._started) / current * remaining)}"
+
+    def on_enumerated(self, total: int) -> None:
+        """폴더 탐색이 끝나 전체 파일 수가 확정되었을 때 호출됩니다."""
+        self._total_known = True
+        self.progress_bar.setMaximum(total)
+
+    def _scan_done(self, status: str) -> None:
+        self.scan_thread.wait()
+        self.model.flush()
+        if self._close_when_done:
+            self.close()
+            return
+        self.status_label.setText(status)
+        self.button.setText("닫기")
+        self.button.setEnabled(True)
+
+    def on_scan_finished(self, summary: str) -> None:
+        """검사가 완료되었을 때 호출됩니다."""
+        self.progress_bar.setRange(0, 1)
+        self.progress_bar.setValue(1)
+        self._scan_done(summary.replace("\n", "   "))
+
+    def on_scan_cancelled(self) -> None:
+        """검사가 취소되어 스레드가 종료되었을 때 호출됩니다."""
+        self._scan_done("검사가 취소되었습니다.")
+
+    def on_scan_error(self, error_message: str) -> None:
+        """검사 중 오류가 발생했을 때 호출됩니다."""
+        if not self._close_when_done:
+            QMessageBox.critical(self, "오류", f"검사 중 오류가 발생했습니다:\n{error_message}")
+        self._scan_done("검사 중 오류가 발생했습니다.")
+
+    def on_button_clicked(self) -> None:
+        """검사 중이면 취소하고(지금까지의 결과는 유지), 끝났으면 창을 닫습니다."""
+        if self.scan_thread.isRunning():
+            self.scan_thread.cancel()
+            self.status_label.setText("취소하는 중...")
+            self.button.setEnabled(False)
+        else:
+            self.close()
+
+    def closeEvent(self, event) -> None:
+        """검사 중이면 취소하고, 스레드가 끝난 뒤에 창을 닫습니다."""
+        if self.scan_thread.isRunning():
+            self.scan_thread.cancel()
+            self._close_when_done = True
+            self.hide()
+            event.ignore()
+            return
+        super().closeEvent(event)
@@ -0,0 +1,138 @@
+import logging
+import os
+import time
+import threading
+from abc import ABC, abstractmethod
+from typing import Iterator, Optional
+from utils.search import SearchRecord
+from utils.file_index import FileIndex
+from widgets.file.file_search import Everything, search_records
+
+# auto: Everything if its DLL and service are available, otherwise the built-in index
+SEARCH_BACKEND = os.environ.get("SAFEFILE_SEARCH_BACKEND", "auto")
+INDEX_REFRESH = 60  # Seconds before an indexed folder is re-crawled in the background (only changed folders are re-read)
+INDEX_DB = os.path.join(os.path.dirname(__file__), "..", "..", "utils", "setting", "file_index.db")
+
+logger = logging.getLogger(__name__)
+
+
+class SearchBackend(ABC):
+    """Interface for file search backends (subclasses must implement search)."""
+    name = "base"
+
+    @abstractmethod
+    def search(self, directory: str, query: str,
+               cancel_event: Optional[threading.Event] = None) -> Iterator[SearchRecord]:
+        """
+        Search for files and folders under a directory.
+
+        Args:
+            directory (str): Directory path to search in.
+            query (str): Substring, wildcard (* ?) or "regex:" pattern.
+            cancel_event (threading.Event, optional): Stops the search as soon as it is set.
+
+        Yields:
+            SearchRecord: Matching files and folders with their details.
+        """
+
+
+class EverythingBackend(SearchBackend):
+    """Searches through the Everything service (Windows only)."""
+    name = "everything"
+
+    @staticmethod
+    def available() -> bool:
+        """
+        Check that the Everything DLL loads and the service is ready.
+        Uses version and database-loaded calls instead of a query, which would send back the whole index.
+        """
+        try:
+            return Everything().is_ready()
+        except (OSError, AttributeError):
+            return False
+
+    def search(self, directory: str, query: str,
+               cancel_event: Optional[threading.Event] = None) -> Iterator[SearchRecord]:
+        return search_records(directory, query, cancel_event)
+
+
+class IndexBackend(SearchBackend):
+    """
+    Searches a local SQLite filename index.
+    A folder is crawled before its first search; after that the existing index is served at once
+    and stale folders are re-crawled in the background.
+    """
+    name = "index"
+
+    def __init__(self, index: Optional[FileIndex] = None, refresh_interval: float = INDEX_REFRESH) -> None:
+        self.index = index or FileIndex(os.path.abspath(INDEX_DB))
+        self.refresh_interval = refresh_interval
+        self.build_lock = threading.Lock()  # One crawl at a time; later searches reuse its result
+        self.refreshing = set()  # Folders being re-crawled in the background
+        self.refreshing_lock = threading.Lock()
+
+    def search(self, directory: str, query: str,
+               cancel_event: Optional[threading.Event] = None) -> Iterator[SearchRecord]:
+        indexed_at = self.index.indexed_at(directory)
+        if indexed_at is None:
+            if not self.build(directory, cancel_event):
+                return
+        elif time.time() - indexed_at > self.refresh_interval:
+            self.refresh(directory)
+        yield from self.index.search(directory, query, cancel_event=cancel_event)
+
+    def build(self, directory: str, cancel_event: Optional[threading.Event] = None) -> bool:
+        """
+        Crawl a folder that has not been indexed yet, waiting for any crawl already running.
+
+        Returns:
+            bool: False if cancel_event was set before the crawl finished.
+        """
+        while not self.build_lock.acquire(timeout=0.1):
+            if cancel_event is not None and cancel_event.is_set():
+                return False
+        try:
+            if self.index.indexed_at(directory) is None:
+                self.index.build(directory, cancel_event)
+        finally:
+            self.build_lock.release()
+        return cancel_event is None or not cancel_event.is_set()
+
+    def refresh(self, directory: str) -> None:
+        """Re-crawl a stale folder in the background while searches keep using the current index."""
+        key = self.index.path_key(directory)
+        with self.refreshing_lock:
+            if key in self.refreshing:
+                return
+            self.refreshing.add(key)
+
+        def run() -> None:
+            try:
+                with self.build_lock:
+                    self.index.build(directory)
+            except Exception as e:
+                logger.warning("색인 갱신 중 오류가 발생했습니다: %s", e)
+            finally:
+                with self.refreshing_lock:
+                    self.refreshing.discard(key)
+
+        threading.Thread(target=run, daemon=True).start()
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+def get_search_backend() -> SearchBackend:
+    """Return the configured search backend (created once)."""
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            if SEARCH_BACKEND not in ("auto", "everything", "index"):
+                raise ValueError(f"알 수 없는 검색 백엔드: {SEARCH_BACKEND}")
+            if SEARCH_BACKEND == "everything" or (
+                SEARCH_BACKEND == "auto" and os.name == "nt" and EverythingBackend.available()
+            ):
+                _backend = EverythingBackend()
+            else:
+                _backend = IndexBackend()
+        return _backend
@@ -6,8 +6,305 @@ from PyQt5.QtWidgets import (
     QApplication, QTreeView, QAbstractItemView, QWidget, QVBoxLayout, QHeaderView,
     QFileIconProvider, QSizePolicy
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QFileInfo
-from PyQt5.QtGui import QStandardItemModel, QStandardItem
+from PyQt5.QtCore import (
+    Qt, pyqtSignal, QFileInfo, QTimer, QAbstractTableModel, QModelIndex, QMimeData, QUrl, QCoreApplication
+)
+from PyQt5.QtGui import QColor
+from utils.search import SearchRecord
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import time
+
+SORT_CHUNK_ROWS = 50_000  # Rows sorted per chunk before merging
+
+
+def _sort_rows(columns, count, key, reverse):
+    """
+    Sort the first count rows of the column arrays.
+
+    Returns:
+        tuple: (new row of each old row, reordered (names, folder_index, sizes, mtimes, states))
+    """
+    keys = [key(row) for row in range(count)]
+    # Sort in chunks and merge them so a worker never holds the GIL (and so the GUI) for one long C sort
+    chunks = [sorted(range(start, min(start + SORT_CHUNK_ROWS, count)), key=keys.__getitem__, reverse=reverse)
+              for start in range(0, count, SORT_CHUNK_ROWS)]
+    order_rows = chunks[0] if len(chunks) == 1 else list(heapq.merge(*chunks, key=keys.__getitem__, reverse=reverse))
+    new_rows = array("l", [0]) * count
+    for new_row, old_row in enumerate(order_rows):
+        new_rows[old_row] = new_row
+    names, folder_index, sizes, mtimes, states = columns
+    return new_rows, (
+        [names[row] for row in order_rows],
+        array("I", (folder_index[row] for row in order_rows)),
+        array("q", (sizes[row] for row in order_rows)),
+        array("d", (mtimes[row] for row in order_rows)),
+        array("B", (states[row] for row in order_rows)),
+    )
+
+
+class SearchResultModel(QAbstractTableModel):
+    """
+    Table model for search results stored in compact column arrays.
+
+    Each row costs a name string plus a few packed numbers (folder id, size, mtime, flags);
+    folder paths are shared between rows. Cells are formatted only when the view asks for them,
+    and rows are exposed to the view a page at a time through canFetchMore/fetchMore.
+    """
+    HEADERS = ["Name", "Date Modified", "Type", "Size"]
+    FETCH_SIZE = 1000  # Rows exposed to the view per fetchMore call
+    MAX_ROWS = 1_000_000  # Results beyond this are counted but not stored
+    RESORT_DELAY = 500  # ms; minimum delay between re-sorts while results stream in
+    SYNC_SORT_ROWS = 50_000  # Up to this many rows are sorted right away; more are sorted on a worker thread
+    # Extensions whose icon depends on the file itself (not cached per extension)
+    UNIQUE_ICON_EXTENSIONS = {"exe", "lnk", "ico", "url"}
+
+    FLAG_DIR = 0x1
+    FLAG_EXISTS = 0x2
+
+    _sorted = pyqtSignal(int, object)  # Sort generation, result of _sort_rows
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self.icon_provider = QFileIconProvider()
+        self.icon_cache = {}
+        self._sort_column = -1
+        self._sort_order = Qt.AscendingOrder
+        self._sort_generation = 0  # Bumped by every sort request and clear; older results are dropped
+        self._sort_running = None  # Generation of the sort running on the worker, if any
+        self._sort_executor = ThreadPoolExecutor(max_workers=1)
+        self._sorted.connect(self._apply_sort)
+        self._resort_timer = QTimer(self)
+        self._resort_timer.setSingleShot(True)
+        self._resort_timer.setInterval(self.RESORT_DELAY)
+        self._resort_timer.timeout.connect(self._resort)
+        self._reset_arrays()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def _reset_arrays(self) -> None:
+        self.folders: list[str] = []  # Shared parent folder paths
+        self.folder_ids: dict[str, int] = {}
+        self.names: list[str] = []
+        self.folder_index = array("I")
+        self.sizes = array("q")  # -1 when unknown (folders, invalid paths)
+        self.mtimes = array("d")
+        self.states = array("B")  # FLAG_* bits
+        self.fetched = 0  # Rows currently exposed to the view
+        self.truncated = 0  # Results dropped after MAX_ROWS
+
+    def clear(self) -> None:
+        """Remove all results."""
+        self.beginResetModel()
+        self._resort_timer.stop()
+        self._sort_generation += 1
+        self._sort_running = None
+        self._reset_arrays()
+        self.endResetModel()
+
+    def total_rows(self) -> int:
+        return len(self.names)
+
+    def add_records(self, records) -> None:
+        """
+        Append results to the column arrays. Only the first page is shown right away;
+        the rest is exposed as the view scrolls (fetchMore).
+        """
+        room = self.MAX_ROWS - len(self.names)
+        if room < len(records):
+            self.truncated += len(records) - max(room, 0)
+            records = records[:max(room, 0)]
+        for record in records:
+            folder = os.path.dirname(record.path)
+            folder_id = self.folder_ids.get(folder)
+            if folder_id is None:
+                folder_id = self.folder_ids[folder] = len(self.folders)
+                self.folders.append(folder)
+            self.folder_index.append(folder_id)
+            self.names.append(record.name)
+            self.sizes.append(-1 if record.size is None else record.size)
+            self.mtimes.append(record.mtime or 0.0)
+            self.states.append((self.FLAG_DIR if record.is_dir else 0) | (self.FLAG_EXISTS if record.exists else 0))
+
+        if self.fetched < self.FETCH_SIZE:
+            self.fetchMore(QModelIndex())
+        if self._sort_column >= 0:
+            if not self._resort_timer.isActive():
+                self._resort_timer.start()
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self.fetched < len(self.names)
+
+    def fetchMore(self, parent=QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        count = min(self.FETCH_SIZE, len(self.names) - self.fetched)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self.fetched, self.fetched + count - 1)
+        self.fetched += count
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else self.fetched
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+    def path(self, row: int) -> str:
+        """Return the full path of a row."""
+        return os.path.join(self.folders[self.folder_index[row]], self.names[row])
+
+    def is_dir(self, row: int) -> bool:
+        return bool(self.states[row] & self.FLAG_DIR)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        flags = self.states[row]
+        exists = flags & self.FLAG_EXISTS
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return self.names[row]
+            if not exists:
+                return "Invalid Path" if column == 2 else "N/A"
+            if column == 1:
+                return datetime.fromtimestamp(self.mtimes[row]).strftime("%Y-%m-%d %H:%M")
+            if column == 2:
+                if flags & self.FLAG_DIR:
+                    return "Folder"
+                ext = os.path.splitext(self.names[row])[1][1:].upper()
+                return f"{ext} File" if ext else "File"
+            if column == 3:
+                return "-" if flags & self.FLAG_DIR else SearchListWidget.human_readable_size(self.sizes[row])
+        elif role == Qt.DecorationRole and column == 0 and exists:
+            return self.icon_for(row)
+        elif role == Qt.ForegroundRole and column == 0 and not exists:
+            return QColor(Qt.red)
+        elif role == Qt.UserRole:
+            return self.path(row)
+        return None
+
+    def icon_for(self, row: int):
+        """Return the icon for a row, reusing one icon per folder/extension."""
+        if self.states[row] & self.FLAG_DIR:
+            key = "/folder"
+        else:
+            key = os.path.splitext(self.names[row])[1][1:].lower()
+            if key in self.UNIQUE_ICON_EXTENSIONS:
+                return self.icon_provider.icon(QFileInfo(self.path(row)))
+        if key not in self.icon_cache:
+            self.icon_cache[key] = self.icon_provider.icon(QFileInfo(self.path(row)))
+        return self.icon_cache[key]
+
+    def mimeTypes(self) -> list[str]:
+        return ["text/uri-list"]
+
+    def mimeData(self, indexes):
+        mime_data = QMimeData()
+        rows = sorted({index.row() for index in indexes})
+        mime_data.setUrls([QUrl.fromLocalFile(self.path(row)) for row in rows])
+        return mime_data
+
+    def _sort_key(self, column):
+        names, folders, folder_index = self.names, self.folders, self.folder_index
+        states, sizes, mtimes = self.states, self.sizes, self.mtimes
+        if column == 0:
+            return lambda row: names[row].lower()
+        if column == 1:
+            return mtimes.__getitem__
+        if column == 2:
+            return lambda row: (not states[row] & self.FLAG_DIR, os.path.splitext(names[row])[1].lower())
+        if column == 3:
+            return sizes.__getitem__
+        return lambda row: folders[folder_index[row]].lower()
+
+    def sort(self, column, order=Qt.AscendingOrder) -> None:
+        """
+        Sort by rearranging the column arrays (selection is kept).
+        Large results are sorted on a worker thread and swapped in when ready.
+        """
+        self._sort_column = column
+        self._sort_order = order
+        self._sort_generation += 1
+        if column < 0 or not self.names:
+            return
+
+        columns = (self.names, self.folder_index, self.sizes, self.mtimes, self.states)
+        count = len(self.names)
+        key = self._sort_key(column)
+        reverse = order == Qt.DescendingOrder
+        if count <= self.SYNC_SORT_ROWS:
+            self._apply_sort(self._sort_generation, _sort_rows(columns, count, key, reverse))
+            return
+        # Results keep streaming in meanwhile; they are only appended, so the first count rows stay put
+        self._sort_running = self._sort_generation
+        self._sort_executor.submit(self._sort_in_background, self._sort_generation, columns, count, key, reverse)
+
+    def _sort_in_background(self, generation, columns, count, key, reverse) -> None:
+        if generation == self._sort_generation:
+            self._sorted.emit(generation, _sort_rows(columns, count, key, reverse))
+
+    def _resort(self) -> None:
+        # Re-sort streamed results, but let a running background sort finish first
+        if self._sort_running is not None:
+            self._resort_timer.start()
+            return
+        self.sort(self._sort_column, self._sort_order)
+
+    def _apply_sort(self, generation, result) -> None:
+        """Swap in sorted column arrays; rows appended after the sort started stay at the end."""
+        if generation == self._sort_running:
+            self._sort_running = None
+        if generation != self._sort_generation:
+            return
+        started = time.monotonic()
+        new_rows, (names, folder_index, sizes, mtimes, states) = result
+        count = len(new_rows)
+
+        def moved(row):
+            return new_rows[row] if row < count else row
+
+        # Fetch up to the furthest row a selected or current item moves to so its index stays valid
+        last_row = max((moved(index.row()) for index in self.persistentIndexList()), default=-1)
+        while self.fetched <= last_row and self.canFetchMore():
+            self.fetchMore()
+
+        self.layoutAboutToBeChanged.emit()
+        self.names = names + self.names[count:]
+        self.folder_index = folder_index + self.folder_index[count:]
+        self.sizes = sizes + self.sizes[count:]
+        self.mtimes = mtimes + self.mtimes[count:]
+        self.states = states + self.states[count:]
+
+        old_indexes = self.persistentIndexList()
+        new_indexes = []
+        for index in old_indexes:
+            row = moved(index.row())
+            # Indexes created while the layout was changing may still point past the fetched rows
+            new_indexes.append(self.index(row, index.column()) if row < self.fetched else QModelIndex())
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+        # Keep re-sorting of streamed results to about a tenth of the GUI thread's time
+        self._resort_timer.setInterval(max(self.RESORT_DELAY, int((time.monotonic() - started) * 10000)))
+
+    def shutdown(self) -> None:
+        self._sort_generation += 1
+        self._sort_executor.shutdown(wait=False, cancel_futures=True)
 
 
 class SearchListWidget(QWidget):
@@ -28,6 +325,7 @@ class SearchListWidget(QWidget):
 
         self.tree_view = QTreeView(self)
         self.tree_view.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.tree_view.setUniformRowHeights(True)
         self.setup_ui()
         self.setup_model()
 
@@ -64,9 +362,10 @@ class SearchListWidget(QWidget):
 
     def setup_model(self) -> None:
         """Set up the data model for the tree view."""
-        self.model = QStandardItemModel()
-        self.model.setHorizontalHeaderLabels(["Name", "Date Modified", "Type", "Size"])
+        self.model = SearchResultModel(self)
         self.tree_view.setModel(self.model)
+        self.tree_view.setSortingEnabled(True)
+        self.tree_view.header().setSortIndicator(-1, Qt.AscendingOrder)
 
         # Configure column sizes
         header = self.tree_view.header()
@@ -88,21 +387,8 @@ class SearchListWidget(QWidget):
         Args:
             paths (list[str]): List of file or folder paths.
         """
-        self.model.removeRows(0, self.model.rowCount())  # Clear existing items
-
-        for path in paths:
-            if os.path.exists(path):
-                self.add_item(path)
-            else:
-                # Handle invalid paths
-                name_item = QStandardItem(os.path.basename(path))
-                name_item.setForeground(Qt.red)
-                date_item = QStandardItem("N/A")
-                type_item = QStandardItem("Invalid Path")
-                size_item = QStandardItem("N/A")
-                for item in [name_item, date_item, type_item, size_item]:
-                    item.setEditable(False)
-                self.model.appendRow([name_item, date_item, type_item, size_item])
+        self.clear()
+        self.add_records([SearchRecord.from_path(path) for path in paths])
 
     def add_item(self, path: str) -> None:
         """
@@ -111,34 +397,17 @@ class SearchListWidget(QWidget):
         Args:
             path (str): Path of the file or folder.
         """
-        name = os.path.basename(path)
-        name_item = QStandardItem(name)
-        name_item.setData(path, Qt.UserRole)  # Store file path as data
-
-        last_modified = datetime.fromtimestamp(os.path.getmtime(path)).strftime("%Y-%m-%d %H:%M")
-        date_item = QStandardItem(last_modified)
-
-        icon_provider = QFileIconProvider()
-        file_info = QFileInfo(path)
-        icon = icon_provider.icon(file_info)
-
-        if os.path.isdir(path):
-            type_str = "Folder"
-            size_str = "-"
-        else:
-            ext = os.path.splitext(path)[1][1:].upper()
-            type_str = f"{ext} File" if ext else "File"
-            size_str = self.human_readable_size(os.path.getsize(path))
+        self.model.add_records([SearchRecord.from_path(path)])
 
-        type_item = QStandardItem(type_str)
-        size_item = QStandardItem(size_str)
-
-        name_item.setIcon(icon)
-
-        for item in [name_item, date_item, type_item, size_item]:
-            item.setEditable(False)
+    def add_records(self, records: list[SearchRecord]) -> None:
+        """
+        Append a batch of search results. File details were already read by the search worker,
+        and rows are only formatted when they become visible.
 
-        self.model.appendRow([name_item, date_item, type_item, size_item])
+        Args:
+            records (list[SearchRecord]): Results to add.
+        """
+        self.model.add_records(records)
 
     def on_item_clicked(self, index) -> None:
         """
@@ -147,18 +416,12 @@ class SearchListWidget(QWidget):
         Args:
             index: Index of the clicked item.
         """
-        index = index.sibling(index.row(), 0)
-        item = self.model.itemFromIndex(index)
-        if item:
-            file_path = item.data(Qt.UserRole)
-            self.show_file_info(file_path)
+        if index.isValid():
+            self.show_file_info(self.model.path(index.row()))
 
     def on_item_double_clicked(self, index) -> None:
-        index = index.sibling(index.row(), 0)
-        item = self.model.itemFromIndex(index)
-        if item:
-            file_path = item.data(Qt.UserRole)
-            self.execute_file(file_path)
+        if index.isValid():
+            self.execute_file(self.model.path(index.row()))
 
     def execute_file(self, file_path: str) -> None:
         if os.path.exists(file_path):
@@ -229,5 +492,4 @@ class SearchListWidget(QWidget):
 
     def clear(self) -> None:
         """Clear the tree view model."""
-        self.tree_view.model().clear()
-        self.tree_view.model().setHorizontalHeaderLabels(["Name", "Date Modified", "Type", "Size"])
\ No newline at end of file
+        self.model.clear()
\ No newline at end of file
@@ -0,0 +1,202 @@
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QProgressBar, QPushButton, QComboBox,
+    QTreeWidget, QTreeWidgetItem, QHeaderView, QDialogButtonBox, QMessageBox
+)
+from PyQt5.QtCore import Qt, pyqtSignal
+from utils.transfer import TransferThread, CONFLICT_OVERWRITE, CONFLICT_SKIP, CONFLICT_RENAME
+import os
+
+CONFLICT_CHOICES = [
+    (CONFLICT_OVERWRITE, "덮어쓰기"),
+    (CONFLICT_SKIP, "건너뛰기"),
+    (CONFLICT_RENAME, "둘 다 유지"),
+]
+
+def format_bytes(size: float) -> str:
+    """바이트 수를 읽기 쉬운 단위로 변환합니다."""
+    for unit in ["B", "KB", "MB", "GB"]:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+def format_eta(seconds) -> str:
+    """남은 시간을 시:분:초 형식으로 변환합니다."""
+    if seconds is None:
+        return "계산 중"
+    seconds = int(seconds)
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+class ConflictDialog(QDialog):
+    """붙여넣기 전에 이름이 겹치는 항목의 처리 방식을 한 번에 선택하는 창"""
+    def __init__(self, conflicts: list[str], target_dir: str, parent=None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Overwrite Confirmation")
+        self.resize(560, 360)
+        self.conflicts = conflicts
+
+        label = QLabel(f"대상 폴더에 같은 이름의 항목이 {len(conflicts)}개 있습니다.\n{target_dir}")
+
+        # 모든 항목에 같은 처리 방식 적용
+        self.all_combo = QComboBox()
+        for _, text in CONFLICT_CHOICES:
+            self.all_combo.addItem(text)
+        self.all_combo.setCurrentIndex(1)
+        self.all_combo.currentIndexChanged.connect(self.apply_to_all)
+        all_layout = QHBoxLayout()
+        all_layout.addWidget(QLabel("모두 적용:"))
+        all_layout.addWidget(self.all_combo)
+        all_layout.addStretch()
+
+        self.tree = QTreeWidget()
+        self.tree.setHeaderLabels(["이름", "처리 방식"])
+        self.tree.setRootIsDecorated(False)
+        self.tree.header().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.combos = []
+        for source in conflicts:
+            row = QTreeWidgetItem([os.path.basename(source), ""])
+            row.setToolTip(0, source)
+            self.tree.addTopLevelItem(row)
+            combo = QComboBox()
+            for _, text in CONFLICT_CHOICES:
+                combo.addItem(text)
+            combo.setCurrentIndex(1)
+            self.tree.setItemWidget(row, 1, combo)
+            self.combos.append(combo)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.button(QDialogButtonBox.Ok).setText("확인")
+        buttons.button(QDialogButtonBox.Cancel).setText("취소")
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(label)
+        layout.addLayout(all_layout)
+        layout.addWidget(self.tree)
+        layout.addWidget(buttons)
+
+    def apply_to_all(self, index: int) -> None:
+        """모든 항목의 처리 방식을 변경합니다."""
+        for combo in self.combos:
+            combo.setCurrentIndex(index)
+
+    def resolutions(self) -> dict:
+        """원본 경로 -> 처리 방식(CONFLICT_*) 목록을 반환합니다."""
+        return {
+            source: CONFLICT_CHOICES[combo.currentIndex()][0]
+            for source, combo in zip(self.conflicts, self.combos)
+        }
+
+class TransferDialog(QDialog):
+    """복사/이동 진행 상황(바이트, 파일 수, 속도, 남은 시간)을 표시하고 취소·재개를 지원하는 창"""
+    completed = pyqtSignal(object)  # 작업이 끝났을 때 TransferJob 전달
+
+    def __init__(self, job, parent=None) -> None:
+        super().__init__(parent)
+        self.job = job
+        self.thread = None
+        self.paused = False  # 취소 후 재개를 기다리는 상태
+        action = "이동" if job.operation == "move" else "복사"
+        self.setWindowTitle(f"{action} 중")
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self.resize(480, 160)
+
+        self.status_label = QLabel(f"{action}할 항목을 확인하는 중...")
+        self.current_label = QLabel("")
+        self.current_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 0)
+        self.detail_label = QLabel("")
+
+        self.cancel_button = QPushButton("취소")
+        self.cancel_button.clicked.connect(self.cancel)
+        self.resume_button = QPushButton("재개")
+        self.resume_button.clicked.connect(self.start)
+        self.resume_button.hide()
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        button_layout.addWidget(self.resume_button)
+        button_layout.addWidget(self.cancel_button)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.status_label)
+        layout.addWidget(self.current_label)
+        layout.addWidget(self.progress_bar)
+        layout.addWidget(self.detail_label)
+        layout.addLayout(button_layout)
+
+    def start(self) -> None:
+        """작업을 시작하거나, 취소된 작업을 이어서 진행합니다."""
+        self.thread = TransferThread(self.job)
+        self.thread.progress.connect(self.update_progress)
+        self.thread.finished.connect(self.on_finished)
+        self.thread.cancelled.connect(self.on_cancelled)
+        self.thread.error.connect(self.on_error)
+        self.paused = False
+        self.resume_button.hide()
+        self.cancel_button.setText("취소")
+        self.cancel_button.setEnabled(True)
+        self.thread.start()
+        self.show()
+
+    def update_progress(self, progress) -> None:
+        """진행 상황을 업데이트합니다."""
+        total = max(progress.bytes_total, 1)
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setValue(int(progress.bytes_done * 1000 / total))
+        self.status_label.setText(f"파일 {progress.files_done}/{progress.files_total}")
+        self.current_label.setText(os.path.basename(progress.current))
+        self.detail_label.setText(
+            f"{format_bytes(progress.bytes_done)} / {format_bytes(progress.bytes_total)}   "
+            f"{format_bytes(progress.speed)}/s   남은 시간 {format_eta(progress.eta)}"
+        )
+
+    def cancel(self) -> None:
+        """진행 중이면 취소하고, 멈춘 상태면 창을 닫습니다."""
+        if self.thread and self.thread.isRunning():
+            self.thread.cancel()
+            self.cancel_button.setEnabled(False)
+        else:
+            self.close()
+
+    def _thread_done(self) -> None:
+        self.thread.wait()
+        self.thread.deleteLater()
+        self.thread = None
+
+    def on_finished(self, job) -> None:
+        """작업이 끝났을 때 호출됩니다."""
+        self._thread_done()
+        self.completed.emit(job)
+        self.close()
+
+    def on_cancelled(self) -> None:
+        """작업이 취소되었을 때 호출됩니다. (재개 가능)"""
+        self._thread_done()
+        self.paused = True
+        self.status_label.setText("작업이 중단되었습니다. 재개하면 중단한 지점부터 이어서 진행합니다.")
+        self.resume_button.show()
+        self.cancel_button.setText("닫기")
+        self.cancel_button.setEnabled(True)
+
+    def on_error(self, error_message: str) -> None:
+        """작업 중 오류가 발생했을 때 호출됩니다."""
+        self._thread_done()
+        QMessageBox.critical(self, "Paste Error", error_message)
+        self.close()
+
+    def closeEvent(self, event) -> None:
+        """진행 중에는 창을 닫지 않고 취소만 요청합니다. 중단된 작업을 닫으면 덮어쓰던 항목을 되돌립니다."""
+        if self.thread and self.thread.isRunning():
+            self.thread.cancel()
+            event.ignore()
+            return
+        if self.paused:
+            self.paused = False
+            try:
+                self.job.abandon()
+            except OSError as e:
+                QMessageBox.warning(self, "Paste Error", f"중단된 작업을 정리하지 못했습니다:\n{e}")
+        super().closeEvent(event)
@@ -162,6 +162,14 @@ class MainWindow(QMainWindow):
         result_items = self.file_explorer_bar.file_area.search_result_list
         result_items.add_item(path)
 
+    def search_result_addRecords(self, records: list) -> None:
+        """Queue a batch of search results for display.
+
+        Args:
+            records (list): SearchRecord objects produced by the search worker.
+        """
+        self.file_explorer_bar.file_area.search_result_list.add_records(records)
+
     def clear_search_result(self) -> None:
         """Clear all search results."""
         self.file_explorer_bar.file_area.search_result_list.clear()
@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC)
+
+from utils.mapping_store import JsonMappingStore, SqliteMappingStore  # noqa: E402
+
+FINISHED = 50  # 종료 전에 기록을 마친 항목 수
+
+# 배치 중간에 프로세스가 강제 종료되는 상황 (종료 처리 없이 바로 끝냄)
+KILL_SCRIPT = textwrap.dedent("""
+    import os, sys
+    sys.path.insert(0, {src!r})
+    from utils.mapping_store import {store}
+    store = {store}({path!r})
+    store.begin_batch()
+    for i in range({count}):
+        store.put(str(i), {{"original_path": "/data/file%d" % i, "secure_path": "file%d" % i}})
+    os._exit(9)
+""")
+
+
+@pytest.mark.parametrize("store_class, filename", [
+    (SqliteMappingStore, "meta.db"),
+    (JsonMappingStore, "meta.json"),
+])
+def test_rows_written_before_kill_survive(tmp_path, store_class, filename):
+    path = str(tmp_path / filename)
+    script = KILL_SCRIPT.format(src=SRC, store=store_class.__name__, path=path, count=FINISHED)
+    result = subprocess.run([sys.executable, "-c", script])
+    assert result.returncode == 9
+
+    store = store_class(path)
+    try:
+        for i in range(FINISHED):
+            assert store.get(str(i)) == {"original_path": f"/data/file{i}", "secure_path": f"file{i}"}
+            assert store.find_by_secure_path(f"file{i}") == str(i)
+    finally:
+        store.close()